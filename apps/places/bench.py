@@ -0,0 +1,220 @@
+"""
+추천 그래프 오프라인 벤치마크 (bench_recommend 명령에서 사용).
+
+LLM/임베딩은 결정적인 스텁으로 바꾸고(네트워크 없음), 검색(DB/FAISS)과 프롬프트 조립/파싱,
+장소 매칭은 실제 코드를 그대로 돌려 단계별 지연/쿼리 수와 recall@k 를 잰다.
+recall 은 픽스처에 실제 임베딩이 있는 항목만 계산한다 (해시 임베딩이면 검색 결과가 의미 없어 None).
+
+픽스처(JSON 리스트) 항목:
+    {"prompt": "...",
+     "slots": {"지역": "...", "감정": "...", "활동": "..."},   # 선택: 추출 스텁 응답
+     "expected": ["장소명", ...],                               # 선택: recall 계산용 정답
+     "embedding": [...]}                                        # 선택: 실제 임베딩 (SEMANTIC_CACHE_LOG 에서 가져오면 됨)
+"""
+import hashlib
+import json
+import random
+import re
+import statistics
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+EMBED_DIM = 1024
+_SPOT_LINE = re.compile(r"^- (.+?) \(")
+
+
+def hash_embedding(text, dim=EMBED_DIM):
+    """텍스트별로 항상 같은 단위 벡터"""
+    rng = random.Random(int(hashlib.md5(text.encode("utf-8")).hexdigest()[:8], 16))
+    vec = [rng.gauss(0, 1) for _ in range(dim)]
+    norm = sum(v * v for v in vec) ** 0.5 or 1.0
+    return [v / norm for v in vec]
+
+
+class StubTimer:
+    """스텁 호출 시간 누적 (단계 시간에서 LLM/임베딩 몫을 분리하기 위해)"""
+
+    def __init__(self):
+        self.ms = {}
+
+    def add(self, name, ms):
+        self.ms[name] = self.ms.get(name, 0.0) + ms
+
+    def pop(self, name):
+        return self.ms.pop(name, 0.0)
+
+
+class StubChain:
+    def __init__(self, kind, fixtures, latency_ms, timer):
+        self.kind = kind
+        self.fixtures = fixtures
+        self.latency_ms = latency_ms
+        self.timer = timer
+
+    def invoke(self, inputs):
+        t0 = time.perf_counter()
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        if self.kind == "extraction":
+            content = self._extract(inputs["input"])
+        else:
+            content = self._recommend(inputs["trip_spot_list"])
+        self.timer.add(f"llm.{self.kind}", (time.perf_counter() - t0) * 1000)
+        return SimpleNamespace(content=content)
+
+    def _extract(self, text):
+        slots = (self.fixtures.get(text) or {}).get("slots") or {"지역": "서울", "감정": "힐링", "활동": "산책"}
+        return json.dumps({**slots, "보충 질문": ""}, ensure_ascii=False)
+
+    @staticmethod
+    def _recommend(trip_spot_list):
+        return stub_recommendation_text(trip_spot_list)
+
+
+def stub_recommendation_text(trip_spot_list):
+    """후보 리스트 앞에서 6곳을 실제 추천 응답 형식으로 (목 서버에서도 사용)"""
+    names = []
+    for line in trip_spot_list.splitlines():
+        m = _SPOT_LINE.match(line.strip())
+        if m and m.group(1) not in names:
+            names.append(m.group(1))
+    out = []
+    for i, name in enumerate(names[:6], 1):
+        out += [f"{i}. **[{name}]**", "- 이유: 스텁 응답입니다. 조건과 잘 맞습니다.", "- 구체적인 팁: 오전 방문."]
+    return "\n".join(out)
+
+
+@contextmanager
+def stub_backends(fixtures, llm_latency_ms=0, embed_latency_ms=0):
+    """recommend 모듈의 LLM 체인/임베딩을 스텁으로 교체하고 의미 캐시를 끈다"""
+    import recommend
+    from apps.places import semantic_cache
+
+    timer = StubTimer()
+    chains = (StubChain("extraction", fixtures, llm_latency_ms, timer),
+              StubChain("recommendation", fixtures, llm_latency_ms, timer))
+
+    def embed(text, api_key=None):
+        t0 = time.perf_counter()
+        if embed_latency_ms:
+            time.sleep(embed_latency_ms / 1000)
+        vec = (fixtures.get(text) or {}).get("embedding") or hash_embedding(text)
+        timer.add("embed", (time.perf_counter() - t0) * 1000)
+        return vec
+
+    saved = (recommend.get_chains, recommend.get_clova_embedding, semantic_cache.lookup, semantic_cache.store)
+    recommend.get_chains = lambda: chains
+    recommend.get_clova_embedding = embed
+    semantic_cache.lookup = lambda *a, **kw: None
+    semantic_cache.store = lambda *a, **kw: None
+    try:
+        yield timer
+    finally:
+        (recommend.get_chains, recommend.get_clova_embedding,
+         semantic_cache.lookup, semantic_cache.store) = saved
+
+
+def _recall(expected, got, k):
+    if not expected:
+        return None
+    top = set(got[:k])
+    return sum(1 for e in expected if e in top) / len(expected)
+
+
+def run_prompt(item, timer, k=10):
+    """프롬프트 1개를 단계별로 순차 실행 (단계별 쿼리 수를 정확히 세기 위해 그래프 대신 직접 호출)"""
+    import recommend
+    from apps.places.views import find_places_by_names, parse_recommendations
+
+    stages, queries = {}, {}
+    state = {"user_input": item["prompt"]}
+
+    def run(name, fn):
+        with CaptureQueriesContext(connection) as ctx:
+            t0 = time.perf_counter()
+            out = fn()
+            stages[name] = (time.perf_counter() - t0) * 1000
+        queries[name] = len(ctx.captured_queries)
+        return out
+
+    state.update(run("extract", lambda: recommend.extract_info(state)))
+    state.update(run("retrieve", lambda: recommend.retrieve_candidates(state)))
+    stages["embed"] = timer.pop("embed")
+    stages["retrieve"] -= stages["embed"]
+    if state.get("검색_오류"):
+        raise RuntimeError(state["검색_오류"])
+
+    result = run("recommend", lambda: recommend.recommend_places(state))
+    stages["llm"] = timer.pop("llm.recommendation")
+    stages["prompt+parse"] = stages.pop("recommend") - stages["llm"]
+    timer.pop("llm.extraction")  # extract 단계 시간에 이미 포함
+
+    def resolve():
+        names = [r["name"] for r in parse_recommendations(result["recommendations"]) if r.get("name")]
+        return list(find_places_by_names(names))
+
+    places = run("db_resolve", resolve)
+
+    candidates = [r["명칭"] for r in state.get("후보", [])]
+    # 해시 임베딩이면 후보가 질문과 무관하므로 recall 을 재지 않음
+    real_embedding = bool(item.get("embedding"))
+    expected = (item.get("expected") or []) if real_embedding else []
+    return {
+        "prompt": item["prompt"],
+        "backend": state.get("검색_백엔드"),
+        "embedding": "fixture" if real_embedding else "hash",
+        "stages_ms": {k_: round(v, 2) for k_, v in stages.items()},
+        "queries": queries,
+        "recall_at_k": _recall(expected, candidates, k),
+        "final_recall": _recall(expected, [p.name for p in places], len(places) or 1),
+        "candidates": candidates,
+        "resolved": [p.name for p in places],
+    }
+
+
+def percentile(values, q):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    idx = min(len(values) - 1, max(0, round(q * (len(values) - 1))))
+    return values[idx]
+
+
+def summarize(results, k):
+    stage_names = sorted({s for r in results for s in r["stages_ms"]})
+    stages = {}
+    for s in stage_names:
+        vals = [r["stages_ms"].get(s, 0.0) for r in results]
+        stages[s] = {
+            "mean": round(statistics.fmean(vals), 2),
+            "p50": round(percentile(vals, 0.5), 2),
+            "p95": round(percentile(vals, 0.95), 2),
+        }
+    queries = {s: sum(r["queries"].get(s, 0) for r in results) for s in sorted({q for r in results for q in r["queries"]})}
+    recalls = [r["recall_at_k"] for r in results if r["recall_at_k"] is not None]
+    finals = [r["final_recall"] for r in results if r["final_recall"] is not None]
+    backends = {}
+    for r in results:
+        backends[r["backend"]] = backends.get(r["backend"], 0) + 1
+    hashed = sum(1 for r in results if r.get("embedding") == "hash")
+    return {
+        "prompts": len(results),
+        "stages_ms": stages,
+        "queries_total": queries,
+        f"recall@{k}": round(statistics.fmean(recalls), 4) if recalls else None,
+        "final_recall": round(statistics.fmean(finals), 4) if finals else None,
+        "backends": backends,
+        "hash_embedding_prompts": hashed,  # recall 에서 제외된 프롬프트 수
+    }
+
+
+def run_graph(item):
+    """그래프 전체(병렬 브랜치 포함) 종단 지연"""
+    import recommend
+    t0 = time.perf_counter()
+    recommend.get_app().invoke({"user_input": item["prompt"]})
+    return (time.perf_counter() - t0) * 1000
@@ -0,0 +1,113 @@
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from apps.tags.models import Tag
+
+LIST_VERSION_KEY = "places:list:version"
+
+_PROCESS_LOCAL_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def is_shared_cache(alias="default") -> bool:
+    """다른 프로세스(gunicorn 워커, 관리 명령)와 공유되는 캐시 백엔드인지"""
+    return settings.CACHES[alias]["BACKEND"] not in _PROCESS_LOCAL_BACKENDS
+
+
+def get_list_version() -> int:
+    """장소 목록 캐시 버전 (장소 적재/요약·태그 변경 시 증가)"""
+    version = cache.get(LIST_VERSION_KEY)
+    if version is None:
+        cache.add(LIST_VERSION_KEY, 1, None)
+        version = cache.get(LIST_VERSION_KEY, 1)
+    return version
+
+
+def bump_list_version():
+    """버전을 올려 이전 목록 캐시를 한 번에 무효화 (공유 캐시여야 다른 프로세스에서 올린 것도 반영됨)"""
+    try:
+        cache.incr(LIST_VERSION_KEY)
+    except ValueError:
+        cache.set(LIST_VERSION_KEY, 2, None)
+
+
+def _normalized_list_params(request):
+    """목록 결과에 영향을 주는 파라미터만 정규화 (순서/중복/표기 차이 제거)"""
+    tags = []
+    for raw in request.GET.getlist('tags'):
+        tags += [t.strip() for t in raw.split(',') if t.strip()]
+    tags = sorted(set(tags))
+
+    place_class = request.GET.get('place_class', '').strip()
+    page = request.GET.get('page', '').strip()
+    return [
+        ('q', request.GET.get('q', '').strip()),
+        ('place_class', place_class if place_class.isdigit() else ''),
+        ('tags', ','.join(tags)),
+        ('match', (request.GET.get('match') or 'any').lower() if tags else ''),
+        ('is_unique', '1' if request.GET.get('is_unique') == '1' else ''),
+        ('page', page if page.isdigit() else '1'),
+        ('cursor', request.GET.get('cursor', '').strip()),
+    ]
+
+
+def list_cache_key(view_name, request):
+    raw = "&".join(f"{k}={v}" for k, v in _normalized_list_params(request))
+    digest = hashlib.md5(raw.encode("utf-8")).hexdigest()
+    return f"places:list:{view_name}:v{get_list_version()}:{digest}"
+
+
+def cached_list_count(view_name, request, qs):
+    """필터 조건별 전체 개수 (근사치: 목록 버전/TTL 동안 재사용, 페이지와 무관)"""
+    raw = "&".join(f"{k}={v}" for k, v in _normalized_list_params(request) if k not in ('page', 'cursor'))
+    digest = hashlib.md5(raw.encode("utf-8")).hexdigest()
+    key = f"places:count:{view_name}:v{get_list_version()}:{digest}"
+    count = cache.get(key)
+    if count is None:
+        count = qs.order_by().count()
+        cache.set(key, count, getattr(settings, "PLACE_LIST_COUNT_TTL", 600))
+    return count
+
+
+def cache_anonymous_list(view_name):
+    """
+    비로그인 GET 요청의 목록 응답을 캐시하는 데코레이터.
+    로그인 사용자는 찜 여부가 달라 캐시하지 않고, 추천(prompt) 요청도 캐시하지 않음.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if (request.method != 'GET' or request.user.is_authenticated
+                    or request.GET.get('prompt') or request.GET.get('followup')):
+                return view(request, *args, **kwargs)
+
+            key = list_cache_key(view_name, request)
+            cached = cache.get(key)
+            if cached is not None:
+                content, content_type = cached
+                return HttpResponse(content, content_type=content_type)
+
+            response = view(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming:
+                cache.set(key, (response.content, response['Content-Type']),
+                          getattr(settings, "PLACE_LIST_CACHE_TTL", 300))
+            return response
+        return wrapper
+    return decorator
+
+
+def cached_filter_tags():
+    """필터 바에 쓰는 전체 태그 목록 (이름순)"""
+    key = f"places:filter_tags:v{get_list_version()}"
+    tags = cache.get(key)
+    if tags is None:
+        tags = list(Tag.objects.order_by('name'))
+        cache.set(key, tags, getattr(settings, "PLACE_LIST_CACHE_TTL", 300))
+    return tags
+
@@ -0,0 +1,44 @@
+"""
+추천 프롬프트용 장소 설명자(prompt_desc, tag_names) 미리 계산.
+
+검색 때마다 overview 전문을 읽고 태그를 prefetch 하는 대신,
+장소 적재/리뷰 처리 시점에 토큰 예산에 맞춘 짧은 설명과 태그 문자열을 컬럼에 저장해 둔다.
+search_top_k_from_db 는 values_list 한 번으로 바로 쓸 수 있는 값을 가져간다.
+"""
+from .models import Place
+from .prompt_budget import ITEM_MAX_TOKENS, truncate_to_tokens
+
+TAG_SEP = ","
+
+
+def build_descriptor(overview, tag_names):
+    """(prompt_desc, tag_names 문자열)"""
+    desc = truncate_to_tokens(overview or "", ITEM_MAX_TOKENS)
+    joined = TAG_SEP.join(sorted({t.strip() for t in tag_names if t and t.strip()}))
+    return desc, joined[:500]
+
+
+def split_tag_names(value):
+    return [t for t in (value or "").split(TAG_SEP) if t]
+
+
+def refresh_place_descriptors(place_ids=None, batch_size=500):
+    """place_ids 가 None 이면 전체. 변경된 행만 bulk_update, 갱신 건수 반환"""
+    qs = Place.objects.prefetch_related('tags').only('id', 'overview', 'prompt_desc', 'tag_names')
+    if place_ids is not None:
+        qs = qs.filter(pk__in=list(place_ids))
+
+    updated, batch = 0, []
+    for place in qs.iterator(chunk_size=batch_size):
+        desc, tags = build_descriptor(place.overview, [t.name for t in place.tags.all()])
+        if desc != place.prompt_desc or tags != place.tag_names:
+            place.prompt_desc, place.tag_names = desc, tags
+            batch.append(place)
+        if len(batch) >= batch_size:
+            Place.objects.bulk_update(batch, ['prompt_desc', 'tag_names'])
+            updated += len(batch)
+            batch = []
+    if batch:
+        Place.objects.bulk_update(batch, ['prompt_desc', 'tag_names'])
+        updated += len(batch)
+    return updated
@@ -0,0 +1,122 @@
+"""
+공용 LLM 클라이언트/프롬프트 레지스트리.
+
+- chat_model(model, temperature): ChatClovaX 를 (모델, temperature) 별로 프로세스당 1개만 만들어 재사용
+  (HTTP 커넥션 풀 재사용, fork 이후 워커는 pid 가 바뀌므로 새로 생성)
+- prompt(template): PromptTemplate 를 템플릿 문자열별로 1개 (상태 없음 → fork 후에도 공유)
+- openai_client(): OpenAI 임베딩 클라이언트 (프로세스당 1개)
+호출마다 llm.<모델>@<temperature>.* 메트릭(호출/오류/토큰 수, 지연시간)을 남긴다.
+API 키는 .env 에서 처음 한 번만 os.environ 으로 옮긴다 (호출마다 환경 변수를 건드리지 않음).
+"""
+import os
+import threading
+import time
+
+from decouple import config
+
+from . import metrics
+from .llm_endpoints import clova_chat_kwargs, openai_client_kwargs
+
+_lock = threading.Lock()
+_chat_models = {}  # (model, temperature) -> (pid, client)
+_prompts = {}      # template -> PromptTemplate
+_openai = None     # (pid, client)
+
+
+def _export_key(name):
+    if not os.environ.get(name):
+        value = config(name, default=None)
+        if value:
+            os.environ[name] = value
+    return os.environ.get(name)
+
+
+def has_clova_key():
+    return bool(_export_key("CLOVASTUDIO_API_KEY"))
+
+
+def _metrics_callback(name):
+    """LangChain 콜백: 호출 시작~끝 지연시간, 토큰 사용량 기록"""
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class _Recorder(BaseCallbackHandler):
+        def __init__(self):
+            self._started = {}
+
+        def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+            self._started[run_id] = time.perf_counter()
+
+        def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+            self._started[run_id] = time.perf_counter()
+
+        def _elapsed(self, run_id):
+            started = self._started.pop(run_id, None)
+            if started is not None:
+                metrics.observe(name, (time.perf_counter() - started) * 1000)
+
+        def on_llm_end(self, response, *, run_id, **kwargs):
+            self._elapsed(run_id)
+            metrics.incr(f"{name}.calls")
+            usage = (response.llm_output or {}).get("token_usage") or {}
+            if not usage:
+                try:
+                    meta = response.generations[0][0].message.usage_metadata or {}
+                    usage = {"prompt_tokens": meta.get("input_tokens", 0),
+                             "completion_tokens": meta.get("output_tokens", 0)}
+                except (AttributeError, IndexError):
+                    usage = {}
+            for key in ("prompt_tokens", "completion_tokens"):
+                if usage.get(key):
+                    metrics.incr(f"{name}.{key}", usage[key])
+
+        def on_llm_error(self, error, *, run_id, **kwargs):
+            self._elapsed(run_id)
+            metrics.incr(f"{name}.errors")
+
+    return _Recorder()
+
+
+def chat_model(model="HCX-005", temperature=0):
+    key = (model, temperature)
+    pid = os.getpid()
+    entry = _chat_models.get(key)
+    if entry is None or entry[0] != pid:
+        with _lock:
+            entry = _chat_models.get(key)
+            if entry is None or entry[0] != pid:
+                from langchain_naver import ChatClovaX
+                _export_key("CLOVASTUDIO_API_KEY")
+                client = ChatClovaX(
+                    model=model,
+                    temperature=temperature,
+                    callbacks=[_metrics_callback(f"llm.{model}@{temperature}")],
+                    **clova_chat_kwargs(),
+                )
+                entry = _chat_models[key] = (pid, client)
+    return entry[1]
+
+
+def prompt(template):
+    p = _prompts.get(template)
+    if p is None:
+        with _lock:
+            p = _prompts.get(template)
+            if p is None:
+                from langchain_core.prompts import PromptTemplate
+                p = _prompts[template] = PromptTemplate.from_template(template)
+    return p
+
+
+def openai_client():
+    """OPENAI_API_KEY 가 없으면 None"""
+    global _openai
+    pid = os.getpid()
+    if _openai is None or _openai[0] != pid:
+        with _lock:
+            if _openai is None or _openai[0] != pid:
+                api_key = _export_key("OPENAI_API_KEY")
+                if not api_key:
+                    return None
+                from openai import OpenAI
+                _openai = (pid, OpenAI(api_key=api_key, **openai_client_kwargs()))
+    return _openai[1]
@@ -0,0 +1,30 @@
+"""
+외부 LLM/임베딩 엔드포인트 주소.
+
+LLM_MOCK_URL (예: http://127.0.0.1:8765) 을 지정하면 CLOVA 임베딩, ChatClovaX, OpenAI 임베딩이
+모두 로컬 목 서버(python manage.py mock_llm_server)로 향한다. 키가 없어도 동작하도록 더미 키를 채운다.
+Django에 의존하지 않는다.
+"""
+import os
+
+CLOVA_BASE = "https://clovastudio.stream.ntruss.com"
+MOCK_URL = os.getenv("LLM_MOCK_URL", "").rstrip("/")
+
+if MOCK_URL:
+    os.environ.setdefault("CLOVASTUDIO_API_KEY", "mock-key")
+    os.environ.setdefault("OPENAI_API_KEY", "mock-key")
+    print(f"[llm] 목 서버 사용: {MOCK_URL}")
+
+
+def clova_embedding_url():
+    return f"{MOCK_URL or CLOVA_BASE}/v1/api-tools/embedding/v2"
+
+
+def clova_chat_kwargs():
+    """ChatClovaX(...) 에 추가로 넘길 인자"""
+    return {"base_url": f"{MOCK_URL}/v1/openai"} if MOCK_URL else {}
+
+
+def openai_client_kwargs():
+    """OpenAI(...) 에 추가로 넘길 인자"""
+    return {"base_url": f"{MOCK_URL}/v1"} if MOCK_URL else {}
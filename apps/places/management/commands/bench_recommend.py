@@ -0,0 +1,86 @@
+import json
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.places import bench
+
+DEFAULT_FIXTURE = os.path.join(os.path.dirname(bench.__file__), "bench_prompts.json")
+
+
+class Command(BaseCommand):
+    help = "스텁 LLM/임베딩으로 추천 그래프 단계별 지연, 쿼리 수, recall@k 측정 (오프라인, 결정적)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--fixture", default=DEFAULT_FIXTURE, help="프롬프트 픽스처 JSON")
+        parser.add_argument("--k", type=int, default=10, help="recall@k 의 k (검색 후보 수)")
+        parser.add_argument("--repeat", type=int, default=1, help="프롬프트별 반복 횟수")
+        parser.add_argument("--llm-latency-ms", type=float, default=0, help="스텁 LLM 호출당 지연")
+        parser.add_argument("--embed-latency-ms", type=float, default=0, help="스텁 임베딩 호출당 지연")
+        parser.add_argument("--graph", action="store_true", help="그래프 전체(병렬 실행) 종단 지연도 측정")
+        parser.add_argument("--output", help="결과 JSON 저장 경로 (실행 간 비교용)")
+
+    def handle(self, *args, **opts):
+        try:
+            with open(opts["fixture"], encoding="utf-8") as f:
+                items = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"픽스처를 읽을 수 없습니다: {e}")
+        fixtures = {it["prompt"]: it for it in items}
+
+        results, graph_ms = [], []
+        with bench.stub_backends(fixtures, opts["llm_latency_ms"], opts["embed_latency_ms"]) as timer:
+            for _ in range(opts["repeat"]):
+                for it in items:
+                    try:
+                        results.append(bench.run_prompt(it, timer, k=opts["k"]))
+                    except Exception as e:
+                        self.stderr.write(f"❌ '{it['prompt']}' 실패: {e}")
+                    if opts["graph"]:
+                        graph_ms.append(bench.run_graph(it))
+        if not results:
+            raise CommandError("성공한 프롬프트가 없습니다.")
+
+        summary = bench.summarize(results, opts["k"])
+        if graph_ms:
+            summary["graph_ms"] = {
+                "mean": round(sum(graph_ms) / len(graph_ms), 2),
+                "p95": round(bench.percentile(graph_ms, 0.95), 2),
+            }
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"프롬프트 {summary['prompts']}건"))
+        for stage, s in summary["stages_ms"].items():
+            q = summary["queries_total"].get(stage)
+            qs = f"  쿼리 {q}" if q is not None else ""
+            self.stdout.write(f"  {stage:<14} mean {s['mean']:>8.2f}ms  p50 {s['p50']:>8.2f}  p95 {s['p95']:>8.2f}{qs}")
+        if "graph_ms" in summary:
+            self.stdout.write(f"  {'graph':<14} mean {summary['graph_ms']['mean']:>8.2f}ms  p95 {summary['graph_ms']['p95']:>8.2f}")
+        recall_key = f"recall@{opts['k']}"
+
+        def fmt(v):
+            return "n/a" if v is None else v
+
+        self.stdout.write(f"  {recall_key}: {fmt(summary[recall_key])}  최종 recall: {fmt(summary['final_recall'])}")
+        if summary["hash_embedding_prompts"]:
+            self.stdout.write(self.style.WARNING(
+                f"  ⚠️ 픽스처에 embedding 이 없는 {summary['hash_embedding_prompts']}건은 해시 임베딩이라 recall 에서 제외 "
+                "(SEMANTIC_CACHE_LOG 로 실제 임베딩을 모아 픽스처에 넣으세요)"
+            ))
+        self.stdout.write(f"  검색 백엔드: {summary['backends']}")
+
+        if opts.get("output"):
+            report = {
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "config": {k: opts[k] for k in ("fixture", "k", "repeat", "llm_latency_ms", "embed_latency_ms")},
+                "summary": summary,
+                "prompts": results,
+            }
+            with open(opts["output"], "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2, sort_keys=True)
+            self.stdout.write(f"💾 결과가 {opts['output']}에 저장되었습니다.")
+
+
+# 사용 예시:
+# python manage.py bench_recommend --output bench_before.json
+# python manage.py bench_recommend --llm-latency-ms 800 --embed-latency-ms 150 --graph
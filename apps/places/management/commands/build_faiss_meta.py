@@ -0,0 +1,34 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.places.meta_store import PlaceMetaStore, build_from_csv
+
+
+class Command(BaseCommand):
+    help = "FAISS 폴백용 메타데이터 CSV → 컬럼형 바이너리(mmap) 파일 생성"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--csv", default=os.getenv("FAISS_META_PATH", "triptailor_full_metadata.csv"),
+                            help="원본 CSV 경로 (FAISS 인덱스와 행 순서가 같아야 함)")
+        parser.add_argument("--output", default=os.getenv("FAISS_META_BIN_PATH", "triptailor_full_metadata.bin"),
+                            help="생성할 바이너리 파일 경로")
+
+    def handle(self, *args, **opts):
+        csv_path, out_path = opts["csv"], opts["output"]
+        if not os.path.exists(csv_path):
+            raise CommandError(f"CSV 파일이 없습니다: {csv_path}")
+
+        data = build_from_csv(csv_path)
+
+        # 임시 파일에 쓰고 교체 → 실행 중인 워커의 기존 mmap은 이전 파일을 그대로 봄
+        tmp_path = f"{out_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, out_path)
+
+        store = PlaceMetaStore.open(out_path)
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {out_path} 생성: {len(store)}행, 태그 {len(store.tag_vocab)}종, "
+            f"{len(data) / 1024:.1f}KB (CSV {os.path.getsize(csv_path) / 1024:.1f}KB)"
+        ))
@@ -8,6 +8,8 @@ from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from apps.tags.models import Tag
 from apps.places.models import Place
+from apps.places.cache import bump_list_version
+from apps.places.descriptors import refresh_place_descriptors
 
 # (선택) FAISS 사용
 try:
@@ -149,6 +151,10 @@ class Command(BaseCommand):
                     obj, _ = Tag.objects.get_or_create(name=nt)
                     tag_cache[obj.name] = obj.id
 
+        # 목록 캐시 무효화 + 추천 프롬프트용 설명자 갱신
+        bump_list_version()
+        refresh_place_descriptors()
+
         self.stdout.write(self.style.SUCCESS(f"{count}개 장소가 저장되었습니다."))
 
         # 인덱스 안내
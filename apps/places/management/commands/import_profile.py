@@ -0,0 +1,210 @@
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# 자식 프로세스에서 실행: 단계별(INSTALLED_APPS / URLConf / recommend) 시간·메모리 측정
+# (-X importtime 출력은 stderr, 측정 결과 JSON은 마커 뒤 stdout 으로)
+# tracemalloc 은 할당마다 추적 비용이 들어 시간을 부풀리므로 TRACE(메모리 측정) 실행에서만 켠다
+PROBE_SCRIPT = r'''
+import json, sys, time, resource
+if TRACE:
+    import tracemalloc
+    tracemalloc.start()
+stages = []
+
+def stage(name, fn):
+    t0 = time.perf_counter()
+    fn()
+    stages.append({
+        "name": name,
+        "ms": round((time.perf_counter() - t0) * 1000, 2),
+        "maxrss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    })
+
+import django
+stage("django.setup (INSTALLED_APPS)", django.setup)
+
+def load_urls():
+    from django.urls import get_resolver
+    get_resolver().url_patterns
+stage("URLConf", load_urls)
+
+stage("import recommend", lambda: __import__("recommend"))
+if PRELOAD:
+    stage("recommend.preload()", lambda: __import__("recommend").preload(faiss=False))
+
+# 모듈 파일별 할당 메모리 → 최상위 패키지로 합산
+mem = {}
+if TRACE:
+    by_file = {}
+    for name, mod in list(sys.modules.items()):
+        f = getattr(mod, "__file__", None)
+        if f:
+            by_file[f] = name.split(".")[0]
+    for st in tracemalloc.take_snapshot().statistics("filename"):
+        pkg = by_file.get(st.traceback[0].filename, "(other)")
+        mem[pkg] = mem.get(pkg, 0) + st.size
+print("@@PROFILE@@" + json.dumps({"stages": stages, "memory": mem}))
+'''
+
+
+def parse_importtime(stderr: str):
+    """
+    -X importtime 출력 → 트리. 자식이 부모보다 먼저 출력되므로(post-order)
+    레벨별 대기 목록에 쌓아두었다가 부모 줄이 나오면 붙인다.
+    """
+    pending = defaultdict(list)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cum_us, name = line.split(":", 1)[1].split("|")
+        except ValueError:
+            continue
+        level = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        node = {
+            "name": name.strip(),
+            "self_ms": round(int(self_us) / 1000, 2),
+            "cumulative_ms": round(int(cum_us) / 1000, 2),
+            "children": pending.pop(level + 1, []),
+        }
+        pending[level].append(node)
+    if not pending:
+        return []
+    return pending[min(pending)]
+
+
+def aggregate_packages(tree):
+    """최상위 패키지별 self 시간 합계/모듈 수"""
+    totals = defaultdict(lambda: {"self_ms": 0.0, "modules": 0})
+
+    def walk(nodes):
+        for n in nodes:
+            pkg = totals[n["name"].split(".")[0]]
+            pkg["self_ms"] += n["self_ms"]
+            pkg["modules"] += 1
+            walk(n["children"])
+
+    walk(tree)
+    return sorted(
+        ({"package": k, "self_ms": round(v["self_ms"], 2), "modules": v["modules"]} for k, v in totals.items()),
+        key=lambda x: (-x["self_ms"], x["package"]),
+    )
+
+
+class Command(BaseCommand):
+    help = "Django 기동 경로(INSTALLED_APPS, URLConf, recommend)의 모듈 import 시간/메모리 프로파일"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=25, help="출력할 상위 패키지 수")
+        parser.add_argument("--depth", type=int, default=2, help="import 트리 출력 깊이")
+        parser.add_argument("--min-ms", type=float, default=5.0, help="트리에 표시할 최소 누적 시간(ms)")
+        parser.add_argument("--output", help="결과 JSON 저장 경로 (실행 간 diff 용)")
+        parser.add_argument("--baseline", help="이전 결과 JSON과 패키지별 시간 비교")
+        parser.add_argument("--budget-ms", type=float, help="기동 총 시간 예산(ms), 초과 시 실패(exit 1)")
+        parser.add_argument("--preload", action="store_true", help="recommend.preload() 까지 포함해서 측정")
+        parser.add_argument("--memory", action="store_true",
+                            help="tracemalloc 으로 패키지별 할당 메모리도 측정 (시간 측정과 별도 프로세스로 한 번 더 실행)")
+
+    def _probe(self, opts, trace):
+        """프로브 스크립트를 새 프로세스로 실행 → (측정 JSON, stderr)"""
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings")}
+        script = f"PRELOAD = {bool(opts['preload'])}\nTRACE = {trace}\n" + PROBE_SCRIPT
+        cmd = [sys.executable, "-c", script] if trace else [sys.executable, "-X", "importtime", "-c", script]
+        proc = subprocess.run(cmd, cwd=str(settings.BASE_DIR), env=env, capture_output=True, text=True)
+        marker = next((ln for ln in proc.stdout.splitlines() if ln.startswith("@@PROFILE@@")), None)
+        if proc.returncode != 0 or marker is None:
+            tail = "\n".join(ln for ln in proc.stderr.splitlines() if not ln.startswith("import time:"))
+            raise CommandError(f"프로파일 프로세스 실패 (exit {proc.returncode}):\n{tail[-2000:]}")
+        return json.loads(marker[len("@@PROFILE@@"):]), proc.stderr
+
+    def handle(self, *args, **opts):
+        # 시간(--budget-ms 판정 포함)은 tracemalloc 없이 잰다
+        probe, stderr = self._probe(opts, trace=False)
+        tree = parse_importtime(stderr)
+        total_ms = round(sum(s["ms"] for s in probe["stages"]), 2)
+        memory = self._probe(opts, trace=True)[0]["memory"] if opts["memory"] else {}
+        report = {
+            "python": sys.version.split()[0],
+            "total_ms": total_ms,
+            "stages": probe["stages"],
+            "packages": aggregate_packages(tree),
+            "memory_kb": sorted(
+                ({"package": k, "kb": round(v / 1024, 1)} for k, v in memory.items()),
+                key=lambda x: (-x["kb"], x["package"]),
+            ),
+            "tree": tree,
+        }
+
+        self._print_report(report, opts)
+
+        if opts.get("baseline"):
+            self._print_diff(report, opts["baseline"], opts["top"])
+
+        if opts.get("output"):
+            with open(opts["output"], "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2, sort_keys=True)
+            self.stdout.write(f"💾 결과가 {opts['output']}에 저장되었습니다.")
+
+        budget = opts.get("budget_ms")
+        if budget is not None and total_ms > budget:
+            raise CommandError(f"기동 시간 {total_ms:.0f}ms 가 예산 {budget:.0f}ms 를 초과했습니다.")
+
+    def _print_report(self, report, opts):
+        self.stdout.write(self.style.MIGRATE_HEADING("단계별 시간"))
+        for s in report["stages"]:
+            self.stdout.write(f"  {s['ms']:>9.1f} ms  maxrss {s['maxrss_kb'] / 1024:>7.1f} MB  {s['name']}")
+        self.stdout.write(f"  {report['total_ms']:>9.1f} ms  (합계)")
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"\n패키지별 import 시간 (상위 {opts['top']})"))
+        for p in report["packages"][:opts["top"]]:
+            self.stdout.write(f"  {p['self_ms']:>9.1f} ms  {p['modules']:>5} 모듈  {p['package']}")
+
+        if report["memory_kb"]:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n패키지별 할당 메모리 (상위 {opts['top']})"))
+            for m in report["memory_kb"][:opts["top"]]:
+                self.stdout.write(f"  {m['kb'] / 1024:>9.1f} MB  {m['package']}")
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"\nimport 트리 (누적 {opts['min_ms']}ms 이상, 깊이 {opts['depth']})"))
+
+        def walk(nodes, level):
+            for n in sorted(nodes, key=lambda x: -x["cumulative_ms"]):
+                if n["cumulative_ms"] < opts["min_ms"]:
+                    continue
+                self.stdout.write(f"  {n['cumulative_ms']:>9.1f} ms  {'  ' * level}{n['name']}")
+                if level + 1 < opts["depth"]:
+                    walk(n["children"], level + 1)
+
+        walk(report["tree"], 0)
+
+    def _print_diff(self, report, baseline_path, top):
+        try:
+            with open(baseline_path, encoding="utf-8") as f:
+                base = json.load(f)
+        except (OSError, ValueError) as e:
+            self.stderr.write(f"❌ 기준 파일을 읽을 수 없습니다: {e}")
+            return
+
+        before = {p["package"]: p["self_ms"] for p in base.get("packages", [])}
+        after = {p["package"]: p["self_ms"] for p in report["packages"]}
+        deltas = sorted(
+            ((pkg, after.get(pkg, 0.0) - before.get(pkg, 0.0)) for pkg in set(before) | set(after)),
+            key=lambda x: -abs(x[1]),
+        )
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"\n기준 대비 변화: 합계 {base.get('total_ms', 0):.1f} → {report['total_ms']:.1f} ms"
+        ))
+        for pkg, d in deltas[:top]:
+            if abs(d) >= 0.1:
+                self.stdout.write(f"  {d:>+9.1f} ms  {pkg}")
+
+
+# 사용 예시:
+# python manage.py import_profile
+# python manage.py import_profile --preload --memory --output startup.json
+# python manage.py import_profile --baseline startup.json --budget-ms 3000
@@ -11,6 +11,8 @@ from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from apps.tags.models import Tag
 from apps.places.models import Place
+from apps.places.cache import bump_list_version
+from apps.places.descriptors import refresh_place_descriptors
 
 # (선택) FAISS 사용
 try:
@@ -272,6 +274,11 @@ class Command(BaseCommand):
                     obj, _ = Tag.objects.get_or_create(name=nt)
                     tag_cache[obj.name] = obj.id
 
+        # 목록 캐시 무효화 + 추천 프롬프트용 설명자 갱신
+        if not dry_run:
+            bump_list_version()
+            refresh_place_descriptors()
+
         # 최종 진행줄 한 줄 마무리 출력(개행)
         self._print_progress(processed_rows, total_rows, start_ts, created, updated, skipped, bar_width, final=True)
 
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.places.mock_llm import MockConfig, make_server
+
+
+class Command(BaseCommand):
+    help = "CLOVA/OpenAI 임베딩·채팅 API 로컬 목 서버 (앱은 LLM_MOCK_URL=http://host:port 로 연결)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--latency-ms", type=float, default=300, help="응답 지연 평균/중앙값")
+        parser.add_argument("--jitter-ms", type=float, default=100, help="지연 표준편차 (lognormal은 꼬리 폭)")
+        parser.add_argument("--dist", choices=["fixed", "normal", "lognormal"], default="normal")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+        parser.add_argument("--error-codes", default="429,500", help="오류 응답 상태 코드 (쉼표 구분)")
+        parser.add_argument("--stream-chunk-ms", type=float, default=20, help="스트리밍 청크 간격")
+        parser.add_argument("--clova-dim", type=int, default=1024, help="CLOVA 임베딩 차원")
+        parser.add_argument("--openai-dim", type=int, default=1536, help="OpenAI 임베딩 기본 차원")
+        parser.add_argument("--seed", type=int, help="지연/오류 난수 시드 (재현용)")
+
+    def handle(self, *args, **opts):
+        if not 0 <= opts["error_rate"] <= 1:
+            raise CommandError("--error-rate 는 0~1 사이여야 합니다.")
+        try:
+            codes = [int(c) for c in opts["error_codes"].split(",") if c.strip()]
+        except ValueError:
+            raise CommandError("--error-codes 형식이 잘못되었습니다.")
+
+        config = MockConfig(
+            latency_ms=opts["latency_ms"], jitter_ms=opts["jitter_ms"], dist=opts["dist"],
+            error_rate=opts["error_rate"], error_codes=codes or (500,),
+            stream_chunk_ms=opts["stream_chunk_ms"], clova_dim=opts["clova_dim"],
+            openai_dim=opts["openai_dim"], seed=opts.get("seed"),
+        )
+        server = make_server(opts["host"], opts["port"], config)
+        url = f"http://{opts['host']}:{opts['port']}"
+        self.stdout.write(self.style.SUCCESS(f"🧪 목 LLM 서버 실행 중: {url}"))
+        self.stdout.write(f"   앱 설정: LLM_MOCK_URL={url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.stdout.write(f"종료: 요청 {config.stats['requests']}건, 오류 {config.stats['errors']}건")
+
+
+# 사용 예시:
+# python manage.py mock_llm_server --latency-ms 800 --jitter-ms 300 --dist lognormal --error-rate 0.02
+# LLM_MOCK_URL=http://127.0.0.1:8765 gunicorn config.wsgi:application -c gunicorn.conf.py
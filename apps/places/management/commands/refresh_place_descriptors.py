@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from apps.places.descriptors import refresh_place_descriptors
+
+
+class Command(BaseCommand):
+    help = "추천 프롬프트용 장소 설명자(prompt_desc, tag_names) 재계산"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--place-id", type=int, action="append", help="특정 장소만 (여러 번 지정 가능)")
+        parser.add_argument("--batch", type=int, default=500, help="bulk_update 배치 크기")
+
+    def handle(self, *args, **opts):
+        n = refresh_place_descriptors(opts.get("place_id"), batch_size=opts["batch"])
+        self.stdout.write(self.style.SUCCESS(f"✅ {n}개 장소 설명자 갱신"))
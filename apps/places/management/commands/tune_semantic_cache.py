@@ -0,0 +1,82 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.places.semantic_cache import SemanticCache, normalize_region
+
+
+class Command(BaseCommand):
+    help = "SEMANTIC_CACHE_LOG 로 남긴 질문을 재생해 임계값별 의미 캐시 적중률/정확도 비교"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--log", required=True, help="semantic cache 질의 로그(JSONL: query, region, embedding)")
+        parser.add_argument("--thresholds", default="0.85,0.88,0.9,0.92,0.94,0.96",
+                            help="비교할 임계값 (쉼표 구분)")
+        parser.add_argument("--labels", help="정답 쌍 JSONL: {\"a\": 질문, \"b\": 질문, \"same\": true/false}")
+        parser.add_argument("--samples", type=int, default=5, help="임계값마다 보여줄 적중 예시 수")
+        parser.add_argument("--size", type=int, default=512, help="캐시 크기 (운영 설정과 맞추기)")
+
+    def handle(self, *args, **opts):
+        records = self._read_jsonl(opts["log"])
+        records = [r for r in records if r.get("embedding")]
+        if not records:
+            raise CommandError("임베딩이 포함된 질의 로그가 없습니다.")
+        try:
+            thresholds = [float(t) for t in opts["thresholds"].split(",") if t.strip()]
+        except ValueError:
+            raise CommandError("--thresholds 형식이 잘못되었습니다.")
+
+        labels = self._read_jsonl(opts["labels"]) if opts.get("labels") else []
+        by_query = {r["query"]: r for r in records}
+
+        self.stdout.write(f"질의 {len(records)}건, 정답 쌍 {len(labels)}건\n")
+        for th in thresholds:
+            hits, samples = self._replay(records, th, opts["size"])
+            line = f"임계값 {th:.3f}: 적중 {hits}/{len(records)} ({hits / len(records):.1%})"
+            if labels:
+                line += "  " + self._score_labels(labels, by_query, th)
+            self.stdout.write(self.style.MIGRATE_HEADING(line))
+            for q, matched, sim in samples[:opts["samples"]]:
+                self.stdout.write(f"    {sim:.3f}  '{q}'  ≈  '{matched}'")
+
+    def _replay(self, records, threshold, size):
+        """운영과 같은 순서로 조회 → 미스면 저장"""
+        cache = SemanticCache(threshold=threshold, max_entries=size, ttl=float("inf"))
+        hits, samples = 0, []
+        for r in records:
+            entry, sim = cache.lookup(r["embedding"], r.get("region", ""))
+            if entry is not None:
+                hits += 1
+                if entry["query"] != r["query"]:
+                    samples.append((r["query"], entry["query"], sim))
+            else:
+                cache.add(r["embedding"], r.get("region", ""), r["query"], {"추천_장소명": ["-"]})
+        return hits, samples
+
+    def _score_labels(self, labels, by_query, threshold):
+        import numpy as np
+
+        tp = fp = fn = tn = 0
+        for pair in labels:
+            a, b = by_query.get(pair.get("a")), by_query.get(pair.get("b"))
+            if a is None or b is None:
+                continue
+            va = np.asarray(a["embedding"], dtype=np.float32)
+            vb = np.asarray(b["embedding"], dtype=np.float32)
+            sim = float(va @ vb / ((np.linalg.norm(va) * np.linalg.norm(vb)) or 1.0))
+            predicted = sim >= threshold and normalize_region(a.get("region")) == normalize_region(b.get("region"))
+            same = bool(pair.get("same"))
+            tp += predicted and same
+            fp += predicted and not same
+            fn += (not predicted) and same
+            tn += (not predicted) and not same
+        precision = tp / (tp + fp) if tp + fp else 0.0
+        recall = tp / (tp + fn) if tp + fn else 0.0
+        return f"정밀도 {precision:.2f} 재현율 {recall:.2f} (오적중 {fp}건)"
+
+    def _read_jsonl(self, path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except (OSError, ValueError) as e:
+            raise CommandError(f"{path} 읽기 실패: {e}")
@@ -0,0 +1,178 @@
+"""
+FAISS 폴백용 장소 메타데이터 저장소 (컬럼형, mmap).
+
+pandas CSV를 워커마다 파싱하는 대신 build_faiss_meta 명령으로 한 번 만든 바이너리 파일을
+mmap으로 열어 쓴다. 페이지 캐시를 모든 워커가 공유하므로 워커별 파싱 비용/RSS가 거의 없고,
+k개 조회는 오프셋 슬라이스 k번(O(k))이다.
+
+파일 구조 (리틀엔디언, 섹션은 8바이트 정렬):
+    MAGIC(8) | 헤더 길이 uint32 | 헤더 JSON(utf-8)
+    문자열 컬럼마다: 오프셋 uint32[n+1] | utf-8 blob
+    태그: uint16[n * TAG_SLOTS] (0 = 없음, 그 외 tag_vocab 인덱스 + 1)
+
+Django에 의존하지 않는다 (recommend.py에서 바로 import).
+"""
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b"TTMETA1\0"
+STRING_COLUMNS = ("명칭", "주소", "개요")
+TAG_COLUMNS = ("tag1", "tag2", "tag3", "tag4", "tag5")
+TAG_SLOTS = len(TAG_COLUMNS)
+
+
+def _pad(n):
+    return (-n) % 8
+
+
+def build_from_rows(rows) -> bytes:
+    """dict 행(CSV DictReader 등) → 바이너리 파일 내용"""
+    columns = {c: [] for c in STRING_COLUMNS}
+    tag_vocab, tag_ids = [], {}
+    tags = array("H")
+
+    count = 0
+    for row in rows:
+        for c in STRING_COLUMNS:
+            columns[c].append((row.get(c) or "").strip().encode("utf-8"))
+        slots = []
+        for c in TAG_COLUMNS:
+            name = (row.get(c) or "").strip()
+            if not name:
+                continue
+            if name not in tag_ids:
+                if len(tag_vocab) >= 0xFFFF:
+                    raise ValueError("태그 종류가 65535개를 넘습니다.")
+                tag_ids[name] = len(tag_vocab) + 1
+                tag_vocab.append(name)
+            slots.append(tag_ids[name])
+        tags.extend(slots + [0] * (TAG_SLOTS - len(slots)))
+        count += 1
+
+    sections = []
+    layout = {}
+    pos = 0
+
+    def add(name, data):
+        nonlocal pos
+        layout[name] = [pos, len(data)]
+        sections.append(data + b"\0" * _pad(len(data)))
+        pos += len(data) + _pad(len(data))
+
+    for i, c in enumerate(STRING_COLUMNS):
+        offsets = array("I", [0])
+        for value in columns[c]:
+            offsets.append(offsets[-1] + len(value))
+        if offsets[-1] > 0xFFFFFFFF:
+            raise ValueError(f"{c} 컬럼이 4GB를 넘습니다.")
+        add(f"s{i}.offsets", _le(offsets))
+        add(f"s{i}.blob", b"".join(columns[c]))
+    add("tags", _le(tags))
+
+    header = json.dumps({
+        "rows": count,
+        "columns": list(STRING_COLUMNS),
+        "tag_slots": TAG_SLOTS,
+        "tag_vocab": tag_vocab,
+        "sections": layout,
+    }, ensure_ascii=False).encode("utf-8")
+    prefix = MAGIC + struct.pack("<I", len(header)) + header
+    prefix += b"\0" * _pad(len(prefix))
+    return prefix + b"".join(sections)
+
+
+def build_from_csv(csv_path) -> bytes:
+    with open(csv_path, encoding="utf-8-sig", newline="") as f:
+        return build_from_rows(csv.DictReader(f))
+
+
+def _le(arr):
+    if sys.byteorder != "little":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+class PlaceMetaStore:
+    """
+    읽기 전용 메타데이터. 파일이면 mmap, bytes면 그대로 메모리에서 읽는다.
+    rows(ids) → [{"명칭", "주소", "개요", "tags"}] (FAISS 결과 I[0] 그대로 전달 가능)
+    """
+
+    def __init__(self, buf, _mm=None):
+        self._mm = _mm
+        view = memoryview(buf)
+        if bytes(view[:8]) != MAGIC:
+            raise ValueError("메타데이터 파일 형식이 아닙니다 (build_faiss_meta로 다시 생성하세요).")
+        (hlen,) = struct.unpack_from("<I", view, 8)
+        header = json.loads(bytes(view[12:12 + hlen]).decode("utf-8"))
+        base = 12 + hlen + _pad(12 + hlen)
+
+        def section(name, fmt=None):
+            start, length = header["sections"][name]
+            sec = view[base + start: base + start + length]
+            if not fmt:
+                return sec
+            if sys.byteorder == "little":
+                return sec.cast(fmt)
+            # 빅엔디언 환경은 드물어서 오프셋/태그 배열만 복사해 뒤집는다
+            arr = array(fmt, bytes(sec))
+            arr.byteswap()
+            return arr
+
+        self.rows_count = header["rows"]
+        self.columns = header["columns"]
+        self.tag_slots = header["tag_slots"]
+        self.tag_vocab = header["tag_vocab"]
+        self._strings = [
+            (section(f"s{i}.offsets", "I"), section(f"s{i}.blob"))
+            for i in range(len(self.columns))
+        ]
+        self._tags = section("tags", "H")
+
+    @classmethod
+    def open(cls, path):
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mm, _mm=mm)
+
+    def __len__(self):
+        return self.rows_count
+
+    def _string(self, col, i):
+        offsets, blob = self._strings[col]
+        return str(blob[offsets[i]:offsets[i + 1]], "utf-8")
+
+    def tags(self, i):
+        s = i * self.tag_slots
+        return [self.tag_vocab[t - 1] for t in self._tags[s:s + self.tag_slots] if t]
+
+    def row(self, i):
+        i = int(i)
+        if not 0 <= i < self.rows_count:
+            raise IndexError(i)
+        item = {c: self._string(n, i) for n, c in enumerate(self.columns)}
+        item["tags"] = self.tags(i)
+        return item
+
+    def rows(self, ids):
+        # FAISS는 결과가 k개보다 적으면 -1을 채운다
+        return [self.row(i) for i in ids if 0 <= int(i) < self.rows_count]
+
+
+def load(bin_path, csv_path=None):
+    """
+    바이너리 파일이 있으면 mmap으로 열고, 없으면 CSV에서 메모리로 바로 만든다
+    (이 경우 워커마다 파싱하므로 build_faiss_meta 실행을 권장).
+    """
+    if os.path.exists(bin_path):
+        return PlaceMetaStore.open(bin_path)
+    if csv_path and os.path.exists(csv_path):
+        print(f"[warn] {bin_path} 없음 → {csv_path}에서 메모리로 생성 (python manage.py build_faiss_meta 권장)")
+        return PlaceMetaStore(build_from_csv(csv_path))
+    raise FileNotFoundError(bin_path)
@@ -0,0 +1,63 @@
+"""
+프로세스 내 간단한 카운터/지연시간 집계 (워커별).
+
+incr("retrieval.db.served"), observe("retrieval.db", 42.0) 처럼 기록하고
+snapshot()으로 조회한다. METRICS_LOG_EVERY 건마다 요약을 print 로 남긴다.
+Django에 의존하지 않는다.
+"""
+import os
+import threading
+from collections import defaultdict
+
+_lock = threading.Lock()
+_counters = defaultdict(int)
+_timings = {}  # name -> [count, total_ms, max_ms]
+_events = 0
+
+LOG_EVERY = int(os.getenv("METRICS_LOG_EVERY", "100"))
+
+
+def incr(name, n=1):
+    global _events
+    with _lock:
+        _counters[name] += n
+        _events += 1
+        should_log = LOG_EVERY > 0 and _events % LOG_EVERY == 0
+    if should_log:
+        log_summary()
+
+
+def observe(name, ms):
+    with _lock:
+        t = _timings.get(name)
+        if t is None:
+            _timings[name] = [1, ms, ms]
+        else:
+            t[0] += 1
+            t[1] += ms
+            t[2] = max(t[2], ms)
+
+
+def snapshot(prefix=""):
+    with _lock:
+        counters = {k: v for k, v in _counters.items() if k.startswith(prefix)}
+        timings = {
+            k: {"count": c, "avg_ms": round(total / c, 1), "max_ms": round(mx, 1)}
+            for k, (c, total, mx) in _timings.items() if k.startswith(prefix)
+        }
+    return {"pid": os.getpid(), "counters": counters, "timings": timings}
+
+
+def reset():
+    global _events
+    with _lock:
+        _counters.clear()
+        _timings.clear()
+        _events = 0
+
+
+def log_summary(prefix=""):
+    snap = snapshot(prefix)
+    counters = " ".join(f"{k}={v}" for k, v in sorted(snap["counters"].items()))
+    timings = " ".join(f"{k}={v['avg_ms']}ms(max {v['max_ms']})" for k, v in sorted(snap["timings"].items()))
+    print(f"[metrics pid={snap['pid']}] {counters} | {timings}")
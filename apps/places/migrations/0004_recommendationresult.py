@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0003_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecommendationResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, unique=True)),
+                ('prompt', models.TextField()),
+                ('followup', models.TextField(blank=True, default='')),
+                ('question', models.TextField(blank=True, default='')),
+                ('recommendations', models.JSONField(default=list)),
+                ('items', models.JSONField(default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:00
+
+from django.db import migrations, models
+
+
+def backfill_like_count(apps, schema_editor):
+    Place = apps.get_model('places', 'Place')
+    PlaceLike = apps.get_model('places', 'PlaceLike')
+    counts = (
+        PlaceLike.objects.values('place_id')
+        .annotate(n=models.Count('id'))
+        .values_list('place_id', 'n')
+    )
+    for place_id, n in counts:
+        Place.objects.filter(pk=place_id).update(like_count=n)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0004_recommendationresult'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='place',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_like_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+def backfill_tag_names(apps, schema_editor):
+    # prompt_desc 는 비워두면 검색 시 overview 로 대체됨 (refresh_place_descriptors 명령으로 채움)
+    Place = apps.get_model('places', 'Place')
+    batch = []
+    for place in Place.objects.prefetch_related('tags').iterator(chunk_size=500):
+        place.tag_names = ",".join(sorted(t.name for t in place.tags.all()))[:500]
+        batch.append(place)
+        if len(batch) >= 500:
+            Place.objects.bulk_update(batch, ['tag_names'])
+            batch = []
+    if batch:
+        Place.objects.bulk_update(batch, ['tag_names'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0005_place_like_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='place',
+            name='prompt_desc',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='place',
+            name='tag_names',
+            field=models.CharField(blank=True, default='', max_length=500),
+        ),
+        migrations.RunPython(backfill_tag_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0006_place_descriptors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='place',
+            name='summary_review_id',
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0007_place_summary_review_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='recommendationresult',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
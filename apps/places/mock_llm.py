@@ -0,0 +1,166 @@
+"""
+CLOVA / OpenAI 호환 로컬 목 서버 (부하 테스트용, mock_llm_server 명령으로 실행).
+
+지원 엔드포인트:
+    POST /v1/api-tools/embedding/v2                      CLOVA 임베딩 (get_clova_embedding)
+    POST /v1/openai/chat/completions, /v1/chat/completions  ChatClovaX / OpenAI 채팅 (stream 지원)
+    POST /v1/openai/embeddings, /v1/embeddings           OpenAI 임베딩 (VectorSearchService)
+
+응답 지연은 분포(fixed/normal/lognormal)에서 뽑고, 일정 비율로 429/500 오류를 돌려준다.
+채팅 응답은 프롬프트 종류를 보고 추출 JSON / 추천 목록 형식을 흉내낸다.
+"""
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .bench import hash_embedding, stub_recommendation_text
+
+
+class MockConfig:
+    def __init__(self, latency_ms=300, jitter_ms=100, dist="normal", error_rate=0.0,
+                 error_codes=(429, 500), stream_chunk_ms=20, clova_dim=1024, openai_dim=1536, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.dist = dist
+        self.error_rate = error_rate
+        self.error_codes = tuple(error_codes)
+        self.stream_chunk_ms = stream_chunk_ms
+        self.clova_dim = clova_dim
+        self.openai_dim = openai_dim
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "errors": 0}
+
+    def delay(self):
+        with self._lock:
+            if self.dist == "fixed":
+                ms = self.latency_ms
+            elif self.dist == "lognormal":
+                # 중앙값 latency_ms, 꼬리는 jitter_ms/latency_ms 비율로
+                sigma = (self.jitter_ms / self.latency_ms) if self.latency_ms else 0.0
+                ms = self.latency_ms * self._rng.lognormvariate(0, sigma)
+            else:
+                ms = self._rng.gauss(self.latency_ms, self.jitter_ms)
+        time.sleep(max(0.0, ms) / 1000)
+
+    def pick_error(self):
+        with self._lock:
+            self.stats["requests"] += 1
+            if self.error_rate and self._rng.random() < self.error_rate:
+                self.stats["errors"] += 1
+                return self._rng.choice(self.error_codes)
+        return None
+
+
+def _chat_text(messages):
+    prompt = "\n".join(str(m.get("content", "")) for m in messages if isinstance(m, dict))
+    if "여행지 리스트" in prompt:
+        return stub_recommendation_text(prompt) or "추천할 장소가 없습니다."
+    if "추출 항목" in prompt:
+        return json.dumps({"지역": "서울", "감정": "힐링", "활동": "산책", "보충 질문": ""}, ensure_ascii=False)
+    if "쉼표로 구분" in prompt:
+        return "힐링, 산책, 자연"
+    return "목 서버 응답입니다. " + prompt[:200]
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    config = MockConfig()
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):
+        pass  # 부하 테스트 중 로그 폭주 방지
+
+    def _json(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip("/") in ("", "/health"):
+            return self._json(200, {"ok": True, **self.config.stats})
+        self._json(404, {"error": "not found"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return self._json(400, {"error": {"message": "invalid json"}})
+
+        self.config.delay()
+        code = self.config.pick_error()
+        if code:
+            return self._json(code, {"error": {"message": f"mock error {code}", "type": "mock"}})
+
+        path = self.path.split("?")[0].rstrip("/")
+        if path == "/v1/api-tools/embedding/v2":
+            text = payload.get("text", "")
+            return self._json(200, {
+                "status": {"code": "20000", "message": "OK"},
+                "result": {"embedding": hash_embedding(text, self.config.clova_dim), "inputTokens": len(text)},
+            })
+        if path in ("/v1/openai/embeddings", "/v1/embeddings"):
+            inputs = payload.get("input", "")
+            inputs = inputs if isinstance(inputs, list) else [inputs]
+            dim = int(payload.get("dimensions") or self.config.openai_dim)
+            return self._json(200, {
+                "object": "list",
+                "model": payload.get("model", "mock-embedding"),
+                "data": [{"object": "embedding", "index": i, "embedding": hash_embedding(str(t), dim)}
+                         for i, t in enumerate(inputs)],
+                "usage": {"prompt_tokens": sum(len(str(t)) for t in inputs),
+                          "total_tokens": sum(len(str(t)) for t in inputs)},
+            })
+        if path in ("/v1/openai/chat/completions", "/v1/chat/completions"):
+            return self._chat(payload)
+        self._json(404, {"error": {"message": f"unknown path {self.path}"}})
+
+    def _chat(self, payload):
+        text = _chat_text(payload.get("messages") or [])
+        cid = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        model = payload.get("model", "HCX-005")
+        created = int(time.time())
+        usage = {"prompt_tokens": 0, "completion_tokens": len(text), "total_tokens": len(text)}
+
+        if not payload.get("stream"):
+            return self._json(200, {
+                "id": cid, "object": "chat.completion", "created": created, "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                "usage": usage,
+            })
+
+        # SSE 스트리밍: 몇 글자씩 나눠서 chunk_ms 간격으로 전송
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        def send(delta, finish=None):
+            chunk = {"id": cid, "object": "chat.completion.chunk", "created": created, "model": model,
+                     "choices": [{"index": 0, "delta": delta, "finish_reason": finish}]}
+            self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        try:
+            send({"role": "assistant", "content": ""})
+            for i in range(0, len(text), 8):
+                time.sleep(self.config.stream_chunk_ms / 1000)
+                send({"content": text[i:i + 8]})
+            send({}, finish="stop")
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self.close_connection = True
+
+
+def make_server(host, port, config):
+    handler = type("ConfiguredMockHandler", (MockHandler,), {"config": config})
+    return ThreadingHTTPServer((host, port), handler)
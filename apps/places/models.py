@@ -16,6 +16,12 @@ class Place(models.Model):
     tags = models.ManyToManyField(Tag, blank=True, related_name='places')
     place_class = models.IntegerField(default=0)  # class 필드 추가 (1: 레포츠, 2: 쇼핑, 3: 관광지, 4: 문화시설)
     embedding = VectorField(dimensions=1024, null=True, blank=True)
+    like_count = models.PositiveIntegerField(default=0)  # 찜 수 (PlaceLike 비정규화 카운터)
+    # 추천 프롬프트용 미리 계산한 설명/태그 (descriptors.refresh_place_descriptors 로 갱신)
+    prompt_desc = models.TextField(blank=True, default="")
+    tag_names = models.CharField(max_length=500, blank=True, default="")  # 쉼표로 연결
+    # summary 에 반영된 마지막 Review.id (증분 요약 기준점, 0이면 전체 재요약)
+    summary_review_id = models.BigIntegerField(default=0)
 
     def __str__(self):
         return self.name
@@ -28,4 +34,17 @@ class PlaceLike(models.Model):
     class Meta:
         unique_together = ('user', 'place')
     def __str__(self):
-        return f"{self.user} likes {self.place}"
\ No newline at end of file
+        return f"{self.user} likes {self.place}"
+
+class RecommendationResult(models.Model):
+    # (prompt, followup) 내용 해시 → 추천 결과 (LLM 재호출 없이 /search/ 렌더링용)
+    key = models.CharField(max_length=64, unique=True)
+    prompt = models.TextField()
+    followup = models.TextField(blank=True, default="")
+    question = models.TextField(blank=True, default="")  # 보충 질문
+    recommendations = models.JSONField(default=list)  # LLM 원문 줄
+    items = models.JSONField(default=list)  # [{"place_id": .., "reason": .., "tip": ..}]
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)  # RECO_RESULT_TTL 만료/정리 기준
+
+    def __str__(self):
+        return f"{self.prompt[:30]} ({self.key[:8]})"
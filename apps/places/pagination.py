@@ -0,0 +1,175 @@
+import base64
+import binascii
+import math
+
+WINDOW = 5  # 페이지 번호 윈도우 크기
+
+
+def encode_cursor(number, anchor=None):
+    """
+    불투명 커서: "페이지번호:앵커"를 base64로 인코딩.
+    앵커 = 이전 페이지 마지막 id (해당 페이지는 id < 앵커), 없으면 첫 페이지, 'last'면 마지막 페이지
+    """
+    raw = f"{number}:{'' if anchor is None else anchor}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        number, anchor = raw.split(":", 1)
+        number = max(1, int(number))
+        if not anchor:
+            return 1, None
+        return number, (anchor if anchor == "last" else int(anchor))
+    except (ValueError, UnicodeDecodeError, binascii.Error):
+        return 1, None
+
+
+class KeysetPaginator:
+    """
+    '-id' 정렬 목록용 keyset(seek) 페이지네이터.
+    OFFSET 대신 id < 앵커 로 다음 페이지를 찾으므로 깊은 페이지도 첫 페이지와 비용이 같다.
+    count는 근사치(캐시값)를 받아 페이지 번호 UI에만 사용.
+
+    qs: 실제 화면에 쓰는 queryset (annotate/prefetch 포함 가능)
+    id_qs: 앵커 계산용 가벼운 queryset (필터만 적용, 기본값 qs)
+    """
+
+    def __init__(self, qs, per_page, count, id_qs=None):
+        self.qs = qs
+        self.id_qs = id_qs if id_qs is not None else qs
+        self.per_page = per_page
+        self.count = count
+        self.num_pages = max(1, math.ceil(count / per_page))
+
+    def page_from_request(self, request):
+        token = request.GET.get('cursor')
+        if token:
+            return self.get_page(*decode_cursor(token))
+
+        # 예전 ?page=N 링크 호환 (id만 훑어서 앵커 계산)
+        page = request.GET.get('page', '')
+        number = int(page) if page.isdigit() and int(page) > 1 else 1
+        if number == 1:
+            return self.get_page(1, None)
+        offset = (number - 1) * self.per_page - 1
+        ids = list(self.id_qs.order_by('-id').values_list('id', flat=True)[offset:offset + 1])
+        return self.get_page(number, ids[0]) if ids else self.get_page(1, None)
+
+    def get_page(self, number, anchor):
+        if anchor == "last":
+            tail = self.count - (self.num_pages - 1) * self.per_page
+            rows = list(self.qs.order_by('id')[:max(1, tail)])[::-1]
+            number = self.num_pages
+        elif anchor is None:
+            rows = list(self.qs.order_by('-id')[:self.per_page])
+            number = 1
+        else:
+            rows = list(self.qs.filter(id__lt=anchor).order_by('-id')[:self.per_page])
+        self.num_pages = max(self.num_pages, number)
+        return KeysetPage(rows, number, self)
+
+
+class KeysetPage:
+    def __init__(self, object_list, number, paginator):
+        self.object_list = object_list
+        self.number = number
+        self.paginator = paginator
+        self._forward = None
+        self._backward = None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    # --- 앵커 계산용 id 조회 (페이지 크기 * 윈도우로 상한 → 비용 고정) ---
+    def _forward_ids(self):
+        if self._forward is None:
+            self._forward = []
+            if self.object_list:
+                pp = self.paginator.per_page
+                last_id = self.object_list[-1].id
+                self._forward = list(
+                    self.paginator.id_qs.filter(id__lt=last_id).order_by('-id')
+                    .values_list('id', flat=True)[:pp * (WINDOW - 1) + 1]
+                )
+        return self._forward
+
+    def _backward_ids(self):
+        if self._backward is None:
+            self._backward = []
+            if self.object_list and self.number > 1:
+                pp = self.paginator.per_page
+                first_id = self.object_list[0].id
+                self._backward = list(
+                    self.paginator.id_qs.filter(id__gt=first_id).order_by('id')
+                    .values_list('id', flat=True)[:pp * (WINDOW - 1) + 1]
+                )
+        return self._backward
+
+    def has_next(self):
+        return bool(self._forward_ids())
+
+    def has_previous(self):
+        return self.number > 1
+
+    def cursor_for(self, number):
+        """현재 페이지 기준 윈도우 안 페이지의 커서 (도달 불가하면 None)"""
+        pp = self.paginator.per_page
+        if number == self.number:
+            return encode_cursor(number, self.object_list[0].id + 1) if number > 1 and self.object_list else encode_cursor(1)
+        if number == 1:
+            return encode_cursor(1)
+        if number > self.number:
+            j = number - self.number
+            forward = self._forward_ids()
+            if len(forward) <= (j - 1) * pp:
+                return None
+            anchor = self.object_list[-1].id if j == 1 else forward[(j - 1) * pp - 1]
+            return encode_cursor(number, anchor)
+        j = self.number - number
+        backward = self._backward_ids()
+        if len(backward) <= j * pp:
+            return encode_cursor(1)
+        return encode_cursor(number, backward[j * pp])
+
+    @property
+    def next_cursor(self):
+        return self.cursor_for(self.number + 1) if self.has_next() else None
+
+    @property
+    def previous_cursor(self):
+        return self.cursor_for(self.number - 1) if self.has_previous() else None
+
+    @property
+    def last_cursor(self):
+        return encode_cursor(self.paginator.num_pages, "last")
+
+    def window_context(self):
+        """템플릿용 5개 페이지 번호 윈도우"""
+        num_pages = self.paginator.num_pages
+        cur = self.number
+        start = max(1, cur - 2)
+        end = min(num_pages, start + WINDOW - 1)
+        start = max(1, end - WINDOW + 1)
+
+        page_window = []
+        for num in range(start, end + 1):
+            cursor = self.cursor_for(num)
+            if cursor is None:
+                break
+            page_window.append({'number': num, 'cursor': cursor})
+        end = page_window[-1]['number'] if page_window else cur
+        # 윈도우 뒤에 실제로 더 있는지 (근사 count만 믿지 않음)
+        more_after = end < cur or len(self._forward_ids()) > (end - cur) * self.paginator.per_page
+
+        return {
+            'page_window': page_window,
+            'show_first': start > 1,
+            'show_last': more_after and end < num_pages,
+            'show_first_ellipsis': start > 2,
+            'show_last_ellipsis': more_after and end < (num_pages - 1),
+        }
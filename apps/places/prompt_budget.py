@@ -0,0 +1,123 @@
+"""
+추천 프롬프트의 여행지 리스트(trip_spot_list)를 토큰 예산 안으로 조립.
+
+개요 전문을 그대로 넣으면 프롬프트 길이가 개요 길이에 비례해 첫 토큰까지의 시간/비용이 커진다.
+행마다 (짧은 설명이 있으면 그것, 없으면 개요)를 문장 단위로 잘라 전체가 예산을 넘지 않게 맞춘다.
+토큰 수는 tiktoken(cl100k_base)으로 센다. HyperCLOVA 토크나이저와 정확히 같진 않지만 상대 비교용으로 충분하고,
+tiktoken이 없으면 글자 수 기반 근사치를 쓴다.
+"""
+import os
+import re
+
+from . import metrics
+
+TOKEN_BUDGET = int(os.getenv("RECO_PROMPT_TOKEN_BUDGET", "2500"))
+ITEM_MAX_TOKENS = int(os.getenv("RECO_SPOT_MAX_TOKENS", "120"))
+
+_encoder = None
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+|(?<=다\.)")
+
+
+def _get_encoder():
+    global _encoder
+    if _encoder is None:
+        try:
+            import tiktoken
+            _encoder = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            _encoder = False
+    return _encoder
+
+
+def count_tokens(text: str) -> int:
+    if not text:
+        return 0
+    enc = _get_encoder()
+    if enc:
+        return len(enc.encode(text, disallowed_special=()))
+    # 근사: 한글 1글자 ≈ 1토큰, 그 외 4글자 ≈ 1토큰
+    hangul = sum(1 for ch in text if "가" <= ch <= "힣")
+    return hangul + (len(text) - hangul + 3) // 4
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """max_tokens 이하로 자르되 가능하면 문장 경계에서 끊고 '…'를 붙인다"""
+    text = (text or "").strip()
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    # 문장 단위로 채울 수 있는 만큼
+    out, used = [], 0
+    for sent in (s.strip() for s in _SENTENCE_END.split(text)):
+        if not sent:
+            continue
+        n = count_tokens(sent)
+        if used + n > max_tokens:
+            break
+        out.append(sent)
+        used += n
+    if out:
+        return " ".join(out)
+
+    # 첫 문장부터 예산 초과 → 글자 단위 이분 탐색
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if count_tokens(text[:mid]) + 1 <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo].rstrip() + "…" if lo else ""
+
+
+def _describe(row):
+    return row.get("요약") or row.get("개요") or ""
+
+
+def build_trip_spot_list(rows, budget=None, item_max=None):
+    """
+    rows → (trip_spot_list 문자열, 통계 dict).
+    이름/주소/태그는 그대로 두고 설명만 줄인다. 설명이 짧은 행이 남긴 예산은 긴 행에 돌려준다.
+    """
+    budget = TOKEN_BUDGET if budget is None else budget
+    item_max = ITEM_MAX_TOKENS if item_max is None else item_max
+
+    heads, tails, descs = [], [], []
+    for r in rows:
+        heads.append(f"- {r['명칭']} ({r['주소']}): ")
+        tails.append(f" [태그: {', '.join(r['tags'])}]")
+        descs.append(_describe(r))
+
+    fixed = sum(count_tokens(h) + count_tokens(t) for h, t in zip(heads, tails)) + len(rows)
+    remaining = max(0, budget - fixed)
+    desc_tokens = [count_tokens(d) for d in descs]
+
+    # 설명이 짧은 순서로 공평 분배 (남은 예산 / 남은 행 수)
+    caps = [0] * len(rows)
+    order = sorted(range(len(rows)), key=lambda i: desc_tokens[i])
+    for pos, i in enumerate(order):
+        share = remaining // (len(order) - pos)
+        caps[i] = min(desc_tokens[i], item_max, share)
+        remaining -= caps[i]
+
+    lines, truncated = [], 0
+    for i in range(len(rows)):
+        desc = descs[i]
+        if desc_tokens[i] > caps[i]:
+            desc = truncate_to_tokens(desc, caps[i])
+            truncated += 1
+        lines.append(f"{heads[i]}{desc}{tails[i]}")
+    text = "\n".join(lines)
+
+    stats = {
+        "rows": len(rows),
+        "tokens": count_tokens(text),
+        "original_tokens": fixed + sum(desc_tokens),
+        "truncated": truncated,
+    }
+    metrics.observe("prompt.spot_list_tokens", stats["tokens"])
+    metrics.observe("prompt.spot_list_original_tokens", stats["original_tokens"])
+    metrics.incr("prompt.truncated_rows", truncated)
+    return text, stats
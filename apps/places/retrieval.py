@@ -0,0 +1,125 @@
+"""
+추천용 top-k 검색 라우터.
+
+백엔드를 순서대로(DB → FAISS) 시도하되, 백엔드마다 지연 예산(ms)을 두고
+느리거나 실패한 호출이 연속으로 쌓이면 서킷 브레이커가 열려 일정 시간 그 백엔드를 건너뛴다.
+(DB가 느려진 동안 매 요청이 DB 타임아웃까지 기다리지 않고 바로 인-프로세스 인덱스로 감)
+어떤 백엔드가 응답했는지는 metrics 에 retrieval.<backend>.* 로 남는다.
+"""
+import threading
+import time
+
+from . import metrics
+
+
+class CircuitBreaker:
+    """
+    closed → (연속 실패/지연 threshold회) → open → (cooldown초 후) half-open: 시험 호출 1건
+    시험 호출이 성공하면 closed, 실패하면 다시 open.
+    """
+
+    def __init__(self, name, threshold=3, cooldown=30.0):
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.cooldown:
+            return "half-open"
+        return "open"
+
+    def allow(self):
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial:
+                self._trial = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                print(f"[retrieval] {self.name} 브레이커 닫힘")
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.threshold:
+                if self._opened_at is None or self._trial:
+                    print(f"[retrieval] {self.name} 브레이커 열림 ({self.cooldown:.0f}초)")
+                self._opened_at = time.monotonic()
+                self._trial = False
+
+
+class Backend:
+    """
+    search(qvec, k, timeout_ms) → rows.
+    budget_ms(소프트): 넘겨 끝난 호출도 결과는 쓰되 브레이커에는 실패로 센다.
+    timeout_ms(하드, 예산보다 크게): 백엔드가 스스로 지킬 수 있으면 이 시간에 중단 (DB: statement_timeout).
+    None 이면 중단하지 않음.
+    """
+
+    def __init__(self, name, search, budget_ms, breaker=None, timeout_ms=None):
+        self.name = name
+        self.search = search
+        self.budget_ms = budget_ms
+        self.breaker = breaker
+        self.timeout_ms = timeout_ms
+
+
+class RetrievalRouter:
+    def __init__(self, backends):
+        self.backends = backends
+
+    def search(self, qvec, k):
+        """(rows, backend_name) — 모든 백엔드가 실패하면 RuntimeError"""
+        errors = []
+        for b in self.backends:
+            prefix = f"retrieval.{b.name}"
+            if b.breaker is not None and not b.breaker.allow():
+                metrics.incr(f"{prefix}.skipped")
+                errors.append(f"{b.name}: circuit open")
+                continue
+
+            t0 = time.perf_counter()
+            try:
+                rows = b.search(qvec, k, b.timeout_ms)
+            except Exception as e:
+                elapsed = (time.perf_counter() - t0) * 1000
+                metrics.incr(f"{prefix}.failed")
+                metrics.observe(prefix, elapsed)
+                if b.breaker is not None:
+                    b.breaker.record_failure()
+                print(f"[warn] {b.name} retrieval failed after {elapsed:.0f}ms: {e}")
+                errors.append(f"{b.name}: {e}")
+                continue
+
+            elapsed = (time.perf_counter() - t0) * 1000
+            metrics.observe(prefix, elapsed)
+            if b.budget_ms and elapsed > b.budget_ms:
+                metrics.incr(f"{prefix}.slow")
+                if b.breaker is not None:
+                    b.breaker.record_failure()
+            elif b.breaker is not None:
+                b.breaker.record_success()
+            metrics.incr(f"{prefix}.served")
+            return rows, b.name
+
+        metrics.incr("retrieval.exhausted")
+        raise RuntimeError("검색 백엔드가 모두 실패했습니다: " + "; ".join(errors))
@@ -0,0 +1,136 @@
+"""
+추천 결과 의미 캐시 (프로세스 내).
+
+"강원도 단풍 힐링" / "강원도에서 단풍 보며 힐링" 처럼 문장은 달라도 뜻이 같은 질문은
+쿼리 임베딩 코사인 유사도가 임계값 이상이고 추출된 지역이 같으면 캐시된 추천을 그대로 쓴다
+(추천 LLM 호출 생략). 항목 수가 작아서(수백 개) 정규화된 벡터 행렬에 대한 내적 한 번으로 찾는다.
+
+SEMANTIC_CACHE_LOG 경로를 주면 조회한 질문/지역/임베딩을 JSONL로 남기고,
+tune_semantic_cache 명령으로 임계값별 적중률/정확도를 확인할 수 있다.
+"""
+import json
+import os
+import re
+import threading
+import time
+
+from . import metrics
+
+THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_SIZE", "512"))
+TTL = int(os.getenv("SEMANTIC_CACHE_TTL", str(60 * 60 * 6)))
+LOG_PATH = os.getenv("SEMANTIC_CACHE_LOG", "")
+
+# 캐시에 저장하는 그래프 결과 키
+RESULT_KEYS = ("recommendations", "태그", "추천_장소명", "장소_태그맵")
+
+
+def normalize_region(region):
+    return re.sub(r"\s+", "", region or "")
+
+
+class SemanticCache:
+    def __init__(self, threshold=THRESHOLD, max_entries=MAX_ENTRIES, ttl=TTL):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._vectors = None   # np.ndarray (n, dim), 행마다 L2 정규화
+        self._entries = []     # [{"query", "region", "result", "created"}]
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _normalize(vec):
+        import numpy as np
+        v = np.asarray(vec, dtype=np.float32)
+        norm = float(np.linalg.norm(v))
+        return v / norm if norm else v
+
+    def lookup(self, vec, region):
+        """(entry, similarity) 또는 (None, 최고 유사도)"""
+        region = normalize_region(region)
+        with self._lock:
+            if not self._entries or self._vectors.shape[1] != len(vec):
+                return None, 0.0
+            sims = self._vectors @ self._normalize(vec)
+            now = time.time()
+            best_sim = 0.0
+            for i in sims.argsort()[::-1]:
+                sim = float(sims[i])
+                if sim < self.threshold:
+                    break
+                e = self._entries[i]
+                if now - e["created"] > self.ttl:
+                    continue
+                best_sim = max(best_sim, sim)
+                if e["region"] == region:
+                    return e, sim
+            return None, best_sim if best_sim else float(sims.max())
+
+    def add(self, vec, region, query, result):
+        import numpy as np
+        v = self._normalize(vec)[None, :]
+        entry = {
+            "query": query,
+            "region": normalize_region(region),
+            "result": {k: result.get(k) for k in RESULT_KEYS},
+            "created": time.time(),
+        }
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != v.shape[1]:
+                self._vectors, self._entries = v, [entry]
+                return
+            # 가장 오래된 항목부터 밀어냄
+            if len(self._entries) >= self.max_entries:
+                drop = len(self._entries) - self.max_entries + 1
+                self._vectors = self._vectors[drop:]
+                self._entries = self._entries[drop:]
+            self._vectors = np.vstack([self._vectors, v])
+            self._entries.append(entry)
+
+    def clear(self):
+        with self._lock:
+            self._vectors, self._entries = None, []
+
+
+_cache = None
+_log_lock = threading.Lock()
+
+
+def get_cache():
+    global _cache
+    if _cache is None:
+        _cache = SemanticCache()
+    return _cache
+
+
+def _log_query(query, region, vec):
+    if not LOG_PATH:
+        return
+    line = json.dumps({"query": query, "region": region, "embedding": [round(float(x), 6) for x in vec]},
+                      ensure_ascii=False)
+    try:
+        with _log_lock, open(LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError as e:
+        print(f"[warn] semantic cache log write failed: {e}")
+
+
+def lookup(query, region, vec):
+    """그래프에서 호출: 적중하면 캐시된 결과 dict, 아니면 None"""
+    _log_query(query, region, vec)
+    entry, sim = get_cache().lookup(vec, region)
+    metrics.observe("semantic_cache.similarity", sim)
+    if entry is None:
+        metrics.incr("semantic_cache.miss")
+        return None
+    metrics.incr("semantic_cache.hit")
+    print(f"[semantic-cache] hit {sim:.3f}: '{query}' ≈ '{entry['query']}'")
+    return dict(entry["result"])
+
+
+def store(query, region, vec, result):
+    if result.get("추천_장소명"):
+        get_cache().add(vec, region, query, result)
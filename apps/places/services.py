@@ -1,12 +1,14 @@
 import numpy as np
-from typing import List, Dict, Optional, Tuple
-from django.db.models import Q, Count
-from django.conf import settings
-from decouple import config
-import os
+from typing import List, Dict, Optional
 
 from .models import Place
-from apps.tags.models import Tag
+from . import llm_clients
+
+
+TAG_EXTRACTION_TEMPLATE = (
+    "다음 검색어에서 장소 추천에 관련된 키워드 태그를 3-5개 추출해주세요. "
+    "쉼표로 구분해서 답변하세요:\n{query}"
+)
 
 
 class VectorSearchService:
@@ -35,12 +37,10 @@ class VectorSearchService:
     def _init_embedding_model(self):
         """임베딩 모델 초기화 (OpenAI 또는 로컬 모델)"""
         try:
-            # OpenAI 사용 (기본)
-            api_key = config('OPENAI_API_KEY', default=None)
-            if api_key:
-                os.environ["OPENAI_API_KEY"] = api_key
-                from openai import OpenAI
-                self.client = OpenAI(api_key=api_key)
+            # OpenAI 사용 (기본, 프로세스 공용 클라이언트)
+            client = llm_clients.openai_client()
+            if client:
+                self.client = client
                 self.model_name = "text-embedding-3-small"
                 print("OpenAI 임베딩 모델 초기화 완료")
                 return
@@ -93,17 +93,9 @@ class VectorSearchService:
         """쿼리에서 태그 자동 추출 (LLM 사용)"""
         try:
             # ClovaX 사용 (기존 코드와 동일)
-            api_key = config("CLOVASTUDIO_API_KEY", default=None)
-            if api_key:
-                os.environ["CLOVASTUDIO_API_KEY"] = api_key
-                from langchain_naver import ChatClovaX
-                from langchain_core.prompts import PromptTemplate
-                
-                llm = ChatClovaX(model="HCX-005", temperature=0)
-                prompt = PromptTemplate.from_template(
-                    "다음 검색어에서 장소 추천에 관련된 키워드 태그를 3-5개 추출해주세요. "
-                    "쉼표로 구분해서 답변하세요:\n{query}"
-                )
+            if llm_clients.has_clova_key():
+                llm = llm_clients.chat_model("HCX-005", 0)
+                prompt = llm_clients.prompt(TAG_EXTRACTION_TEMPLATE)
                 out = (prompt | llm).invoke({"query": query})
                 tags_text = getattr(out, "content", str(out)).strip()
                 
@@ -155,8 +147,8 @@ class VectorSearchService:
     def calculate_popularity_score(self, place: Place) -> float:
         """인기도 점수 계산"""
         try:
-            # 좋아요 수 기반 인기도
-            like_count = place.placelikes.count()
+            # 좋아요 수 기반 인기도 (비정규화 카운터)
+            like_count = place.like_count
             
             # 리뷰 수 기반 인기도 (리뷰 모델이 있다면)
             review_count = 0
@@ -246,7 +238,6 @@ class VectorSearchService:
         # 벡터 유사도 검색
         try:
             # pgvector의 올바른 문법 사용
-            from django.db.models import F
             from pgvector.django import CosineDistance
             
             candidates = list(
@@ -1,13 +1,20 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
-from django.db.models import Exists, OuterRef, BooleanField, Value, Count, Q
+from django.db.models import F, Q
 from django.http import JsonResponse
 from urllib.parse import urlencode
-from django.core.paginator import Paginator
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from datetime import timedelta
 import recommend 
-from django.core.paginator import Paginator
-from .models import Place, PlaceLike, Tag
+from .models import Place, PlaceLike, RecommendationResult
+from .cache import cache_anonymous_list, cached_filter_tags, cached_list_count
+from .pagination import KeysetPaginator
+import hashlib
+import json
 import re
+import unicodedata
 
 RECO_TARGET = 6
 
@@ -174,56 +181,126 @@ def find_places_by_names(names):
 
 
 
-def with_like_meta(qs, user):
+def attach_like_meta(places, user):
     """
-    Place queryset에 like_count / is_liked 를 붙여준다.
-    PlaceLike.place 의 related_name 은 'placelikes' 라는 전제.
+    이미 가져온 Place 목록(한 페이지 분량)에 like_count / is_liked 를 붙여준다.
+    like_count 는 Place 컬럼(비정규화 카운터), is_liked 는 이 페이지 id들만 (user, place) 인덱스로 1번 조회.
     """
-    qs = qs.annotate(like_count=Count('placelikes', distinct=True))
-    if user.is_authenticated:
-        qs = qs.annotate(
-            is_liked=Exists(
-                PlaceLike.objects.filter(place=OuterRef('pk'), user=user)
-            )
-        )
-    else:
-        qs = qs.annotate(
-            is_liked=Value(False, output_field=BooleanField())
-        )
-    return qs
+    places = list(places)
+    liked_ids = set()
+    if user.is_authenticated and places:
+        liked_ids = set(PlaceLike.objects.filter(
+            user=user, place_id__in=[p.id for p in places]
+        ).values_list('place_id', flat=True))
+    for p in places:
+        p.is_liked = p.id in liked_ids
+    return places
+
+
+def _paginate_places(request, view_name, base_qs, per_page):
+    """
+    keyset(커서) 페이지네이션 + 5개 페이지 윈도우 컨텍스트.
+    1) 필터만 적용된 base_qs 에서 한 페이지만 가져오고 2) 그 페이지에만 좋아요 메타를 붙인다.
+    """
+    count = cached_list_count(view_name, request, base_qs)
+    page_obj = KeysetPaginator(
+        base_qs.prefetch_related('tags'), per_page, count, id_qs=base_qs
+    ).page_from_request(request)
+    attach_like_meta(page_obj.object_list, request.user)
 
+    # page/cursor 제외 쿼리스트링
+    q = request.GET.copy()
+    q.pop('page', None)
+    q.pop('cursor', None)
+    base_qs_str = q.urlencode()
 
-def build_context_from_cached(prompt, followup, cached, user):
-    recommended_places = []
-    recommendations = cached.get('recommendations', []) or []
-    question = cached.get('question', '') or ''
-    show_followup = bool(question)
+    return {
+        'places': page_obj,             # KeysetPage 객체
+        'base_qs': base_qs_str,
+        'base_prefix': f"?{base_qs_str}&" if base_qs_str else "?",   # 템플릿에서 한 줄로 사용
+        **page_obj.window_context(),
+    }
 
-    parsed_recs = parse_recommendations(recommendations)
-    reason_by_norm = {_norm_name(r["name"]): (r.get("reason") or "") for r in parsed_recs if r.get("name")}
-    tip_by_norm    = {_norm_name(r["name"]): (r.get("tip")    or "") for r in parsed_recs if r.get("name")}
-    names = [r["name"] for r in parsed_recs if r.get("name")]
 
-    candidates_qs = with_like_meta(find_places_by_names(names), user)
-    candidates = list(candidates_qs)  
+def _reco_key(prompt, followup):
+    """(prompt, followup) 내용 해시. 공백/유니코드 정규화 차이로 캐시가 빗나가지 않도록 정규화 후 해시"""
+    def norm(s):
+        return " ".join(unicodedata.normalize("NFC", s or "").split())
+    raw = json.dumps([norm(prompt), norm(followup)], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
-    name_index = {p.name: p for p in candidates}
-    lower_index = [(p.name.lower(), p) for p in candidates]
 
-    for rec in parsed_recs:
-        nm = rec["name"]
-        nm_norm = _norm_name(nm)
-        place = name_index.get(nm) or next((p for name_l, p in lower_index if nm.lower() in name_l), None)
-        if place and not any(x["place"].pk == place.pk for x in recommended_places):
-            recommended_places.append({"place": place, "reason": reason_by_norm.get(nm_norm, ""), "tip": tip_by_norm.get(_norm_name(nm), "")})
+RECO_PRUNE_INTERVAL = 60 * 60  # 만료된 추천 결과 정리 주기(초)
+
+
+def _reco_fresh_since():
+    return timezone.now() - timedelta(seconds=getattr(settings, "RECO_RESULT_TTL", 86400))
+
+
+def find_stored_recommendation(prompt, followup):
+    """TTL 안에 저장된 추천 결과가 있으면 반환 (없으면 None)"""
+    if not prompt:
+        return None
+    return RecommendationResult.objects.filter(
+        key=_reco_key(prompt, followup), created_at__gte=_reco_fresh_since()
+    ).first()
+
+
+def find_recommendation_by_rid(rid):
+    """main() 리다이렉트의 rid 로 저장된 결과 조회 (TTL 이 지난 결과는 None)"""
+    if not rid:
+        return None
+    return RecommendationResult.objects.filter(key=rid, created_at__gte=_reco_fresh_since()).first()
+
+
+def prune_recommendations():
+    """TTL 이 지난 추천 결과 삭제 (저장 시 호출, 공유 캐시 표시로 주기당 1번만 실행)"""
+    if not cache.add("places:reco:pruned", 1, RECO_PRUNE_INTERVAL):
+        return 0
+    deleted, _ = RecommendationResult.objects.filter(created_at__lt=_reco_fresh_since()).delete()
+    return deleted
+
+
+def store_recommendation(prompt, followup, context):
+    """추천 결과(해결된 place id + 이유/팁)를 저장. 모델 호출이 실패한 빈 결과는 저장하지 않음"""
+    if not prompt or not (context.get('recommended_places') or context.get('question')):
+        return None
+    items = [
+        {"place_id": rec["place"].id, "reason": rec.get("reason", ""), "tip": rec.get("tip", "")}
+        for rec in context.get('recommended_places', [])
+    ]
+    reco, _ = RecommendationResult.objects.update_or_create(
+        key=_reco_key(prompt, followup),
+        defaults={
+            'prompt': prompt,
+            'followup': followup or "",
+            'question': context.get('question', '') or "",
+            'recommendations': context.get('recommendations', []) or [],
+            'items': items,
+            'created_at': timezone.now(),
+        },
+    )
+    prune_recommendations()
+    return reco
+
+
+def build_context_from_stored(reco, user):
+    """저장된 추천 결과로 컨텍스트 구성 (PK 조회 1회, LLM 호출 없음)"""
+    ids = [it["place_id"] for it in reco.items]
+    by_id = {p.id: p for p in attach_like_meta(Place.objects.filter(id__in=ids), user)}
+
+    recommended_places = [
+        {"place": by_id[it["place_id"]], "reason": it.get("reason", ""), "tip": it.get("tip", "")}
+        for it in reco.items if it["place_id"] in by_id
+    ]
 
     return {
-        'prompt': prompt,
-        'followup': followup,
+        'prompt': reco.prompt,
+        'followup': reco.followup,
         'recommended_places': recommended_places,
-        'recommendations': recommendations,
-        'question': question,
-        'show_followup': show_followup,
+        'recommendations': reco.recommendations,
+        'question': reco.question,
+        'show_followup': bool(reco.question),
     }
 
 def get_recommendation_context(prompt, followup, user):
@@ -235,7 +312,7 @@ def get_recommendation_context(prompt, followup, user):
 
     user_input = f"{prompt} {followup}" if followup else prompt
     try:
-        result = recommend.app.invoke({"user_input": user_input}) or {}
+        result = recommend.get_app().invoke({"user_input": user_input}) or {}
     except Exception:
         result = {}
 
@@ -257,9 +334,8 @@ def get_recommendation_context(prompt, followup, user):
     tip_by_norm    = {_norm_name(r["name"]): (r.get("tip")    or "") for r in parsed_recs if r.get("name")}
 
 
-    candidates = find_places_by_names(names)
-    like_annotated = list(with_like_meta(Place.objects.filter(id__in=[p.id for p in candidates]), user))
-    by_id = {p.id: p for p in like_annotated}
+    candidates = attach_like_meta(find_places_by_names(names), user)
+    by_id = {p.id: p for p in candidates}
 
     used = set()
     for nm in names:
@@ -276,7 +352,7 @@ def get_recommendation_context(prompt, followup, user):
 
     # 부족하면 채우기(이유는 빈 문자열 그대로)
     if len(recommended_places) < RECO_TARGET:
-        remain = [p for p in like_annotated if p.id not in used]
+        remain = [p for p in candidates if p.id not in used]
         remain.sort(key=lambda x: getattr(x, "like_count", 0), reverse=True)
         for p in remain:
             recommended_places.append({"place": p, "reason": "", "tip": ""})
@@ -294,6 +370,7 @@ def get_recommendation_context(prompt, followup, user):
         'show_followup': show_followup,
     }
 
+@cache_anonymous_list('main')
 def main(request):
     prompt = request.GET.get('prompt', '')
     followup = request.GET.get('followup', '')
@@ -321,62 +398,26 @@ def main(request):
             # 2차: 합집합
             qs = qs.filter(tags__name__in=selected).distinct()
 
-    # 태그/좋아요 메타
-    qs = qs.prefetch_related('tags')
-    qs = with_like_meta(qs, request.user)
-
-    # 페이지네이션
-    paginator = Paginator(qs, 21)
-    page_obj = paginator.get_page(request.GET.get('page'))
+    # 태그/좋아요 메타 + 페이지네이션
+    list_ctx = _paginate_places(request, 'main', qs, 21)
 
-    # page 제외 쿼리스트링
-    q = request.GET.copy()
-    q.pop('page', None)
-    base_qs = q.urlencode()
-    base_prefix = f"?{base_qs}&" if base_qs else "?"   # 템플릿에서 한 줄로 사용
-
-    # === 페이지 번호 윈도우(5개) ===
-    num_pages = page_obj.paginator.num_pages
-    cur = page_obj.number
-    window = 5
-    start = max(1, cur - 2)
-    end = min(num_pages, start + window - 1)
-    start = max(1, end - window + 1)
-
-    page_window = range(start, end + 1)
-    show_first = start > 1
-    show_last = end < num_pages
-    show_first_ellipsis = start > 2
-    show_last_ellipsis = end < (num_pages - 1)
-
-    # 모델 호출 1회
-    context = get_recommendation_context(prompt, followup, request.user)
-
-    # 세션 저장
-    request.session['last_reco'] = {
-        'prompt': prompt,
-        'followup': followup,
-        'question': context.get('question', ''),
-        'recommendations': context.get('recommendations', []),
-    }
+    # 모델 호출 1회 (같은 prompt/followup 결과가 저장돼 있으면 재사용)
+    reco = find_stored_recommendation(prompt, followup)
+    if reco:
+        context = build_context_from_stored(reco, request.user)
+    else:
+        context = get_recommendation_context(prompt, followup, request.user)
+        reco = store_recommendation(prompt, followup, context)
 
     # 컨텍스트
     context.update({
-        'places': page_obj,             # Page 객체
-        'base_qs': base_qs,
-        'base_prefix': base_prefix,     # "?...&" 또는 "?"
+        **list_ctx,
         'prompt': prompt,
         'followup': followup,
         'place_class': class_filter,
-        'tags': Tag.objects.order_by('name'),
+        'tags': cached_filter_tags(),
         'match': match_mode,            # 'any' or 'all'
         'selected_tags': selected,
-        # 페이지네이션 창 관련
-        'page_window': page_window,
-        'show_first': show_first,
-        'show_last': show_last,
-        'show_first_ellipsis': show_first_ellipsis,
-        'show_last_ellipsis': show_last_ellipsis,
     })
 
     # 추천 결과 라우팅
@@ -384,6 +425,8 @@ def main(request):
         redir_q = {'prompt': prompt}
         if followup:
             redir_q['followup'] = followup
+        if reco:
+            redir_q['rid'] = reco.key
         return redirect(f"/search/?{urlencode(redir_q)}")
 
     return render(request, 'places/main.html', context)
@@ -393,14 +436,20 @@ def search(request):
     prompt = request.GET.get('prompt', '')
     followup = request.GET.get('followup', '')
 
-    sess = request.session.get('last_reco')
-    if sess and sess.get('prompt') == prompt and sess.get('followup') == followup:
-        context = build_context_from_cached(prompt, followup, sess, request.user)
+    # main()에서 넘어온 경우: rid로 저장된 결과만 렌더링 (모델 재호출 없음)
+    reco = find_recommendation_by_rid(request.GET.get('rid', ''))
+    if reco is None:
+        reco = find_stored_recommendation(prompt, followup)
+
+    if reco:
+        context = build_context_from_stored(reco, request.user)
     else:
         context = get_recommendation_context(prompt, followup, request.user)
+        store_recommendation(prompt, followup, context)
 
     return render(request, 'search.html', context)
 
+@cache_anonymous_list('place_search')
 def place_search(request):
     """장소명으로 직접 검색하는 페이지"""
     query = request.GET.get('q', '')
@@ -443,49 +492,17 @@ def place_search(request):
             # 2차: 합집합
             qs = qs.filter(tags__name__in=selected).distinct()
     
-    # 태그/좋아요 메타데이터 추가
-    qs = qs.prefetch_related('tags')
-    qs = with_like_meta(qs, request.user)
-    
-    # 페이지네이션
-    paginator = Paginator(qs, 21)
-    page_obj = paginator.get_page(request.GET.get('page'))
-    
-    # page 제외 쿼리스트링
-    q = request.GET.copy()
-    q.pop('page', None)
-    base_qs = q.urlencode()
-    base_prefix = f"?{base_qs}&" if base_qs else "?"   # 템플릿에서 한 줄로 사용
-
-    # === 페이지 번호 윈도우(5개) ===
-    num_pages = page_obj.paginator.num_pages
-    cur = page_obj.number
-    window = 5
-    start = max(1, cur - 2)
-    end = min(num_pages, start + window - 1)
-    start = max(1, end - window + 1)
-
-    page_window = range(start, end + 1)
-    show_first = start > 1
-    show_last = end < num_pages
-    show_first_ellipsis = start > 2
-    show_last_ellipsis = end < (num_pages - 1)
+    # 태그/좋아요 메타데이터 추가 + 페이지네이션
+    list_ctx = _paginate_places(request, 'place_search', qs, 21)
     
     # 태그 목록 (필터용) - 메인 화면과 동일하게
-    tags = Tag.objects.order_by('name')
+    tags = cached_filter_tags()
     
     context = {
+        **list_ctx,
         'query': query,
-        'places': page_obj,
         'tags': tags,
         'is_place_search': True,  # 템플릿에서 구분용
-        'base_qs': base_qs,
-        'base_prefix': base_prefix,
-        'page_window': page_window,
-        'show_first': show_first,
-        'show_last': show_last,
-        'show_first_ellipsis': show_first_ellipsis,
-        'show_last_ellipsis': show_last_ellipsis,
         'place_class': class_filter,  # 카테고리 필터 상태
         'selected_tags': selected,   # 선택된 태그들
         'match': match_mode,         # 태그 매칭 모드
@@ -495,23 +512,20 @@ def place_search(request):
     return render(request, 'places/place_search.html', context)
 
 def place_detail(request, pk):
-    base = Place.objects.filter(pk=pk)
-    if request.user.is_authenticated:
-        base = base.annotate(
-            is_liked=Exists(PlaceLike.objects.filter(user=request.user, place=OuterRef('pk'))),
-            like_count=Count('placelikes', distinct=True),
-        )
-    else:
-        base = base.annotate(
-            is_liked=Value(False, output_field=BooleanField()),
-            like_count=Count('placelikes', distinct=True),
-        )
-    place = get_object_or_404(base)
+    place = get_object_or_404(Place, pk=pk)
+    attach_like_meta([place], request.user)
     return render(request, 'places/place_detail.html', {'place': place})
 
 from django.views.decorators.http import require_POST
 from django.db import IntegrityError, transaction
 
+def _bump_like_count(place_id, delta):
+    """찜 수 카운터를 DB에서 원자적으로 증감 (0 미만 방지)"""
+    if delta > 0:
+        Place.objects.filter(pk=place_id).update(like_count=F('like_count') + delta)
+    else:
+        Place.objects.filter(pk=place_id, like_count__gte=-delta).update(like_count=F('like_count') + delta)
+
 @login_required
 @require_POST
 def toggle_place_like(request, pk):
@@ -521,7 +535,7 @@ def toggle_place_like(request, pk):
     # AJAX 판별 (Django 4+)
     is_ajax = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
 
-    # 토글 (경쟁조건 안전)
+    # 토글 (경쟁조건 안전) + 찜 수 카운터 원자적 증감
     try:
         with transaction.atomic():
             obj, created = PlaceLike.objects.get_or_create(user=user, place=place)
@@ -530,19 +544,23 @@ def toggle_place_like(request, pk):
             else:
                 obj.delete()
                 liked = False
+            _bump_like_count(place.pk, 1 if liked else -1)
     except IntegrityError:
         # 극히 드문 경쟁 상황 방지용 리트라이
-        liked = PlaceLike.objects.filter(user=user, place=place).exists()
-        if liked:
-            PlaceLike.objects.filter(user=user, place=place).delete()
-            liked = False
-        else:
-            PlaceLike.objects.create(user=user, place=place)
-            liked = True
+        with transaction.atomic():
+            deleted, _ = PlaceLike.objects.filter(user=user, place=place).delete()
+            if deleted:
+                liked = False
+            else:
+                PlaceLike.objects.create(user=user, place=place)
+                liked = True
+            _bump_like_count(place.pk, 1 if liked else -1)
+
+    # 익명 목록 캐시에는 찜 수/찜 여부가 없으므로 목록 버전을 올리지 않음
 
     data = {
         'liked': liked,
-        'like_count': PlaceLike.objects.filter(place=place).count(),
+        'like_count': Place.objects.values_list('like_count', flat=True).get(pk=place.pk),
         'place_id': place.id,
     }
 
@@ -551,6 +569,7 @@ def toggle_place_like(request, pk):
 
     return redirect('places:place_detail', pk=place.id)
 
+@cache_anonymous_list('place_list_fragment')
 def place_list_fragment(request):
     # 원래 main()의 필터 부분 거의 그대로 복사
     class_filter = request.GET.get('place_class', '')
@@ -571,11 +590,6 @@ def place_list_fragment(request):
         else:
             qs = qs.filter(tags__name__in=selected).distinct()
 
-    qs = with_like_meta(qs, request.user)
-
-    paginator = Paginator(qs, 20)
-    page_obj = paginator.get_page(request.GET.get('page'))
+    list_ctx = _paginate_places(request, 'place_list_fragment', qs, 20)
 
-    return render(request, 'places/_place_items.html', {
-        'places': page_obj,
-    })
\ No newline at end of file
+    return render(request, 'places/_place_items.html', list_ctx)
\ No newline at end of file
@@ -3,7 +3,7 @@ from django.contrib import admin
 # Register your models here.
 # apps/reviews/admin.py
 from django.contrib import admin
-from .models import Review, ReviewPhoto
+from .models import Review, ReviewPhoto, ReviewSummaryJob
 
 class ReviewPhotoInline(admin.TabularInline):
     model = ReviewPhoto
@@ -20,3 +20,9 @@ class ReviewAdmin(admin.ModelAdmin):
 class ReviewPhotoAdmin(admin.ModelAdmin):
     list_display = ('id', 'review', 'image')
     search_fields = ('image',)
+
+@admin.register(ReviewSummaryJob)
+class ReviewSummaryJobAdmin(admin.ModelAdmin):
+    list_display = ('place', 'full', 'run_after', 'locked_until', 'attempts')
+    list_filter = ('full',)
+    search_fields = ('place__name', 'last_error')
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class ReviewsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.reviews'
+
+    def ready(self):
+        from django.db.models.signals import post_delete
+        from .models import ReviewPhoto
+        from .thumbnails import delete_photo_files
+
+        post_delete.connect(delete_photo_files, sender=ReviewPhoto, dispatch_uid="reviews.delete_photo_files")
@@ -0,0 +1,204 @@
+"""
+장소별 네이버 블로그 후기 캐시.
+
+- 신선(BLOG_CACHE_TTL) 이내: 캐시만 읽음 (외부 호출 0)
+- stale(BLOG_CACHE_STALE_TTL) 이내: 캐시를 바로 돌려주고 백그라운드 스레드에서 갱신 (stale-while-revalidate)
+- 없음: 그 자리에서 조회 후 저장
+조회 시 우선 쿼리(앞쪽 PRIMARY_QUERIES개)를 먼저 동시에 보내고, 10건이 안 모일 때만 나머지 폴백 쿼리를 보낸다.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.places import metrics
+from .link_filter import PlaceNameMatcher, is_allowed_link, link_key
+
+BLOG_CACHE_VERSION = 1
+NAVER_BLOG_URL = "https://openapi.naver.com/v1/search/blog.json"
+MAX_ITEMS = 10
+PRIMARY_QUERIES = 2  # 첫 묶음으로 보내는 쿼리 수 (대부분 여기서 10건이 채워짐)
+
+_session = requests.Session()
+
+
+class BlogFetchError(Exception):
+    """API가 정상 응답(200)을 하나도 주지 못함 — 빈 결과로 캐시하면 안 되는 경우"""
+
+
+def blog_cache_key(place_id):
+    return f"reviews:blog:v{BLOG_CACHE_VERSION}:{place_id}"
+
+
+def build_queries(name, city):
+    # 폴백 쿼리 세트 (점점 완화, 앞쪽일수록 우선)
+    return [
+        f"\"{name}\" {city} 후기",
+        f"{name} {city} 후기",
+        f"{name} 후기",
+        f"{name} 여행기",
+        f"{name} 방문기",
+    ]
+
+
+def _search(query):
+    headers = {
+        "X-Naver-Client-Id": settings.NAVER_CLIENT_ID,
+        "X-Naver-Client-Secret": settings.NAVER_CLIENT_SECRET,
+    }
+    params = {"query": query, "display": 30, "start": 1, "sort": "sim"}  # 정확도 우선
+    metrics.incr("blog.api_calls")
+    r = _session.get(NAVER_BLOG_URL, params=params, headers=headers, timeout=5)
+    r.raise_for_status()
+    return r.json().get("items", [])
+
+
+def _filter_items(items, matcher):
+    out = []
+    for it in items:
+        title = it.get("title", "")
+        desc = it.get("description", "")
+        link = it.get("link", "")
+
+        if not is_allowed_link(link):
+            continue
+        if not matcher.matches(title + " " + desc):
+            continue
+
+        out.append({
+            "title": title, "link": link,
+            "summary": desc,
+            "blogger": it.get("bloggername", ""),
+            "postdate": it.get("postdate", ""),
+        })
+    return out
+
+
+def _merge(per_query):
+    """쿼리 우선순위 순서로 합치고 링크 기준 중복 제거 (모바일/PC 링크는 같은 글로 봄)"""
+    seen, dedup = set(), []
+    for items in per_query:
+        for x in items:
+            key = link_key(x["link"])
+            if key in seen:
+                continue
+            seen.add(key)
+            dedup.append(x)
+    return dedup
+
+
+def fetch_blog_items(name, city):
+    """
+    쿼리를 두 묶음으로 보낸다: 우선 쿼리들을 동시에 보내고, MAX_ITEMS건이 안 모였을 때만 나머지 폴백 쿼리들.
+    묶음 안에서는 완료된 '앞쪽 연속 쿼리'만으로 MAX_ITEMS건이 모이면 바로 반환
+    (순차 실행 때와 같은 우선순위 결과를 유지하면서 남은 쿼리는 기다리지 않음).
+    """
+    queries = build_queries(name, city)
+    matcher = PlaceNameMatcher(name)  # 장소명 정규화는 요청당 1번
+    results = [None] * len(queries)
+    errors = []
+    waves = [range(0, PRIMARY_QUERIES), range(PRIMARY_QUERIES, len(queries))]
+    pool = ThreadPoolExecutor(max_workers=max(len(w) for w in waves))
+    try:
+        for wave in waves:
+            futures = {pool.submit(_search, queries[i]): i for i in wave}
+            for fut in as_completed(futures):
+                i = futures[fut]
+                try:
+                    results[i] = _filter_items(fut.result(), matcher)
+                except requests.RequestException as e:
+                    errors.append(e)
+                    results[i] = []
+
+                prefix = []
+                for r in results:
+                    if r is None:
+                        break
+                    prefix.append(r)
+                merged = _merge(prefix)
+                if len(merged) >= MAX_ITEMS:
+                    return merged[:MAX_ITEMS]
+        merged = _merge(r for r in results if r is not None)[:MAX_ITEMS]
+        # 오류가 섞인 빈 결과는 "후기 없음"이 아니라 조회 실패 (타임아웃/5xx/쿼터 초과)
+        if not merged and errors:
+            raise BlogFetchError(f"{len(errors)}/{len(queries)} 쿼리 실패: {errors[-1]}")
+        return merged
+    finally:
+        pool.shutdown(wait=False)
+
+
+def get_cached(place_id):
+    """캐시 항목 {"items", "fetched_at", "fresh_for"} 또는 None"""
+    return cache.get(blog_cache_key(place_id))
+
+
+def is_fresh(entry):
+    return entry is not None and time.time() - entry["fetched_at"] < entry["fresh_for"]
+
+
+def refresh(place_id, name, city):
+    """조회 실패 시 BlogFetchError — 기존 캐시 항목은 건드리지 않는다"""
+    items = fetch_blog_items(name, city)
+    fresh_for = settings.BLOG_CACHE_TTL if items else settings.BLOG_CACHE_EMPTY_TTL
+    entry = {"items": items, "fetched_at": time.time(), "fresh_for": fresh_for}
+    cache.set(blog_cache_key(place_id), entry, fresh_for + settings.BLOG_CACHE_STALE_TTL)
+    return entry
+
+
+def _refresh_in_background(place_id, name, city):
+    # 같은 장소 갱신은 한 번만 (워커 간에도 cache.add 로 잠금)
+    lock_key = f"{blog_cache_key(place_id)}:refreshing"
+    if not cache.add(lock_key, 1, 60):
+        return
+
+    def run():
+        try:
+            refresh(place_id, name, city)
+        except Exception as e:
+            # 기존(stale) 항목을 그대로 두고 다음 조회 때 다시 시도
+            print(f"[warn] blog cache refresh failed for place {place_id}, keeping stale entry: {e}")
+        finally:
+            cache.delete(lock_key)
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+HITS_TTL = 60 * 60 * 24 * 7
+
+
+def hits_key(place_id):
+    return f"reviews:blog:hits:{place_id}"
+
+
+def record_hit(place_id):
+    """최근 조회 수(근사, 첫 조회 후 7일 유지) — prewarm_blog_cache 우선순위용"""
+    key = hits_key(place_id)
+    if not cache.add(key, 1, HITS_TTL):
+        try:
+            cache.incr(key)
+        except ValueError:
+            pass
+
+
+def get_blog_items(place_id, load_place):
+    """
+    load_place() → (name, city) 는 캐시 미스/stale 일 때만 호출 (신선한 캐시면 DB 조회도 없음).
+    """
+    record_hit(place_id)
+    entry = get_cached(place_id)
+    if is_fresh(entry):
+        return entry["items"]
+
+    name, city = load_place()
+    if entry is not None:
+        _refresh_in_background(place_id, name, city)
+        return entry["items"]
+    try:
+        return refresh(place_id, name, city)["items"]
+    except BlogFetchError as e:
+        # 캐시하지 않고 빈 목록만 응답 (다음 요청에서 다시 조회)
+        print(f"[warn] blog fetch failed for place {place_id}: {e}")
+        return []
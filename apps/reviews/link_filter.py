@@ -0,0 +1,111 @@
+"""
+블로그 검색 결과 필터/중복 제거 엔진 (모듈 로드 시 한 번만 컴파일).
+
+- 허용/차단 도메인: URL에서 호스트만 잘라 호스트와 상위 도메인을 frozenset 으로 조회 (도메인 수와 무관하게 O(라벨 수)),
+  호스트별 판정은 메모해 두고 재사용
+- 경로 차단 패턴: 모든 패턴을 하나의 정규식으로 합쳐 한 번만 훑음
+- 장소명: 요청당 한 번 정규화해 두고, 원문에 그대로 있으면 정규화 없이 통과 (대부분의 항목)
+- 중복: m. 접두사/스킴/끝 슬래시를 뺀 정규화 링크 기준
+"""
+import re
+
+ALLOWED_DOMAINS = frozenset((
+    "blog.naver.com", "post.naver.com", "naver.me",
+    "tistory.com", "brunch.co.kr", "velog.io",
+))
+BLOCKED_DOMAINS = frozenset((
+    "smartstore.naver.com", "shopping.naver.com", "brand.naver.com", "news.naver.com",
+))
+BLOCKED_PATH_PATTERNS = ("/product/", "/category/", "/ads", "/event")
+
+_BLOCKED_PATH_RE = re.compile("|".join(re.escape(p) for p in BLOCKED_PATH_PATTERNS))
+
+# 괄호/공백/특수문자 제거 (기존과 같은 문자 집합)
+_STRIP_RE = re.compile(r"[\s\(\)\[\]\{\}\-_/·•~!@#$%^&*=+|:;\"'<>?,.]+")
+
+# 호스트별 판정 캐시 (검색 결과 호스트는 몇 종류뿐이라 거의 항상 적중)
+_host_verdicts = {}
+_HOST_CACHE_MAX = 4096
+
+
+def _domain_suffixes(host):
+    """a.b.tistory.com → a.b.tistory.com, b.tistory.com, tistory.com, com"""
+    parts = host.split(".")
+    return (".".join(parts[i:]) for i in range(len(parts)))
+
+
+def _split_url(link):
+    """(호스트, 경로+쿼리) — urlsplit 보다 가벼운 최소 파싱"""
+    i = link.find("//")
+    if i == -1:
+        return "", ""
+    host, sep, rest = link[i + 2:].partition("/")
+    if "?" in host or "#" in host:
+        host, _, extra = host.replace("#", "?").partition("?")
+        rest = "?" + extra + sep + rest
+    else:
+        rest = sep + rest
+    if "#" in rest:
+        rest = rest.split("#", 1)[0]
+    if "@" in host or ":" in host:
+        host = host.rsplit("@", 1)[-1].split(":", 1)[0]
+    return host, rest
+
+
+def _host_allowed(host):
+    verdict = _host_verdicts.get(host)
+    if verdict is None:
+        verdict = False
+        for suffix in _domain_suffixes(host):
+            if suffix in BLOCKED_DOMAINS:
+                verdict = False
+                break
+            if suffix in ALLOWED_DOMAINS:
+                verdict = True
+        if len(_host_verdicts) < _HOST_CACHE_MAX:
+            _host_verdicts[host] = verdict
+    return verdict
+
+
+def is_allowed_link(link: str) -> bool:
+    host, rest = _split_url((link or "").strip().lower())
+    if not host or not _host_allowed(host):
+        return False
+    return _BLOCKED_PATH_RE.search(rest) is None
+
+
+def normalize_text(text: str) -> str:
+    return _STRIP_RE.sub("", text or "")
+
+
+def link_key(link: str) -> str:
+    """중복 판정용 링크 (모바일/PC, http/https, 끝 슬래시 차이 무시)"""
+    host, rest = _split_url((link or "").strip())
+    if not host:
+        return link or ""
+    host = host.lower()
+    if host.startswith("m."):
+        host = host[2:]
+    path, _, query = rest.partition("?")
+    key = host + path.rstrip("/")
+    return f"{key}?{query}" if query else key
+
+
+class PlaceNameMatcher:
+    """장소명 느슨한 포함 검사 (이름 정규화는 생성 시 1회)"""
+
+    def __init__(self, place_name):
+        n = normalize_text(place_name)
+        self.name = n
+        # 이름이 너무 짧으면(2자 이하) 오탐 많으니 본문 길이도 확인
+        self.short = len(n) <= 2
+        self.prefix = n[: max(3, len(n) // 2)]
+
+    def matches(self, text: str) -> bool:
+        # 정규화된 이름엔 제거 대상 문자가 없으므로 원문에 그대로 있으면 정규화 후에도 있음
+        if not self.short and self.name and (self.name in text or self.prefix in text):
+            return True
+        t = normalize_text(text)
+        if self.short:
+            return self.name in t and len(t) > 10
+        return self.name in t or self.prefix in t
@@ -0,0 +1,150 @@
+import json
+import random
+import re
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.reviews import blog_cache
+from apps.reviews.link_filter import PlaceNameMatcher, is_allowed_link, link_key
+
+# === 비교 기준: 이전 blog_reviews 구현 그대로 ===
+LEGACY_BLACKLIST_SUBSTR = (
+    "smartstore.naver.com", "shopping.naver.com", "brand.naver.com",
+    "/product/", "/category/", "/ads", "/event", "news.naver.com"
+)
+
+
+def legacy_is_allowed_link(link):
+    url = (link or "").lower()
+    if any(b in url for b in LEGACY_BLACKLIST_SUBSTR):
+        return False
+    return any(d in url for d in (
+        "blog.naver.com", "m.blog.naver.com",
+        "post.naver.com", "naver.me",
+        "tistory.com", "brunch.co.kr", "velog.io"
+    ))
+
+
+def legacy_loose_contains(text, place_name):
+    def norm(s): return re.sub(r"[\s\(\)\[\]\{\}\-_/·•~!@#$%^&*=+|:;\"'<>?,.]+", "", s or "")
+    t = norm(text)
+    n = norm(place_name)
+    if len(n) <= 2:
+        return n in t and len(t) > 10
+    return (n in t) or (n[: max(3, len(n)//2)] in t)
+
+
+def legacy_filter(items, place_name):
+    seen, out = set(), []
+    for it in items:
+        link = it.get("link", "")
+        if not legacy_is_allowed_link(link):
+            continue
+        if not legacy_loose_contains(it.get("title", "") + " " + it.get("description", ""), place_name):
+            continue
+        if link in seen:
+            continue
+        seen.add(link)
+        out.append(link)
+    return out
+
+
+def new_filter(items, place_name):
+    matcher = PlaceNameMatcher(place_name)
+    seen, out = set(), []
+    for it in items:
+        link = it.get("link", "")
+        if not is_allowed_link(link):
+            continue
+        if not matcher.matches(it.get("title", "") + " " + it.get("description", "")):
+            continue
+        key = link_key(link)
+        if key in seen:
+            continue
+        seen.add(key)
+        out.append(link)
+    return out
+
+
+def synthetic_payloads(n, seed=0):
+    """기록된 페이로드가 없을 때 쓰는 가짜 응답 (장소당 150건, 도메인/본문 분포는 실제와 비슷하게)"""
+    rng = random.Random(seed)
+    names = ["경복궁", "해운대해수욕장", "남산서울타워", "전주한옥마을", "성산일출봉(제주)", "불국사"]
+    hosts = ["blog.naver.com", "m.blog.naver.com", "post.naver.com", "abc.tistory.com", "brunch.co.kr",
+             "smartstore.naver.com", "news.naver.com", "cafe.naver.com", "example.com"]
+    payloads = []
+    for i in range(n):
+        name = names[i % len(names)]
+        items = []
+        for j in range(150):
+            host = rng.choice(hosts)
+            path = rng.choice(["/user/2234{}".format(j), "/product/1", "/event/2", "/user/{}/".format(j % 40)])
+            body = rng.choice([f"<b>{name}</b> 다녀온 후기", f"{name[:2]} 근처 맛집", "주말 나들이 기록 " * 5])
+            items.append({"title": body, "description": body * 3, "link": f"https://{host}{path}"})
+        payloads.append({"place": name, "items": items})
+    return payloads
+
+
+class Command(BaseCommand):
+    help = "블로그 링크 필터/중복 제거: 이전 구현 대비 속도/결과 비교 (기록된 API 응답 또는 합성 데이터)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--payload", help="기록된 응답 JSON: [{\"place\": 장소명, \"items\": [...]}]")
+        parser.add_argument("--record", help="실제 API 응답을 이 경로에 기록 (--places 와 함께)")
+        parser.add_argument("--places", help="기록할 장소명 (쉼표 구분)")
+        parser.add_argument("--synthetic", type=int, default=50, help="페이로드가 없을 때 합성 장소 수")
+        parser.add_argument("--repeat", type=int, default=20, help="측정 반복 횟수")
+
+    def handle(self, *args, **opts):
+        if opts.get("record"):
+            return self._record(opts)
+
+        if opts.get("payload"):
+            try:
+                with open(opts["payload"], encoding="utf-8") as f:
+                    payloads = json.load(f)
+            except (OSError, ValueError) as e:
+                raise CommandError(f"페이로드를 읽을 수 없습니다: {e}")
+        else:
+            payloads = synthetic_payloads(opts["synthetic"])
+        n_items = sum(len(p["items"]) for p in payloads)
+
+        timings = {}
+        for label, fn in (("legacy", legacy_filter), ("compiled", new_filter)):
+            t0 = time.perf_counter()
+            for _ in range(opts["repeat"]):
+                for p in payloads:
+                    fn(p["items"], p["place"])
+            timings[label] = (time.perf_counter() - t0) / opts["repeat"]
+
+        diff = 0
+        for p in payloads:
+            old, new = legacy_filter(p["items"], p["place"]), new_filter(p["items"], p["place"])
+            if old != new:
+                diff += 1
+                self.stdout.write(f"  결과 차이 [{p['place']}]: 이전만 {sorted(set(old) - set(new))[:3]} / 새것만 {sorted(set(new) - set(old))[:3]}")
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"장소 {len(payloads)}곳, 항목 {n_items}건, {opts['repeat']}회 평균"))
+        for label, sec in timings.items():
+            self.stdout.write(f"  {label:<9} {sec * 1000:>8.2f}ms  ({sec / n_items * 1e6:.2f}µs/항목)")
+        self.stdout.write(f"  속도 향상 {timings['legacy'] / timings['compiled']:.2f}배, 결과가 다른 장소 {diff}곳"
+                          " (호스트 기준 매칭/모바일 링크 중복 제거로 인한 의도된 차이 포함)")
+
+    def _record(self, opts):
+        names = [n.strip() for n in (opts.get("places") or "").split(",") if n.strip()]
+        if not names:
+            raise CommandError("--record 에는 --places 가 필요합니다.")
+        payloads = []
+        for name in names:
+            items = []
+            for q in blog_cache.build_queries(name, ""):
+                try:
+                    items += blog_cache._search(q)
+                except Exception as e:
+                    self.stderr.write(f"❌ '{q}' 실패: {e}")
+            payloads.append({"place": name, "items": items})
+            self.stdout.write(f"  {name}: {len(items)}건")
+        with open(opts["record"], "w", encoding="utf-8") as f:
+            json.dump(payloads, f, ensure_ascii=False)
+        self.stdout.write(self.style.SUCCESS(f"💾 {opts['record']}에 기록했습니다."))
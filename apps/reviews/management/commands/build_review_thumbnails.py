@@ -0,0 +1,99 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+from apps.reviews.models import ReviewPhoto
+from apps.reviews.thumbnails import VARIANTS, generate, variant_names
+from apps.reviews.uploads import UPLOAD_DIR
+
+
+class Command(BaseCommand):
+    help = "리뷰 사진 WebP/JPEG 썸네일 생성 (기존 사진 백필, 요청 중 생성에 실패한 사진 재시도, 고아 파일 정리)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4, help="동시 생성 스레드 수")
+        parser.add_argument("--all", action="store_true", help="이미 만든 사진도 다시 생성")
+        parser.add_argument("--limit", type=int, default=0, help="최대 처리 수 (0이면 전체)")
+        parser.add_argument("--cleanup-orphans", action="store_true",
+                            help="ReviewPhoto 에 연결되지 않은 원본/파생본/업로드 임시 파일 삭제 (생성은 하지 않음)")
+        parser.add_argument("--min-age", type=int, default=3600,
+                            help="고아 파일 정리 시 이 시간(초)보다 오래된 파일만 삭제 (업로드 중인 파일 보호)")
+        parser.add_argument("--dry-run", action="store_true", help="고아 파일 정리 시 삭제 대상만 출력")
+
+    def handle(self, *args, **opts):
+        if opts["cleanup_orphans"]:
+            self._cleanup_orphans(opts["min_age"], opts["dry_run"])
+            return
+
+        qs = ReviewPhoto.objects.exclude(image="").exclude(image__isnull=True).order_by("id")
+        if not opts["all"]:
+            qs = qs.filter(thumbs_ready=False)
+        if opts["limit"]:
+            qs = qs[:opts["limit"]]
+        photos = list(qs)
+        sizes = ", ".join(f"{k} {v}px" for k, v in VARIANTS.items())
+        self.stdout.write(f"🖼️ 대상 {len(photos)}장 ({sizes}, WebP+JPEG)")
+
+        def run(photo):
+            try:
+                generate(photo)
+            finally:
+                close_old_connections()
+
+        started = time.monotonic()
+        done = failed = 0
+        with ThreadPoolExecutor(max_workers=max(1, opts["workers"])) as pool:
+            futures = {pool.submit(run, p): p for p in photos}
+            for fut in as_completed(futures):
+                try:
+                    fut.result()
+                    done += 1
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"  ❌ 사진 {futures[fut].pk} ({futures[fut].image.name}): {e}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: 생성 {done}장, 실패 {failed}장, {time.monotonic() - started:.1f}초"
+        ))
+
+    def _cleanup_orphans(self, min_age, dry_run):
+        """review_photos/ 의 파일 중 어떤 ReviewPhoto 의 원본/파생본도 아닌 것 삭제"""
+        known = set()
+        for name in ReviewPhoto.objects.exclude(image="").exclude(image__isnull=True).values_list("image", flat=True).iterator():
+            known.add(name)
+            known.update(variant_names(name))
+
+        try:
+            _, files = default_storage.listdir(UPLOAD_DIR)
+        except FileNotFoundError:
+            files = []
+        cutoff = timezone.now() - timedelta(seconds=min_age)
+        removed = kept_recent = 0
+        for f in files:
+            name = f"{UPLOAD_DIR}/{f}"
+            if name in known:
+                continue
+            # 방금 업로드되어 아직 행이 커밋되지 않은 파일은 건너뜀
+            if default_storage.get_modified_time(name) > cutoff:
+                kept_recent += 1
+                continue
+            if not dry_run:
+                default_storage.delete(name)
+            removed += 1
+            self.stdout.write(f"  🗑️ {name}")
+
+        verb = "삭제 대상" if dry_run else "삭제"
+        self.stdout.write(self.style.SUCCESS(
+            f"고아 파일 {verb} {removed}개 (최근 파일 {kept_recent}개 보존, 연결된 파일 {len(known)}개 기준)"
+        ))
+
+
+# 사용 예시:
+# python manage.py build_review_thumbnails --workers 8
+# python manage.py build_review_thumbnails --all --limit 100
+# python manage.py build_review_thumbnails --cleanup-orphans --dry-run
@@ -0,0 +1,102 @@
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+
+from apps.places import metrics
+from apps.places.cache import is_shared_cache
+from apps.places.models import Place
+from apps.reviews.blog_cache import get_cached, hits_key, refresh
+
+
+class Command(BaseCommand):
+    help = "인기 장소(찜/리뷰/최근 조회 순) 네이버 블로그 후기 캐시 미리 채우기 (만료/임박 항목만, API 호출 속도 제한)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=200, help="대상 장소 수")
+        parser.add_argument("--qps", type=float, default=5.0, help="초당 최대 API 호출 수")
+        parser.add_argument("--max-calls", type=int, default=5000, help="이번 실행 API 호출 상한 (일일 쿼터 보호)")
+        parser.add_argument("--stale-within", type=int, default=0,
+                            help="신선 기간이 이 시간(초) 안에 끝나는 항목도 미리 갱신")
+        parser.add_argument("--loop", type=int, default=0, help="N초마다 반복 실행 (0이면 1회)")
+        parser.add_argument("--dry-run", action="store_true", help="대상만 출력")
+
+    def handle(self, *args, **opts):
+        # 프로세스 로컬 캐시면 이 명령 프로세스만 채우고 끝나며, 웹 요청의 조회 수(hits)도 보이지 않음
+        if not is_shared_cache():
+            raise CommandError(
+                "프로세스 로컬 캐시(LocMem)에서는 미리 채워도 웹 워커에 전달되지 않습니다. "
+                "REDIS_URL(또는 CACHE_BACKEND/CACHE_LOCATION)로 공유 캐시를 설정하세요."
+            )
+        while True:
+            self._run_once(opts)
+            if not opts["loop"]:
+                break
+            time.sleep(opts["loop"])
+
+    def _candidates(self, top):
+        """찜 수 + 리뷰 수*2 + 최근 조회 수 점수로 상위 top개 (후보 풀은 찜/리뷰 상위 top*3)"""
+        pool = {}
+        by_likes = Place.objects.order_by("-like_count").values("id", "name", "region", "like_count")[:top * 3]
+        by_reviews = (Place.objects.annotate(n_reviews=Count("reviews")).filter(n_reviews__gt=0)
+                      .order_by("-n_reviews").values("id", "name", "region", "like_count", "n_reviews")[:top * 3])
+        for row in by_likes:
+            pool[row["id"]] = {**row, "n_reviews": 0}
+        for row in by_reviews:
+            pool[row["id"]] = row
+
+        hits = cache.get_many([hits_key(pid) for pid in pool])
+        for pid, row in pool.items():
+            row["hits"] = hits.get(hits_key(pid), 0)
+            row["score"] = row["like_count"] + row["n_reviews"] * 2 + row["hits"]
+        return sorted(pool.values(), key=lambda r: -r["score"])[:top]
+
+    def _run_once(self, opts):
+        now = time.time()
+        targets = []
+        fresh = 0
+        for row in self._candidates(opts["top"]):
+            entry = get_cached(row["id"])
+            if entry is not None and entry["fetched_at"] + entry["fresh_for"] - now > opts["stale_within"]:
+                fresh += 1
+                continue
+            targets.append(row)
+
+        self.stdout.write(f"🔥 대상 {len(targets)}곳 (신선한 캐시 {fresh}곳 건너뜀)")
+        if opts["dry_run"]:
+            for row in targets:
+                self.stdout.write(f"  {row['score']:>6} {row['name']} (찜 {row['like_count']}, 리뷰 {row['n_reviews']}, 조회 {row['hits']})")
+            return
+
+        start_calls = metrics.snapshot("blog.api_calls")["counters"].get("blog.api_calls", 0)
+        started = time.monotonic()
+        done = failed = 0
+        for row in targets:
+            calls = metrics.snapshot("blog.api_calls")["counters"].get("blog.api_calls", 0) - start_calls
+            if calls >= opts["max_calls"]:
+                self.stdout.write(self.style.WARNING(f"⚠️ API 호출 상한 {opts['max_calls']}회 도달 → 중단"))
+                break
+            # 토큰 버킷 대신 누적 호출 수 기준으로 평균 qps 유지
+            ahead = calls / opts["qps"] - (time.monotonic() - started) if opts["qps"] > 0 else 0
+            if ahead > 0:
+                time.sleep(ahead)
+            try:
+                entry = refresh(row["id"], row["name"], row["region"] or "")
+                done += 1
+                self.stdout.write(f"  ✅ {row['name']}: {len(entry['items'])}건")
+            except Exception as e:
+                # refresh 는 실패 시 캐시를 쓰지 않으므로 기존 항목이 그대로 남는다
+                failed += 1
+                kept = "기존 캐시 유지" if get_cached(row["id"]) is not None else "캐시 없음"
+                self.stderr.write(f"  ❌ {row['name']}: {e} ({kept})")
+
+        calls = metrics.snapshot("blog.api_calls")["counters"].get("blog.api_calls", 0) - start_calls
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: 갱신 {done}곳, 실패 {failed}곳, API 호출 {calls}회, {time.monotonic() - started:.1f}초"
+        ))
+
+
+# 사용 예시:
+# python manage.py prewarm_blog_cache --top 300 --qps 3
+# python manage.py prewarm_blog_cache --stale-within 3600 --loop 1800
@@ -1,13 +1,109 @@
-import os
-from datetime import datetime
-from decouple import config
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 
 from django.core.management.base import BaseCommand
-from django.conf import settings
 from django.db import transaction
 
+from apps.places import llm_clients
 
 
+# 장소 관련 키워드 매핑
+PLACE_KEYWORDS = {
+    '깨끗함': ['깨끗', '청결', '위생적', '정리'],
+    '맛있음': ['맛있', '맛집', '음식', '요리', '메뉴'], 
+    '친절함': ['친절', '서비스', '직원', '응대'],
+    '조용함': ['조용', '평화', '힐링', '휴식', '차분'],
+    '좋은분위기': ['분위기', '인테리어', '예쁜', '아늑', '멋진'],
+    '편리함': ['편리', '접근성', '교통', '주차', '위치'],
+    '넓음': ['넓', '공간', '규모', '크'],
+    '좋은경치': ['경치', '뷰', '전망', '풍경', '바다', '산'],
+    '가족친화': ['가족', '아이', '어린이', '패밀리', '아기'],
+    '데이트': ['데이트', '커플', '연인', '로맨틱'],
+    '체험활동': ['체험', '활동', '프로그램', '이벤트'],
+    '전통적': ['전통', '역사', '문화', '유적', '고전'],
+    '현대적': ['모던', '세련', '신식', '최신'],
+    '자연친화': ['자연', '공원', '숲', '녹지'],
+    '쇼핑': ['쇼핑', '매장', '상품', '구매', '판매'],
+    '레포츠': ['운동', '스포츠', '액티비티', '레저']
+}
+
+STOP_WORDS = frozenset({
+    '이', '그', '저', '것', '수', '있', '없', '등', '및', '또', '더', '가장', '많', '정말',
+    '매우', '너무', '아주', '정말', '진짜', '완전', '엄청', '여기', '거기', '저기'
+})
+
+
+# (태그, 키워드 튜플) — 호출마다 dict/제너레이터를 만들지 않도록 모듈 로드 시 1회 구성.
+# 키워드가 수십 개뿐이라 정규식 자동자보다 C 수준 부분 문자열 검사가 빠르다.
+_KEYWORD_TABLE = tuple((tag, tuple(words)) for tag, words in PLACE_KEYWORDS.items())
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_TAG_NAME_MAX = 50  # Tag.name max_length
+
+
+SUMMARY_TEMPLATE = """다음은 한 장소에 대한 여러 방문객들의 댓글입니다. 
+이 댓글들을 종합 분석하여 {min_length}-{max_length}자 사이로 요약해주세요.
+
+요약에 포함할 내용:
+- 장소의 주요 특징과 분위기
+- 시설 및 서비스 품질
+- 방문객들의 전반적인 만족도
+- 자주 언급되는 긍정적/부정적 요소
+- 추천 포인트나 주의사항
+
+댓글 내용:
+{reviews}
+
+종합 요약:"""
+
+INCREMENTAL_SUMMARY_TEMPLATE = """다음은 한 장소에 대한 기존 댓글 종합 요약과, 그 이후 새로 달린 댓글입니다.
+새 댓글 내용을 반영하여 요약을 {min_length}-{max_length}자 사이로 갱신해주세요.
+기존 요약의 내용은 유지하되, 새 댓글과 어긋나는 부분은 고치고 새로 언급된 특징을 추가하세요.
+
+기존 요약:
+{summary}
+
+새 댓글:
+{reviews}
+
+갱신된 종합 요약:"""
+
+INCREMENTAL_INPUT_LIMIT = 4000  # 증분 요약 한 번에 넣는 새 댓글 글자 수 (토큰 제한 고려)
+
+
+def _review_batches(lines, limit):
+    """댓글 줄을 limit 자 이하 묶음으로 나눔 (한 줄이 limit 보다 길면 그 줄만 잘라 단독 묶음)"""
+    batch, size = [], 0
+    for line in lines:
+        line = line[:limit]
+        if batch and size + len(line) + 1 > limit:
+            yield "\n".join(batch)
+            batch, size = [], 0
+        batch.append(line)
+        size += len(line) + 1
+    if batch:
+        yield "\n".join(batch)
+
+
+class RateLimiter:
+    """초당 qps 회 이하로 호출 간격을 맞춤 (여러 스레드가 공유)"""
+
+    def __init__(self, qps: float):
+        self.interval = 1.0 / qps if qps and qps > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
 
 
 class PlaceReviewProcessor:
@@ -16,8 +112,10 @@ class PlaceReviewProcessor:
     새로운 댓글이 추가될 때마다 해당 장소의 모든 댓글들을 종합 요약하고 태그 업데이트
     """
     
-    def __init__(self):
-        pass
+    def __init__(self, rate_limiter=None):
+        # ClovaX 클라이언트/프롬프트는 apps.places.llm_clients 레지스트리에서 공유
+        self.rate_limiter = rate_limiter
+        self._tag_ids = {}  # 태그 이름 → id
     
     def get_place_all_reviews(self, place_id: int):
         """특정 장소의 모든 댓글 수집"""
@@ -34,21 +132,18 @@ class PlaceReviewProcessor:
             print(f"❌ 장소 댓글 수집 실패: {e}")
             return None, None
 
-    def summarize_all_place_reviews(self, reviews, target_length=(200, 700)) -> str:
+    def summarize_all_place_reviews(self, reviews, target_length=(200, 700), strict=False) -> str:
         """
         장소의 모든 댓글을 ClovaX로 종합하여 200-700자 범위로 요약
+        (reviews 는 QuerySet 또는 미리 가져온 Review 리스트)
+        strict 이면 ClovaX 호출 실패 시 기본 요약으로 대체하지 않고 예외를 그대로 올림
         """
         try:
-            if not reviews.exists():
+            if not reviews:
                 return "댓글이 없습니다."
             
             # 모든 댓글 내용 결합
-            all_content = []
-            for review in reviews:
-                content = getattr(review, 'content', '') or ''
-                rating = getattr(review, 'rating', 0)
-                if content:
-                    all_content.append(f"[평점: {rating}] {content}")
+            all_content = self._format_reviews(reviews)
             
             if not all_content:
                 return "유효한 댓글 내용이 없습니다."
@@ -57,34 +152,15 @@ class PlaceReviewProcessor:
             print(f"📝 총 {len(all_content)}개 댓글을 종합하여 요약 진행...")
             
             # ClovaX로 종합 요약 (목표 길이 명시)
-            api_key = config("CLOVASTUDIO_API_KEY", default=None)
-            if not api_key:
+            if not llm_clients.has_clova_key():
                 print("CLOVASTUDIO_API_KEY 미설정 → 기본 요약 사용")
                 return self._fallback_place_summarize(combined_content, target_length)
 
-            from langchain_naver import ChatClovaX
-            from langchain_core.prompts import PromptTemplate
-
-            os.environ["CLOVASTUDIO_API_KEY"] = api_key 
-            llm = ChatClovaX(model="HCX-005", temperature=0.1)
-            
-            prompt = PromptTemplate.from_template(
-                """다음은 한 장소에 대한 여러 방문객들의 댓글입니다. 
-이 댓글들을 종합 분석하여 {min_length}-{max_length}자 사이로 요약해주세요.
-
-요약에 포함할 내용:
-- 장소의 주요 특징과 분위기
-- 시설 및 서비스 품질
-- 방문객들의 전반적인 만족도
-- 자주 언급되는 긍정적/부정적 요소
-- 추천 포인트나 주의사항
-
-댓글 내용:
-{reviews}
-
-종합 요약:"""
-            )
+            llm = llm_clients.chat_model("HCX-005", 0.1)
+            prompt = llm_clients.prompt(SUMMARY_TEMPLATE)
             
+            if self.rate_limiter is not None:
+                self.rate_limiter.wait()
             out = (prompt | llm).invoke({
                 "reviews": combined_content[:4000],  # 토큰 제한 고려
                 "min_length": target_length[0],
@@ -106,8 +182,54 @@ class PlaceReviewProcessor:
             
         except Exception as e:
             print(f"❌ ClovaX 장소 댓글 요약 실패: {e}")
+            if strict:
+                raise
             return self._fallback_place_summarize(combined_content if 'combined_content' in locals() else "", target_length)
     
+    def _format_reviews(self, reviews) -> list:
+        lines = []
+        for review in reviews:
+            content = getattr(review, 'content', '') or ''
+            rating = getattr(review, 'rating', 0)
+            if content:
+                lines.append(f"[평점: {rating}] {content}")
+        return lines
+
+    def update_summary_incrementally(self, prev_summary: str, new_reviews, target_length=(200, 700)) -> str:
+        """
+        기존 요약 + 새 댓글만 ClovaX에 넣어 요약 갱신 (입력 크기가 새 댓글 양에 비례).
+        새 댓글이 INCREMENTAL_INPUT_LIMIT 자를 넘으면 묶음으로 나눠 차례로 반영 (잘려 빠지는 댓글 없음).
+        ClovaX 호출이 실패하면 예외를 올린다 (호출하는 쪽이 기준점을 옮기지 않고 재시도하도록)
+        """
+        lines = self._format_reviews(new_reviews)
+        if not lines:
+            return prev_summary
+        new_content = "\n".join(lines)
+        if not llm_clients.has_clova_key():
+            print("CLOVASTUDIO_API_KEY 미설정 → 기본 요약 사용")
+            return self._fallback_place_summarize(f"{prev_summary}\n{new_content}", target_length)
+
+        prompt = llm_clients.prompt(INCREMENTAL_SUMMARY_TEMPLATE)
+        summary = prev_summary
+        try:
+            for batch in _review_batches(lines, INCREMENTAL_INPUT_LIMIT):
+                if self.rate_limiter is not None:
+                    self.rate_limiter.wait()
+                out = (prompt | llm_clients.chat_model("HCX-005", 0.1)).invoke({
+                    "summary": summary,
+                    "reviews": batch,
+                    "min_length": target_length[0],
+                    "max_length": target_length[1]
+                })
+                summary = getattr(out, "content", str(out)).strip() or summary
+                if len(summary) > target_length[1]:
+                    summary = summary[:target_length[1]-3] + "..."
+        except Exception as e:
+            print(f"❌ ClovaX 증분 요약 실패: {e}")
+            raise
+        print(f"✅ ClovaX 증분 요약 완료 (새 댓글 {len(new_content)}자 → {len(summary)}자)")
+        return summary
+
     def _fallback_place_summarize(self, content: str, target_length=(200, 700)) -> str:
         """ClovaX 요약 실패 시 대체 요약"""
         if not content:
@@ -159,46 +281,19 @@ class PlaceReviewProcessor:
         요약에서 장소 특성에 맞는 태그를 추출
         """
         try:
-            # 장소 관련 키워드 매핑
-            place_keywords = {
-                '깨끗함': ['깨끗', '청결', '위생적', '정리'],
-                '맛있음': ['맛있', '맛집', '음식', '요리', '메뉴'], 
-                '친절함': ['친절', '서비스', '직원', '응대'],
-                '조용함': ['조용', '평화', '힐링', '휴식', '차분'],
-                '좋은분위기': ['분위기', '인테리어', '예쁜', '아늑', '멋진'],
-                '편리함': ['편리', '접근성', '교통', '주차', '위치'],
-                '넓음': ['넓', '공간', '규모', '크'],
-                '좋은경치': ['경치', '뷰', '전망', '풍경', '바다', '산'],
-                '가족친화': ['가족', '아이', '어린이', '패밀리', '아기'],
-                '데이트': ['데이트', '커플', '연인', '로맨틱'],
-                '체험활동': ['체험', '활동', '프로그램', '이벤트'],
-                '전통적': ['전통', '역사', '문화', '유적', '고전'],
-                '현대적': ['모던', '세련', '신식', '최신'],
-                '자연친화': ['자연', '공원', '숲', '녹지'],
-                '쇼핑': ['쇼핑', '매장', '상품', '구매', '판매'],
-                '레포츠': ['운동', '스포츠', '액티비티', '레저']
-            }
-            
-            extracted_tags = set()
             summary_lower = summary.lower()
-            
-            # 키워드 기반 태그 추출
-            for main_tag, related_words in place_keywords.items():
-                if any(word in summary_lower for word in related_words):
-                    extracted_tags.add(main_tag)
-            
-            # 추가로 빈도수 기반 키워드 추출
-            import re
-            from collections import Counter
-            
-            # 불용어 제거
-            stop_words = {
-                '이', '그', '저', '것', '수', '있', '없', '등', '및', '또', '더', '가장', '많', '정말',
-                '매우', '너무', '아주', '정말', '진짜', '완전', '엄청', '여기', '거기', '저기'
-            }
-            
-            clean_text = re.sub(r"[^\w\s]", "", summary_lower)
-            words = [w for w in clean_text.split() if w not in stop_words and len(w) > 1]
+
+            # 키워드 기반 태그 추출 (태그마다 첫 키워드가 걸리면 다음 태그로)
+            extracted_tags = set()
+            for tag, words in _KEYWORD_TABLE:
+                for word in words:
+                    if word in summary_lower:
+                        extracted_tags.add(tag)
+                        break
+
+            # 추가로 빈도수 기반 키워드 추출 (불용어 제거)
+            clean_text = _NON_WORD_RE.sub("", summary_lower)
+            words = [w for w in clean_text.split() if w not in STOP_WORDS and len(w) > 1]
             
             # 빈도수 높은 단어 중 의미있는 것들 추가
             frequent_words = Counter(words).most_common(8)
@@ -212,13 +307,54 @@ class PlaceReviewProcessor:
             print(f"❌ 태그 추출 실패: {e}")
             return set()
 
+    def _resolve_tag_ids(self, names) -> dict:
+        """
+        태그 이름 → id (처리기 수명 동안 캐시, 없는 이름만 1쿼리로 조회 후 나머지는 bulk_create)
+        호출하는 쪽의 transaction.atomic 안에서 사용
+        """
+        from apps.tags.models import Tag
+
+        missing = {n for n in names if n not in self._tag_ids}
+        if missing:
+            # 같은 이름 태그가 여럿이면 get_or_create 처럼 먼저 만들어진 것을 사용
+            found = {}
+            for tid, name in Tag.objects.filter(name__in=missing).order_by("id").values_list("id", "name"):
+                found.setdefault(name, tid)
+            created = Tag.objects.bulk_create(
+                [Tag(name=n, tag_type="ai_generated") for n in sorted(missing - found.keys())]
+            )
+            self._tag_ids.update(found)
+            if created:
+                new_ids = {tag.name: tag.id for tag in created}
+                print(f"새 태그 생성: {sorted(new_ids)}")
+                # 롤백되면 없어질 id 이므로 커밋 후에만 캐시
+                transaction.on_commit(lambda: self._tag_ids.update(new_ids))
+                found.update(new_ids)
+        return {n: self._tag_ids.get(n) or found[n] for n in names}
+
+    def _add_place_tags(self, new_tags: dict):
+        """new_tags: {place_id: {태그 이름, ...}} → 장소-태그 연결을 한 번에 추가"""
+        from apps.places.models import Place
+
+        if not new_tags:
+            return
+        Through = Place.tags.through
+        try:
+            tag_ids = self._resolve_tag_ids(set().union(*new_tags.values()))
+            Through.objects.bulk_create(
+                [Through(place_id=pid, tag_id=tag_ids[n]) for pid, added in new_tags.items() for n in added],
+                ignore_conflicts=True,
+            )
+        except Exception:
+            # 캐시된 id 의 태그가 지워졌을 수 있으므로 다음 호출에서 다시 조회
+            self._tag_ids.clear()
+            raise
+
     def compare_and_update_place_tags(self, place, summary: str) -> bool:
         """
         요약 내용과 현재 장소 태그를 비교하여 맞지 않는 경우 태그 업데이트
         """
         try:
-            from apps.tags.models import Tag
-            
             # 현재 장소의 태그들
             current_tags = set(place.tags.values_list('name', flat=True))
             print(f"📋 현재 장소 태그: {current_tags}")
@@ -228,27 +364,19 @@ class PlaceReviewProcessor:
             print(f"🔍 요약에서 추출된 태그: {extracted_tags}")
             
             # 새로 추가할 태그들 (기존에 없는 것들)
-            new_tags = extracted_tags - current_tags
+            new_tags = {t for t in extracted_tags - current_tags if len(t) <= _TAG_NAME_MAX}
             
             # 태그 업데이트가 필요한 경우
             if new_tags:
                 print(f"➕ 새로 추가할 태그: {new_tags}")
                 
                 with transaction.atomic():
-                    for tag_name in new_tags:
-                        # 태그가 존재하지 않으면 생성, 있으면 가져오기
-                        tag, created = Tag.objects.get_or_create(
-                            name=tag_name,
-                            defaults={'tag_type': 'ai_generated'}
-                        )
-                        place.tags.add(tag)
-                        
-                        if created:
-                            print(f"새 태그 생성 및 추가: {tag_name}")
-                        else:
-                            print(f"기존 태그 추가: {tag_name}")
+                    self._add_place_tags({place.id: new_tags})
                 
-                place.save()
+                from apps.places.cache import bump_list_version
+                from apps.places.descriptors import refresh_place_descriptors
+                bump_list_version()
+                refresh_place_descriptors([place.id])
                 print(f"🏷️ 장소 '{place.name}' 태그 업데이트 완료")
                 return True
             else:
@@ -259,6 +387,86 @@ class PlaceReviewProcessor:
             print(f"태그 업데이트 실패: {e}")
             return False
 
+    def apply_chunk_updates(self, results) -> int:
+        """
+        results: [(place, summary), ...] — 청크 단위로 태그/요약을 한 번에 기록
+        (place.summary_review_id 는 호출하는 쪽에서 반영한 마지막 댓글 id 로 설정)
+        (현재 태그 1쿼리, 태그 조회/생성 bulk, 장소-태그 연결 bulk_create, summary bulk_update)
+        태그가 바뀐 장소 수를 반환
+        """
+        from apps.places.models import Place
+
+        if not results:
+            return 0
+        Through = Place.tags.through
+        place_ids = [place.id for place, _ in results]
+
+        current = defaultdict(set)
+        for pid, name in Through.objects.filter(place_id__in=place_ids).values_list("place_id", "tag__name"):
+            current[pid].add(name)
+
+        # 태그 이름 길이 제한을 넘는 빈도 키워드는 제외 (한 건 때문에 청크 전체가 실패하지 않도록)
+        new_tags = {}
+        for place, summary in results:
+            extracted = {t for t in self.extract_place_tags_from_summary(summary) if len(t) <= _TAG_NAME_MAX}
+            added = extracted - current[place.id]
+            if added:
+                new_tags[place.id] = added
+
+        with transaction.atomic():
+            self._add_place_tags(new_tags)
+            places = []
+            for place, summary in results:
+                place.summary = summary
+                places.append(place)
+            Place.objects.bulk_update(places, ["summary", "summary_review_id"])
+
+        if new_tags:
+            from apps.places.cache import bump_list_version
+            from apps.places.descriptors import refresh_place_descriptors
+            bump_list_version()
+            refresh_place_descriptors(list(new_tags))
+            print(f"🏷️ 태그 업데이트 {len(new_tags)}곳")
+        return len(new_tags)
+
+    def process_place_incremental(self, place_id: int, target_length=(200, 700), full=False) -> bool:
+        """
+        마지막 처리 이후 새 댓글만 기존 요약에 반영 (요약/기준점이 없거나 full 이면 전체 요약).
+        새 댓글이 없으면 LLM 호출 없이 False. ClovaX 호출이 실패하면 저장 없이 예외를 올린다
+        """
+        from apps.places.models import Place
+        from apps.reviews.models import Review
+
+        try:
+            place = Place.objects.only("id", "name", "summary", "summary_review_id").get(id=place_id)
+        except Place.DoesNotExist:
+            print(f"❌ 장소 ID {place_id}를 찾을 수 없습니다.")
+            return False
+
+        fields = ("id", "place_id", "rating", "content")
+        if place.summary and place.summary_review_id and not full:
+            reviews = list(Review.objects.filter(place_id=place_id, id__gt=place.summary_review_id)
+                           .only(*fields).order_by("id"))
+            if not reviews:
+                print(f"⏭️ 장소 '{place.name}' 새 댓글 없음")
+                return False
+            print(f"📝 장소 '{place.name}' 새 댓글 {len(reviews)}개 증분 반영")
+            summary = self.update_summary_incrementally(place.summary, reviews, target_length)
+        else:
+            reviews = list(Review.objects.filter(place_id=place_id).only(*fields).order_by("-created_at"))
+            if not reviews:
+                if full and place.summary_review_id:
+                    # 댓글 기반 요약이었는데 댓글이 모두 삭제됨 → 요약도 비움
+                    # (summary_review_id 가 0 이면 CSV 로 들어온 장소 설명이므로 그대로 둠)
+                    Place.objects.filter(pk=place_id).update(summary=None, summary_review_id=0)
+                return False
+            summary = self.summarize_all_place_reviews(reviews, target_length, strict=True)
+
+        # 요약이 실패하면 위에서 예외 → 기준점(summary_review_id)은 그대로 남아 다음 시도에서 다시 반영
+        place.summary_review_id = max(r.id for r in reviews)
+        self.apply_chunk_updates([(place, summary)])
+        return True
+
     def process_place_when_review_added(self, place_id: int) -> bool:
         """
         새로운 댓글이 추가될 때마다 실행되는 메인 처리 함수
@@ -293,7 +501,8 @@ class PlaceReviewProcessor:
             # 4단계: 장소 summary 필드도 업데이트 (선택사항)
             if hasattr(place, 'summary'):
                 place.summary = summary
-                place.save(update_fields=['summary'])
+                place.summary_review_id = max(r.id for r in reviews)
+                place.save(update_fields=['summary', 'summary_review_id'])
                 print(" 장소 요약 필드 업데이트 완료")
             
             print(f"\n  장소 '{place.name}' 댓글 기반 분석 완료!")
@@ -319,11 +528,15 @@ class Command(BaseCommand):
   python manage.py review_compare --place-id 1       # 특정 장소의 모든 댓글 종합 분석
   python manage.py review_compare --all-places       # 모든 장소의 댓글 종합 분석
   python manage.py review_compare --place-id 1 --summary-min 300 --summary-max 500  # 요약 길이 조정
+  python manage.py review_compare --place-id 1 --incremental  # 새 댓글만 기존 요약에 반영
+  python manage.py review_compare --worker --workers 2         # 댓글 변경 큐 상시 처리
+  python manage.py review_compare --all-places --workers 8 --qps 4 --chunk-size 100  # 동시 처리/속도 제한
 
 기능:
 - 장소별 모든 댓글을 ClovaX로 200-700자 종합 요약
 - 요약 내용 기반으로 장소 태그 자동 업데이트
 - 댓글 추가 시마다 실행 가능한 구조
+- --worker: 댓글 생성/수정/삭제 시 쌓이는 작업 큐(ReviewSummaryJob)를 계속 처리
 """
 
     def add_arguments(self, parser):
@@ -334,21 +547,89 @@ class Command(BaseCommand):
         parser.add_argument("--summary-min", type=int, default=200, help="AI 요약 최소 길이 (기본: 200자)")
         parser.add_argument("--summary-max", type=int, default=700, help="AI 요약 최대 길이 (기본: 700자)")
         parser.add_argument("--force-update", action="store_true", help="기존 태그와 상관없이 강제 업데이트")
+        parser.add_argument("--incremental", action="store_true",
+                            help="--place-id 와 함께: 마지막 처리 이후 새 댓글만 기존 요약에 반영")
+        # --all-places 일괄 처리 / --worker 큐 처리
+        parser.add_argument("--worker", action="store_true", help="댓글 변경 큐를 계속 처리하는 워커로 실행")
+        parser.add_argument("--poll", type=float, default=5.0, help="--worker 큐 확인 간격(초, 기본: 5)")
+        parser.add_argument("--once", action="store_true", help="--worker: 처리할 작업이 없으면 종료")
+        parser.add_argument("--workers", type=int, default=4, help="동시 요약 스레드 수 (기본: 4)")
+        parser.add_argument("--qps", type=float, default=2.0, help="초당 최대 LLM 호출 수 (0이면 제한 없음, 기본: 2)")
+        parser.add_argument("--chunk-size", type=int, default=50, help="댓글 미리 가져오기/일괄 저장 단위 장소 수 (기본: 50)")
 
     def handle(self, *args, **options):
         # 장소별 댓글 종합 처리만 지원
+        if options.get("worker"):
+            self._run_worker(options)
+            return
+
         if not (options.get("place_id") or options.get("all_places")):
-            self.stderr.write("❌ --place-id 또는 --all-places 옵션이 필요합니다.")
+            self.stderr.write("❌ --place-id, --all-places 또는 --worker 옵션이 필요합니다.")
             self.stderr.write("도움말: python manage.py review_compare --help")
             return
 
         self._handle_place_reviews(options)
+
+    def _run_worker(self, options):
+        """
+        ReviewSummaryJob 큐 소비: 비어 있는 슬롯만큼 임대해 스레드 풀에서 처리
+        (생성만 쌓인 장소는 증분, 수정/삭제가 있으면 전체 재요약)
+        """
+        from apps.reviews import summary_queue
+
+        processor = PlaceReviewProcessor(rate_limiter=RateLimiter(options.get("qps", 2.0)))
+        target_length = (options.get("summary_min", 200), options.get("summary_max", 700))
+        workers = max(1, options.get("workers", 4))
+        poll = max(0.1, options.get("poll", 5.0))
+
+        self.stdout.write(f"👷 댓글 변경 큐 워커 시작 (동시 {workers}개, 확인 간격 {poll}초) {summary_queue.stats()}")
+        inflight = set()
+        done = failed = 0
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            try:
+                while True:
+                    for job in summary_queue.claim(workers - len(inflight)):
+                        inflight.add(pool.submit(self._run_job, processor, job, target_length))
+                    if not inflight:
+                        if options.get("once"):
+                            break
+                        time.sleep(poll)
+                        continue
+                    finished, _ = wait(inflight, timeout=poll, return_when=FIRST_COMPLETED)
+                    for fut in finished:
+                        inflight.discard(fut)
+                        if fut.result():
+                            done += 1
+                        else:
+                            failed += 1
+            except KeyboardInterrupt:
+                self.stdout.write("⏹️ 중지 요청 - 진행 중인 작업만 마무리합니다.")
+        self.stdout.write(f"워커 종료: 처리 {done}건, 실패 {failed}건 {summary_queue.stats()}")
+
+    def _run_job(self, processor, job, target_length):
+        from django.db import close_old_connections
+        from apps.reviews import summary_queue
+
+        try:
+            changed = processor.process_place_incremental(job.place_id, target_length, full=job.full)
+            summary_queue.complete(job)
+            self.stdout.write(f"{'✅' if changed else '⏭️'} 장소 {job.place_id} ({'전체' if job.full else '증분'})")
+            return True
+        except Exception as e:
+            self.stderr.write(f"❌ 장소 {job.place_id} 처리 실패 (시도 {job.attempts + 1}회): {e}")
+            try:
+                summary_queue.fail(job, e)
+            except Exception as e2:
+                self.stderr.write(f"   작업 상태 기록 실패: {e2}")
+            return False
+        finally:
+            close_old_connections()
     
     def _handle_place_reviews(self, options):
         """
         장소별 댓글 종합 처리 핸들러
         """
-        place_processor = PlaceReviewProcessor()
+        place_processor = PlaceReviewProcessor(rate_limiter=RateLimiter(options.get("qps", 2.0)))
         
         min_reviews = options.get("min_reviews", 3)
         summary_length = (
@@ -380,10 +661,17 @@ class Command(BaseCommand):
                     self.stdout.write(f"📍 장소: {place.name} (댓글 {review_count}개)")
                     self.stdout.write(f"📏 요약 길이: {summary_length[0]}-{summary_length[1]}자")
                     
-                    # 커스텀 길이로 처리하기 위해 메서드 수정
-                    success = self._process_single_place_with_custom_length(
-                        place_processor, place_id, summary_length
-                    )
+                    if options.get("incremental"):
+                        try:
+                            success = place_processor.process_place_incremental(place_id, summary_length)
+                        except Exception as e:
+                            self.stderr.write(f"❌ 증분 요약 실패 (요약/기준점 변경 없음): {e}")
+                            success = False
+                    else:
+                        # 커스텀 길이로 처리하기 위해 메서드 수정
+                        success = self._process_single_place_with_custom_length(
+                            place_processor, place_id, summary_length
+                        )
                     
                     if success:
                         self.stdout.write(f"✅ 장소 '{place.name}' 댓글 종합 분석 완료!")
@@ -415,29 +703,13 @@ class Command(BaseCommand):
                     self.stdout.write("⚠️ 처리할 장소가 없습니다.")
                     return
 
-                success_count = 0
-                fail_count = 0
-                
-                for i, place in enumerate(places_with_reviews, start=1):
-                    self.stdout.write(f"\n[{i}/{total_places}] 📍 {place.name} (댓글 {place.review_count}개)")
-                    
-                    try:
-                        success = self._process_single_place_with_custom_length(
-                            place_processor, place.id, summary_length
-                        )
-                        
-                        if success:
-                            success_count += 1
-                            self.stdout.write("   ✅ 완료")
-                        else:
-                            fail_count += 1
-                            self.stdout.write("   ❌ 실패")
-                            
-                    except Exception as e:
-                        self.stderr.write(f"   ❌ 오류 발생: {e}")
-                        fail_count += 1
-                
-                self.stdout.write(f"\n🎉 전체 장소 댓글 분석 완료!")
+                success_count, fail_count = self._process_places_in_chunks(
+                    place_processor, list(places_with_reviews.only("id", "name")), summary_length,
+                    workers=max(1, options.get("workers", 4)),
+                    chunk_size=max(1, options.get("chunk_size", 50)),
+                )
+
+                self.stdout.write("\n🎉 전체 장소 댓글 분석 완료!")
                 self.stdout.write(f"   📈 성공: {success_count}개")
                 self.stdout.write(f"   📉 실패: {fail_count}개")
                 
@@ -446,6 +718,55 @@ class Command(BaseCommand):
             import traceback
             traceback.print_exc()
     
+    def _process_places_in_chunks(self, processor, places, target_length, workers, chunk_size):
+        """
+        청크마다: 댓글 1쿼리로 미리 가져오기 → 워커 풀에서 요약(LLM 호출은 RateLimiter로 제한)
+        → 태그/요약 일괄 저장. 요약 스레드는 DB에 접근하지 않는다.
+        """
+        from apps.reviews.models import Review
+
+        total = len(places)
+        success_count = fail_count = done = 0
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for start in range(0, total, chunk_size):
+                chunk = places[start:start + chunk_size]
+                reviews_by_place = defaultdict(list)
+                for review in (Review.objects.filter(place_id__in=[p.id for p in chunk])
+                               .only("id", "place_id", "rating", "content").order_by("-created_at")):
+                    reviews_by_place[review.place_id].append(review)
+                for place in chunk:
+                    place.summary_review_id = max((r.id for r in reviews_by_place[place.id]), default=0)
+
+                futures = {
+                    # strict: LLM 실패 시 대체 요약을 저장하지 않고 이 장소만 실패 처리 (기준점 유지)
+                    pool.submit(processor.summarize_all_place_reviews, reviews_by_place[place.id], target_length,
+                                strict=True): place
+                    for place in chunk
+                }
+                results = []
+                for fut in as_completed(futures):
+                    place = futures[fut]
+                    done += 1
+                    try:
+                        results.append((place, fut.result()))
+                        self.stdout.write(f"[{done}/{total}] ✅ {place.name} (댓글 {place.review_count}개)")
+                    except Exception as e:
+                        fail_count += 1
+                        self.stderr.write(f"[{done}/{total}] ❌ {place.name}: {e}")
+
+                try:
+                    tagged = processor.apply_chunk_updates(results)
+                    success_count += len(results)
+                    self.stdout.write(f"💾 청크 저장: 장소 {len(results)}곳, 태그 변경 {tagged}곳")
+                except Exception as e:
+                    fail_count += len(results)
+                    self.stderr.write(f"❌ 청크 저장 실패 ({len(results)}곳): {e}")
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(f"⏱️ {elapsed:.1f}초 ({total / elapsed if elapsed else 0:.2f}곳/초, 워커 {workers})")
+        return success_count, fail_count
+
     def _process_single_place_with_custom_length(self, processor, place_id, target_length):
         """
         특정 장소를 커스텀 요약 길이로 처리
@@ -456,16 +777,17 @@ class Command(BaseCommand):
             if not place or not reviews.exists():
                 return False
             
-            # 2단계: 커스텀 길이로 요약
-            summary = processor.summarize_all_place_reviews(reviews, target_length)
+            # 2단계: 커스텀 길이로 요약 (LLM 실패 시 예외 → 저장하지 않음)
+            summary = processor.summarize_all_place_reviews(reviews, target_length, strict=True)
             
             # 3단계: 태그 비교 및 업데이트
-            tag_updated = processor.compare_and_update_place_tags(place, summary)
+            processor.compare_and_update_place_tags(place, summary)
             
             # 4단계: 장소 summary 필드 업데이트
             if hasattr(place, 'summary'):
                 place.summary = summary
-                place.save(update_fields=['summary'])
+                place.summary_review_id = max(r.id for r in reviews)
+                place.save(update_fields=['summary', 'summary_review_id'])
             
             return True
             
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0007_place_summary_review_id'),
+        ('reviews', '0003_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewSummaryJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('full', models.BooleanField(default=False)),
+                ('run_after', models.DateTimeField(db_index=True)),
+                ('locked_until', models.DateTimeField(blank=True, null=True)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('place', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='summary_job', to='places.place')),
+            ],
+        ),
+    ]
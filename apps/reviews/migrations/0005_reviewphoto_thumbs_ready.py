@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0004_reviewsummaryjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reviewphoto',
+            name='thumbs_ready',
+            field=models.BooleanField(default=False),
+        ),
+    ]
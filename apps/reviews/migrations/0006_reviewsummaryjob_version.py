@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0005_reviewphoto_thumbs_ready'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reviewsummaryjob',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
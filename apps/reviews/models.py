@@ -51,6 +51,47 @@ class Review(models.Model):
 class ReviewPhoto(models.Model):
     review = models.ForeignKey(Review, related_name="photos", on_delete=models.CASCADE)
     image = models.ImageField(upload_to='review_photos/', blank=True, null=True, verbose_name="사진")
+    # 원본 옆 WebP/JPEG 파생본(thumbnails.py) 생성 완료 여부
+    thumbs_ready = models.BooleanField(default=False)
 
     def __str__(self):
-        return f"Photo of {self.review_id}"
\ No newline at end of file
+        return f"Photo of {self.review_id}"
+
+    def _variant_url(self, variant, ext):
+        from .thumbnails import variant_name
+        if not self.thumbs_ready:
+            return self.image.url
+        return self.image.storage.url(variant_name(self.image.name, variant, ext))
+
+    @property
+    def thumb_url(self):
+        return self._variant_url("thumb", "jpg")
+
+    @property
+    def thumb_webp_url(self):
+        return self._variant_url("thumb", "webp")
+
+    @property
+    def large_url(self):
+        return self._variant_url("large", "jpg")
+
+    @property
+    def large_webp_url(self):
+        return self._variant_url("large", "webp")
+
+class ReviewSummaryJob(models.Model):
+    """
+    장소 요약/태그 갱신 작업 큐 (장소당 1행으로 합쳐짐).
+    댓글 생성/수정/삭제 시 summary_queue.enqueue 로 쌓이고 review_compare --worker 가 처리한다.
+    """
+    place = models.OneToOneField(Place, related_name="summary_job", on_delete=models.CASCADE)
+    full = models.BooleanField(default=False)  # 수정/삭제가 섞이면 전체 재요약
+    run_after = models.DateTimeField(db_index=True)  # 디바운스: 이 시각 이후 처리
+    locked_until = models.DateTimeField(null=True, blank=True)  # 워커 임대 만료 시각
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    version = models.PositiveIntegerField(default=0)  # enqueue 마다 증가 (complete 의 비교 기준)
+    created_at = models.DateTimeField(auto_now_add=True)  # 이번 디바운스 창의 첫 변경 시각 (complete 가 재설정)
+
+    def __str__(self):
+        return f"Summary job for place {self.place_id}"
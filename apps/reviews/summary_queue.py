@@ -0,0 +1,109 @@
+"""
+장소 요약/태그 갱신 작업 큐 (DB 기반, ReviewSummaryJob).
+
+- enqueue: 댓글 생성/수정/삭제 시 호출. 장소당 1행으로 합쳐지고, 마지막 변경 후
+  REVIEW_SUMMARY_DEBOUNCE 초 뒤(첫 변경 후 최대 REVIEW_SUMMARY_DEBOUNCE_MAX 초) 처리 대상이 된다.
+  생성만 있으면 증분 요약, 수정/삭제가 섞이면 전체 재요약.
+- claim/complete/fail: review_compare --worker 가 사용. 임대(locked_until) 방식이라
+  워커가 죽어도 임대가 끝나면 다시 처리되고, 처리 중 새 변경이 들어오면(version 증가)
+  끝난 뒤 디바운스 창을 새로 열어 한 번 더 돈다.
+- 실패 백오프(fail)로 미뤄진 run_after 는 enqueue 가 앞당기지 않는다.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, transaction
+from django.db.models import DateTimeField, ExpressionWrapper, F, Q, Value
+from django.db.models.functions import Greatest, Least
+from django.utils import timezone
+
+from .models import ReviewSummaryJob
+
+LEASE_SECONDS = 300
+MAX_BACKOFF_SECONDS = 3600
+
+
+def enqueue(place_id, full=False):
+    """댓글 요청을 막지 않도록 실패는 로그만 남김"""
+    now = timezone.now()
+    due = now + timedelta(seconds=settings.REVIEW_SUMMARY_DEBOUNCE)
+    latest = ExpressionWrapper(
+        F("created_at") + timedelta(seconds=settings.REVIEW_SUMMARY_DEBOUNCE_MAX),
+        output_field=DateTimeField(),
+    )
+    debounced = Least(Value(due, output_field=DateTimeField()), latest)
+    changes = {
+        # 현재 run_after 가 더 늦으면(실패 백오프) 유지
+        "run_after": Greatest(F("run_after"), debounced),
+        "version": F("version") + 1,
+    }
+    if full:
+        changes["full"] = True
+
+    try:
+        if ReviewSummaryJob.objects.filter(place_id=place_id).update(**changes):
+            return
+        try:
+            with transaction.atomic():
+                ReviewSummaryJob.objects.create(place_id=place_id, full=full, run_after=due)
+        except IntegrityError:
+            # 동시에 다른 요청이 먼저 만든 경우
+            ReviewSummaryJob.objects.filter(place_id=place_id).update(**changes)
+    except DatabaseError as e:
+        print(f"[warn] review summary enqueue failed for place {place_id}: {e}")
+
+
+def claim(limit, lease=LEASE_SECONDS):
+    """처리 시각이 된 작업을 최대 limit개 임대 (PostgreSQL 에선 SKIP LOCKED 로 워커 간 중복 없음)"""
+    if limit <= 0:
+        return []
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = list(
+            ReviewSummaryJob.objects.select_for_update(skip_locked=True)
+            .filter(run_after__lte=now)
+            .filter(Q(locked_until__isnull=True) | Q(locked_until__lt=now))
+            .order_by("run_after")[:limit]
+        )
+        if jobs:
+            ReviewSummaryJob.objects.filter(pk__in=[j.pk for j in jobs]).update(
+                locked_until=now + timedelta(seconds=lease)
+            )
+    return jobs
+
+
+def complete(job):
+    # version 이 그대로면 처리 중 새 변경이 없었던 것 → 삭제
+    deleted, _ = ReviewSummaryJob.objects.filter(pk=job.pk, version=job.version).delete()
+    if not deleted:
+        # 처리 중 들어온 변경(full 승격 포함)은 남기고, 디바운스/최대 대기를 지금부터 다시 잰다
+        now = timezone.now()
+        ReviewSummaryJob.objects.filter(pk=job.pk).update(
+            locked_until=None,
+            attempts=0,
+            last_error="",
+            created_at=now,
+            run_after=now + timedelta(seconds=settings.REVIEW_SUMMARY_DEBOUNCE),
+        )
+
+
+def fail(job, error):
+    attempts = job.attempts + 1
+    delay = min(30 * 2 ** (attempts - 1), MAX_BACKOFF_SECONDS)
+    ReviewSummaryJob.objects.filter(pk=job.pk).update(
+        attempts=attempts,
+        last_error=str(error)[:2000],
+        locked_until=None,
+        run_after=timezone.now() + timedelta(seconds=delay),
+    )
+
+
+def stats():
+    now = timezone.now()
+    qs = ReviewSummaryJob.objects.all()
+    return {
+        "pending": qs.count(),
+        "due": qs.filter(run_after__lte=now).count(),
+        "leased": qs.filter(locked_until__gte=now).count(),
+        "failing": qs.filter(attempts__gt=0).count(),
+    }
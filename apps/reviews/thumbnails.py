@@ -0,0 +1,115 @@
+"""
+리뷰 사진 썸네일 생성 (요청 밖, 프로세스 내 스레드 풀).
+
+원본 review_photos/abc.jpg 옆에 크기별 WebP/JPEG 파생본을 저장한다.
+  review_photos/abc.thumb.webp, abc.thumb.jpg  (목록용, 긴 변 THUMB px)
+  review_photos/abc.large.webp, abc.large.jpg  (확대 보기용, 긴 변 LARGE px)
+다 만들면 ReviewPhoto.thumbs_ready=True. 그 전까지 템플릿은 원본을 쓴다.
+프로세스가 중간에 죽어 못 만든 사진은 build_review_thumbnails 명령으로 다시 만든다.
+ReviewPhoto 행이 지워지면(직접/댓글 연쇄 삭제) 커밋 후 원본과 파생본 파일도 지운다 (delete_photo_files).
+"""
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import close_old_connections, transaction
+
+VARIANTS = {"thumb": 320, "large": 1280}
+FORMATS = (
+    ("webp", "WEBP", {"quality": 80, "method": 4}),
+    ("jpg", "JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+)
+
+_lock = threading.Lock()
+_pool = None
+
+
+def variant_name(name, variant, ext):
+    base, _ = os.path.splitext(name)
+    return f"{base}.{variant}.{ext}"
+
+
+def variant_names(name):
+    """원본 이름 → 모든 파생본 이름"""
+    return [variant_name(name, variant, ext) for variant in VARIANTS for ext, _, _ in FORMATS]
+
+
+def delete_photo_files(sender, instance, **kwargs):
+    """post_delete 수신: 커밋 후 원본과 파생본 파일 삭제 (롤백되면 파일 유지)"""
+    if not instance.image:
+        return
+    storage, name = instance.image.storage, instance.image.name
+
+    def run():
+        for n in [name, *variant_names(name)]:
+            try:
+                storage.delete(n)
+            except Exception as e:
+                print(f"[warn] review photo file delete failed ({n}): {e}")
+
+    transaction.on_commit(run)
+
+
+def _encode(img, fmt, options):
+    buf = io.BytesIO()
+    img.save(buf, fmt, **options)
+    return buf.getvalue()
+
+
+def generate(photo):
+    """사진 1장의 모든 파생본 생성 후 thumbs_ready 표시"""
+    from PIL import Image, ImageOps
+    from .models import ReviewPhoto
+
+    storage = photo.image.storage
+    with storage.open(photo.image.name, "rb") as f:
+        img = Image.open(f)
+        img.draft("RGB", (VARIANTS["large"], VARIANTS["large"]))  # JPEG는 디코딩 단계에서 축소
+        img = ImageOps.exif_transpose(img)
+        img = img.convert("RGB")
+
+    for variant, size in sorted(VARIANTS.items(), key=lambda kv: -kv[1]):
+        img.thumbnail((size, size), Image.LANCZOS)  # 큰 것부터 줄여 나감 (원본은 한 번만 디코딩)
+        for ext, fmt, options in FORMATS:
+            name = variant_name(photo.image.name, variant, ext)
+            if storage.exists(name):
+                storage.delete(name)
+            storage.save(name, ContentFile(_encode(img, fmt, options)))
+
+    ReviewPhoto.objects.filter(pk=photo.pk).update(thumbs_ready=True)
+
+
+def _run(photo_ids):
+    from .models import ReviewPhoto
+
+    try:
+        for photo in ReviewPhoto.objects.filter(pk__in=photo_ids, thumbs_ready=False):
+            if not photo.image:
+                continue
+            try:
+                generate(photo)
+            except Exception as e:
+                print(f"[warn] thumbnail failed for review photo {photo.pk}: {e}")
+    finally:
+        close_old_connections()
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(
+                    max_workers=settings.REVIEW_THUMB_WORKERS, thread_name_prefix="review-thumb"
+                )
+    return _pool
+
+
+def schedule(photo_ids):
+    """커밋 후 스레드 풀에서 생성 (요청은 기다리지 않음)"""
+    photo_ids = list(photo_ids)
+    if photo_ids:
+        transaction.on_commit(lambda: _get_pool().submit(_run, photo_ids))
@@ -0,0 +1,208 @@
+"""
+리뷰 사진 업로드 스트리밍 처리.
+
+기본 업로드 핸들러는 파일을 메모리(2.5MB 이하)나 임시 파일에 통째로 받은 뒤,
+ReviewPhoto 저장 때 저장소로 한 번 더 복사한다. ReviewPhotoUploadHandler 는 'photos' 필드 파일을
+청크가 도착하는 대로 MEDIA_ROOT/review_photos/ 에 바로 쓴다 (메모리에는 청크 하나만).
+첫 청크의 매직 바이트가 이미지가 아니면 그 자리에서 기록을 멈추고, 다 받은 뒤에는
+Pillow 로 헤더만 읽어(픽셀 디코딩 없음) 형식과 해상도를 확인한다.
+로컬 파일 저장소가 아니면 비활성화되고 기본 핸들러가 받는다 (검사는 같은 함수로).
+"""
+import os
+import uuid
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopFutureHandlers
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
+
+from .models import ReviewPhoto
+
+FIELD_NAME = "photos"
+UPLOAD_DIR = "review_photos"
+ALLOWED_FORMATS = {"JPEG": ".jpg", "PNG": ".png", "GIF": ".gif", "WEBP": ".webp"}
+MAX_PIXELS = 50_000_000  # 압축 폭탄 방지 (가로x세로)
+
+_MAGIC = (
+    (b"\xff\xd8\xff", "JPEG"),
+    (b"\x89PNG\r\n\x1a\n", "PNG"),
+    (b"GIF87a", "GIF"),
+    (b"GIF89a", "GIF"),
+)
+
+
+def sniff_format(head):
+    for magic, fmt in _MAGIC:
+        if head.startswith(magic):
+            return fmt
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "WEBP"
+    return None
+
+
+def validate_image_header(fileobj):
+    """이미지 형식 이름 반환, 허용되지 않으면 ValueError (헤더만 파싱)"""
+    from PIL import Image, UnidentifiedImageError
+
+    fileobj.seek(0)
+    if sniff_format(fileobj.read(16)) is None:
+        raise ValueError("지원하지 않는 이미지 형식입니다.")
+    fileobj.seek(0)
+    try:
+        img = Image.open(fileobj)  # 지연 로딩: 픽셀은 읽지 않음
+        fmt, (width, height) = img.format, img.size
+    except (UnidentifiedImageError, OSError) as e:
+        raise ValueError("이미지를 읽을 수 없습니다.") from e
+    finally:
+        fileobj.seek(0)
+    if fmt not in ALLOWED_FORMATS:
+        raise ValueError("지원하지 않는 이미지 형식입니다.")
+    if width * height > MAX_PIXELS:
+        raise ValueError("이미지 해상도가 너무 큽니다.")
+    return fmt
+
+
+class StoredPhoto(UploadedFile):
+    """핸들러가 저장소에 이미 기록한 사진 (stored_name: 저장소 경로). error 가 있으면 거부된 파일"""
+
+    def __init__(self, stored_name, name, size, content_type, error=None):
+        super().__init__(file=None, name=name, content_type=content_type, size=size)
+        self.stored_name = stored_name
+        self.error = error
+
+
+def _local_root():
+    try:
+        return default_storage.path("")
+    except NotImplementedError:
+        return None
+
+
+class ReviewPhotoUploadHandler(FileUploadHandler):
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.root = _local_root()
+        self.stored = []  # 이번 요청에서 기록한 저장소 경로 (쓰이지 않으면 뷰가 정리)
+        self._fh = None
+
+    def _temp_path(self):
+        return os.path.join(self.root, self.temp_name)
+
+    def new_file(self, field_name, file_name, content_type, content_length, charset=None, content_type_extra=None):
+        super().new_file(field_name, file_name, content_type, content_length, charset, content_type_extra)
+        self._fh = None
+        if field_name != FIELD_NAME or self.root is None:
+            return  # 다음 핸들러가 처리
+        self.size = 0
+        self.error = None
+        self.temp_name = f"{UPLOAD_DIR}/.upload-{uuid.uuid4().hex}"
+        os.makedirs(os.path.dirname(self._temp_path()), exist_ok=True)
+        self._fh = open(self._temp_path(), "wb")
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        if self._fh is None:
+            return raw_data
+        if self.error is None:
+            if start == 0 and sniff_format(raw_data[:16]) is None:
+                self.error = "지원하지 않는 이미지 형식입니다."
+            elif self.size + len(raw_data) > settings.REVIEW_PHOTO_MAX_BYTES:
+                self.error = f"사진은 한 장당 {settings.REVIEW_PHOTO_MAX_BYTES // (1024 * 1024)}MB 이하만 올릴 수 있습니다."
+            else:
+                self._fh.write(raw_data)
+        self.size += len(raw_data)
+        return None
+
+    def file_complete(self, file_size):
+        if self._fh is None:
+            return None
+        self._fh.close()
+        self._fh = None
+
+        stored_name = None
+        if self.error is None:
+            try:
+                with open(self._temp_path(), "rb") as f:
+                    fmt = validate_image_header(f)
+                stored_name = default_storage.get_available_name(
+                    f"{UPLOAD_DIR}/{uuid.uuid4().hex}{ALLOWED_FORMATS[fmt]}"
+                )
+                os.replace(self._temp_path(), os.path.join(self.root, stored_name))
+                self.stored.append(stored_name)
+            except ValueError as e:
+                self.error = str(e)
+        if stored_name is None:
+            self._discard_temp()
+        return StoredPhoto(stored_name, self.file_name, file_size, self.content_type, self.error)
+
+    def _discard_temp(self):
+        try:
+            os.remove(self._temp_path())
+        except OSError:
+            pass
+
+    def upload_interrupted(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            self._discard_temp()
+
+
+def check_photos(files):
+    """거부 사유 목록 (스트리밍으로 받은 파일은 이미 검사됨)"""
+    errors = []
+    for f in files:
+        if isinstance(f, StoredPhoto):
+            error = f.error
+        else:
+            try:
+                validate_image_header(f)
+                error = None
+            except ValueError as e:
+                error = str(e)
+        if error:
+            errors.append(f"{f.name}: {error}")
+    return errors
+
+
+def build_photos(review, files):
+    """bulk_create 할 ReviewPhoto 목록 (스트리밍 파일은 경로만 연결, 나머지는 저장 시 기록)"""
+    return [
+        ReviewPhoto(review=review, image=f.stored_name if isinstance(f, StoredPhoto) else f)
+        for f in files
+    ]
+
+
+class StreamingPhotoUploadMixin:
+    """
+    photos 를 ReviewPhotoUploadHandler 로 받는 뷰 믹스인.
+    CsrfViewMiddleware 가 request.POST 를 먼저 읽으면 핸들러를 바꿀 수 없으므로
+    미들웨어 검사는 건너뛰고 핸들러 설치 후 csrf_protect 로 같은 검사를 한다.
+    응답 후 저장됐지만 ReviewPhoto 에 연결되지 않은 파일(폼 오류, 롤백)은 지운다.
+    LoginRequiredMixin/UserPassesTestMixin 뒤에 둘 것 (권한이 없는 요청은 본문을 받기 전에 거절).
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # 앞선 인증 믹스인의 dispatch 가 먼저 불리므로 csrf_exempt 는 뷰 함수에 직접 표시
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    def dispatch(self, request, *args, **kwargs):
+        handler = None
+        self.used_photo_names = set()
+        if request.method == "POST":
+            handler = ReviewPhotoUploadHandler(request)
+            request.upload_handlers.insert(0, handler)
+        try:
+            return csrf_protect(super().dispatch)(request, *args, **kwargs)
+        finally:
+            if handler is not None:
+                for name in set(handler.stored) - self.used_photo_names:
+                    default_storage.delete(name)
+
+    def get_photo_files(self):
+        return [f for f in self.request.FILES.getlist(FIELD_NAME) if f]
+
+    def mark_photos_saved(self, photos):
+        self.used_photo_names.update(p.image.name for p in photos)
@@ -1,112 +1,32 @@
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse
+from django.http import HttpResponseRedirect, JsonResponse
 from django.shortcuts import get_object_or_404, render
 from django.urls import reverse
 from django.views.generic import CreateView, UpdateView
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.db import transaction
 
-import re
-import requests
-from django.http import JsonResponse, Http404
-from django.conf import settings
+from django.http import Http404
 
 
 from .models import Review, ReviewPhoto
 from .forms import ReviewForm
+from .blog_cache import get_blog_items
+from . import summary_queue, thumbnails
+from .uploads import StreamingPhotoUploadMixin, build_photos, check_photos
 from apps.places.models import Place
 
-BLACKLIST_SUBSTR = (
-    "smartstore.naver.com", "shopping.naver.com", "brand.naver.com",
-    "/product/", "/category/", "/ads", "/event", "news.naver.com"
-)
-
-
-def _is_allowed_link(link: str) -> bool:
-    url = (link or "").lower()
-    if any(b in url for b in BLACKLIST_SUBSTR):
-        return False
-    # 대표 블로그 도메인들 (넓게 허용)
-    return any(d in url for d in (
-        "blog.naver.com", "m.blog.naver.com",
-        "post.naver.com", "naver.me",
-        "tistory.com", "brunch.co.kr", "velog.io"
-    ))
-
-def _loose_contains(text: str, place_name: str) -> bool:
-    # 괄호/공백/특수문자 제거 후 포함 여부
-    def norm(s): return re.sub(r"[\s\(\)\[\]\{\}\-_/·•~!@#$%^&*=+|:;\"'<>?,.]+", "", s or "")
-    t = norm(text)
-    n = norm(place_name)
-    # 이름이 너무 짧으면(2자 이하) 오탐 많으니 패스
-    if len(n) <= 2:
-        return n in t and len(t) > 10
-    # 이름 그대로 또는 괄호 제거 버전 일부라도 포함
-    return (n in t) or (n[: max(3, len(n)//2)] in t)
-
 def blog_reviews(request, place_id: int):
-    try:
-        place = Place.objects.get(id=place_id)
-    except Place.DoesNotExist:
-        raise Http404("Place not found")
-
-    city = getattr(place, "city", "") or getattr(place, "region", "") or ""
-    # 폴백 쿼리 세트 (점점 완화)
-    queries = [
-        f"\"{place.name}\" {city} 후기",
-        f"{place.name} {city} 후기",
-        f"{place.name} 후기",
-        f"{place.name} 여행기",
-        f"{place.name} 방문기",
-    ]
-
-    collected = []
-    headers = {
-        "X-Naver-Client-Id": settings.NAVER_CLIENT_ID,
-        "X-Naver-Client-Secret": settings.NAVER_CLIENT_SECRET,
-    }
-    url = "https://openapi.naver.com/v1/search/blog.json"
-
-    for q in queries:
-        params = {"query": q, "display": 30, "start": 1, "sort": "sim"}  # 정확도 우선
-        try:
-            r = requests.get(url, params=params, headers=headers, timeout=5)
-            r.raise_for_status()
-            items = r.json().get("items", [])
-        except requests.RequestException:
-            continue
-
-        for it in items:
-            title = it.get("title", "")
-            desc = it.get("description", "")
-            link = it.get("link", "")
-
-            if not _is_allowed_link(link):
-                continue
-            if not _loose_contains(title + " " + desc, place.name):
-                continue
-
-            collected.append({
-                "title": title, "link": link,
-                "summary": desc,
-                "blogger": it.get("bloggername", ""),
-                "postdate": it.get("postdate", ""),
-            })
-
-        # 충분히 모이면 종료
-        if len(collected) >= 10:
-            break
-
-    # 링크 기준 중복 제거
-    seen, dedup = set(), []
-    for x in collected:
-        if x["link"] in seen:
-            continue
-        seen.add(x["link"])
-        dedup.append(x)
-
-    return JsonResponse({"items": dedup[:10]})
-
-class PlaceReviewCreateView(LoginRequiredMixin, CreateView):
+    def load_place():
+        place = Place.objects.filter(id=place_id).values("name", "region").first()
+        if place is None:
+            raise Http404("Place not found")
+        return place["name"], place["region"] or ""
+
+    # 캐시가 신선하면 DB/외부 API 호출 없이 응답 (stale 이면 응답 후 백그라운드 갱신)
+    return JsonResponse({"items": get_blog_items(place_id, load_place)})
+
+class PlaceReviewCreateView(LoginRequiredMixin, StreamingPhotoUploadMixin, CreateView):
     model = Review
     form_class = ReviewForm
     template_name = 'reviews/place_review_form.html'
@@ -115,16 +35,25 @@ class PlaceReviewCreateView(LoginRequiredMixin, CreateView):
         form.instance.user = self.request.user
         form.instance.place_id = self.kwargs.get('place_id')
         
-        # 댓글 저장
-        review = form.save()
+        # 여러 이미지 파일 (HTML form에서 name="photos"로 전송됨, 업로드 중 이미 저장소에 기록/헤더 검사됨)
+        photo_files = self.get_photo_files()
+        errors = check_photos(photo_files)
+        if errors:
+            for error in errors:
+                form.add_error(None, error)
+            return self.form_invalid(form)
+        
+        # 댓글 + 사진 행을 한 트랜잭션으로 저장
+        with transaction.atomic():
+            review = self.object = form.save()
+            photos = ReviewPhoto.objects.bulk_create(build_photos(review, photo_files))
+        self.mark_photos_saved(photos)
+        thumbnails.schedule(p.id for p in photos)  # 썸네일은 응답 후 백그라운드에서 생성
         
-        # 여러 이미지 파일 처리 (HTML form에서 name="photos"로 전송됨)
-        photo_files = self.request.FILES.getlist('photos')
-        for photo_file in photo_files:
-            if photo_file:
-                ReviewPhoto.objects.create(review=review, image=photo_file)
+        # 장소 요약/태그 갱신 작업 적재 (review_compare --worker 가 디바운스 후 증분 처리)
+        summary_queue.enqueue(review.place_id)
         
-        return super().form_valid(form)
+        return HttpResponseRedirect(self.get_success_url())
 
     def get_success_url(self):
         return reverse('places:place_detail', kwargs={'pk': self.kwargs.get('place_id')})
@@ -135,7 +64,7 @@ class PlaceReviewCreateView(LoginRequiredMixin, CreateView):
         
         return context
 
-class PlaceReviewUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class PlaceReviewUpdateView(LoginRequiredMixin, UserPassesTestMixin, StreamingPhotoUploadMixin, UpdateView):
     model = Review
     form_class = ReviewForm
     template_name = 'reviews/place_review_form.html'
@@ -145,21 +74,28 @@ class PlaceReviewUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView)
         return review.user == self.request.user
     
     def form_valid(self, form):
-        # 댓글 저장
-        review = form.save()
+        # 새 이미지 파일 (업로드 중 이미 저장소에 기록/헤더 검사됨)
+        photo_files = self.get_photo_files()
+        errors = check_photos(photo_files)
+        if errors:
+            for error in errors:
+                form.add_error(None, error)
+            return self.form_invalid(form)
         
-        # 삭제할 이미지 처리
+        # 댓글 저장 + 사진 삭제/추가를 한 트랜잭션으로
         delete_photo_ids = self.request.POST.getlist('delete_photo_ids')
-        if delete_photo_ids:
-            ReviewPhoto.objects.filter(id__in=delete_photo_ids, review=review).delete()
+        with transaction.atomic():
+            review = self.object = form.save()
+            if delete_photo_ids:
+                ReviewPhoto.objects.filter(id__in=delete_photo_ids, review=review).delete()
+            photos = ReviewPhoto.objects.bulk_create(build_photos(review, photo_files))
+        self.mark_photos_saved(photos)
+        thumbnails.schedule(p.id for p in photos)
         
-        # 새 이미지 파일 처리
-        photo_files = self.request.FILES.getlist('photos')
-        for photo_file in photo_files:
-            if photo_file:
-                ReviewPhoto.objects.create(review=review, image=photo_file)
+        # 기존 댓글이 바뀌었으므로 전체 재요약
+        summary_queue.enqueue(review.place_id, full=True)
         
-        return super().form_valid(form)
+        return HttpResponseRedirect(self.get_success_url())
 
     def get_success_url(self):
         # 마이페이지에서 온 경우 마이페이지로 리다이렉션
@@ -213,6 +149,7 @@ def delete_review_ajax(request, place_id, review_id):
         try:
             review = get_object_or_404(Review, pk=review_id, user=request.user)
             review.delete()
+            summary_queue.enqueue(review.place_id, full=True)
             return JsonResponse({'success': True, 'message': '댓글이 삭제되었습니다.'})
         except Exception as e:
             return JsonResponse({'success': False, 'message': f'삭제 중 오류가 발생했습니다: {str(e)}'})
@@ -225,6 +162,7 @@ def delete_review(request, place_id, review_id):
     if request.method == 'POST':
         review = get_object_or_404(Review, pk=review_id, user=request.user)
         review.delete()
+        summary_queue.enqueue(review.place_id, full=True)
         from django.shortcuts import redirect
         return redirect('/users/mypage/?tab=reviews')
     
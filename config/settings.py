@@ -337,3 +337,41 @@ ACCOUNT_DEFAULT_HTTP_PROTOCOL = "https"
 ACCOUNT_FORMS = {
     "signup": "apps.users.forms.EmailSignupForm",
 }
+
+# 추천 결과 저장소: 같은 (prompt, followup)은 이 시간(초) 동안 LLM 재호출 없이 재사용
+RECO_RESULT_TTL = int(os.getenv("RECO_RESULT_TTL", "86400"))
+
+# 캐시: REDIS_URL 이 있으면 Redis (gunicorn 워커/관리 명령/리뷰 워커가 같은 캐시를 봄, 운영 기본값).
+# 없으면 프로세스 로컬 메모리 (개발용: 목록 버전/찜 목록 무효화가 다른 프로세스에 전달되지 않음)
+REDIS_URL = os.getenv("REDIS_URL", "")
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND",
+            "django.core.cache.backends.redis.RedisCache" if REDIS_URL
+            else "django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", REDIS_URL or "triptailor"),
+    }
+}
+
+# 비로그인 장소 목록 페이지 캐시 시간(초)
+PLACE_LIST_CACHE_TTL = int(os.getenv("PLACE_LIST_CACHE_TTL", "300"))
+
+# 장소 목록 전체 개수(페이지 번호 UI용 근사치) 캐시 시간(초)
+PLACE_LIST_COUNT_TTL = int(os.getenv("PLACE_LIST_COUNT_TTL", "600"))
+
+# 장소별 네이버 블로그 후기 캐시: 신선 기간(초) / 이후 stale 로 응답하며 백그라운드 갱신하는 기간(초)
+BLOG_CACHE_TTL = int(os.getenv("BLOG_CACHE_TTL", str(60 * 60 * 6)))
+BLOG_CACHE_STALE_TTL = int(os.getenv("BLOG_CACHE_STALE_TTL", str(60 * 60 * 24 * 7)))
+# 결과가 비었을 때의 신선 기간(초)
+BLOG_CACHE_EMPTY_TTL = int(os.getenv("BLOG_CACHE_EMPTY_TTL", str(60 * 60)))
+
+# 댓글 변경 → 장소 요약 갱신 디바운스(초): 마지막 변경 후 대기 / 첫 변경 후 최대 대기 (review_compare --worker)
+REVIEW_SUMMARY_DEBOUNCE = float(os.getenv("REVIEW_SUMMARY_DEBOUNCE", "60"))
+REVIEW_SUMMARY_DEBOUNCE_MAX = float(os.getenv("REVIEW_SUMMARY_DEBOUNCE_MAX", "600"))
+
+# 리뷰 사진 썸네일 생성 스레드 수 (프로세스당)
+REVIEW_THUMB_WORKERS = int(os.getenv("REVIEW_THUMB_WORKERS", "2"))
+# 리뷰 사진 한 장 최대 크기(바이트) — nginx client_max_body_size(25M) 보다 작게
+REVIEW_PHOTO_MAX_BYTES = int(os.getenv("REVIEW_PHOTO_MAX_BYTES", str(20 * 1024 * 1024)))
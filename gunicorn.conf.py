@@ -0,0 +1,31 @@
+# gunicorn 설정 (Dockerfile CMD: gunicorn config.wsgi:application -c gunicorn.conf.py)
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", "3"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+
+# 마스터에서 앱을 미리 로드하고 fork → 워커들이 임포트된 모듈/컴파일된 그래프를 copy-on-write로 공유
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() in ("1", "true", "yes")
+
+
+def on_starting(server):
+    # 프로세스 로컬 캐시로 워커를 여럿 띄우면 목록 버전/찜 목록 무효화가 워커 간에 전달되지 않음
+    # (preload 여부와 무관하게 django.setup 전에 실행되므로 모델을 임포트하지 않고 설정만 읽음)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    from django.conf import settings
+
+    backend = settings.CACHES["default"]["BACKEND"]
+    if workers > 1 and backend.endswith((".LocMemCache", ".DummyCache")):
+        raise RuntimeError(
+            f"gunicorn 워커 {workers}개에 프로세스 로컬 캐시(LocMem)는 쓸 수 없습니다. "
+            "REDIS_URL(또는 CACHE_BACKEND/CACHE_LOCATION)을 설정하거나 GUNICORN_WORKERS=1 로 실행하세요."
+        )
+
+
+def when_ready(server):
+    # 워커 생성 직전(마스터): recommend 의 무거운 모듈 임포트 + StateGraph 컴파일
+    # (LLM 클라이언트는 fork 이후 워커별로 생성됨)
+    if preload_app:
+        import recommend
+        recommend.preload()
@@ -1,19 +1,24 @@
 import os
 import json
+import threading
 import requests
 import uuid
-import numpy as np
-import faiss
-import pandas as pd
 from typing import List, TypedDict
 from dotenv import load_dotenv
 
-from langchain_core.runnables import RunnableLambda
-from langchain_core.prompts import PromptTemplate
-from langchain_naver import ChatClovaX
-from langgraph.graph import StateGraph
+# 환경 변수 로드
+load_dotenv()
+
+# ===== 지연 초기화 리소스 =====
+# faiss/numpy/langchain/langgraph 는 import 비용이 커서 처음 쓸 때 임포트한다.
+# (manage.py 명령, gunicorn 워커 기동 시 비용 제거. gunicorn --preload 면 preload()로 마스터에서 미리 생성)
+# LLM 클라이언트/프롬프트는 apps.places.llm_clients 레지스트리를 공유한다
+# (프로세스(pid)별 클라이언트라 fork 이후 워커가 부모의 HTTP 커넥션을 공유하지 않음).
+_lock = threading.RLock()
+_chains = None
+_app = None
 
-# FAISS 인덱스 및 메타데이터 로드
+# FAISS 인덱스 및 메타데이터 로드 (메타데이터는 build_faiss_meta로 만든 mmap 파일)
 _index = None
 _metadata = None
 
@@ -21,20 +26,30 @@ def _load_faiss_and_meta():
     global _index, _metadata
     if _index is not None and _metadata is not None:
         return _index, _metadata
-    try:
-        import faiss, pandas as pd
-        _index = faiss.read_index(os.getenv("FAISS_INDEX_PATH", "triptailor_cosine_v2.index"))
-        _metadata = pd.read_csv(os.getenv("FAISS_META_PATH", "triptailor_full_metadata.csv")).fillna("")
-        return _index, _metadata
-    except Exception as e:
-        print(f"[warn] FAISS/CSV load failed: {e}")
-        return None, None
+    with _lock:
+        if _index is not None and _metadata is not None:
+            return _index, _metadata
+        try:
+            import faiss
+            from apps.places import meta_store
+            _index = faiss.read_index(os.getenv("FAISS_INDEX_PATH", "triptailor_cosine_v2.index"))
+            _metadata = meta_store.load(
+                os.getenv("FAISS_META_BIN_PATH", "triptailor_full_metadata.bin"),
+                os.getenv("FAISS_META_PATH", "triptailor_full_metadata.csv"),
+            )
+            return _index, _metadata
+        except Exception as e:
+            print(f"[warn] FAISS/metadata load failed: {e}")
+            return None, None
 
 # DB 검색 도우미
-def search_top_k_from_db(qvec, k=20):
+def search_top_k_from_db(qvec, k=20, timeout_ms=None):
     # ← 함수 내부로 옮기기 (Django가 준비된 뒤 임포트)
+    from django.db import connection, transaction
+    from django.db.models import Value
+    from django.db.models.functions import Coalesce, NullIf
     from apps.places.models import Place
-    from apps.tags.models import Tag
+    from apps.places.descriptors import split_tag_names
     from pgvector.django import L2Distance, CosineDistance, MaxInnerProduct
 
     metric = os.getenv("PGVECTOR_METRIC", "l2")
@@ -45,31 +60,69 @@ def search_top_k_from_db(qvec, k=20):
     else:
         distance = L2Distance("embedding", qvec)
 
+    # 미리 계산한 설명자만 가져옴 (쿼리 1번, 태그 prefetch 없음). prompt_desc 가 아직 없으면 overview
     qs = (Place.objects.exclude(embedding=None)
-        .annotate(dist=distance)
+        .annotate(dist=distance, desc=Coalesce(NullIf("prompt_desc", Value("")), "overview", Value("")))
         .order_by("dist")
-        .prefetch_related("tags")[:k])
+        .values_list("name", "address", "desc", "tag_names")[:k])
+
+    # PostgreSQL이면 하드 타임아웃을 statement_timeout 으로 강제 (트랜잭션 안에서만 적용)
+    if timeout_ms and connection.vendor == "postgresql":
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL statement_timeout = %s", [int(timeout_ms)])
+            places = list(qs)
+    else:
+        places = list(qs)
 
     return [{
-        "명칭": p.name,
-        "주소": p.address or "",
-        "개요": p.overview or "",
-        "tags": [t.name for t in p.tags.all()],
-    } for p in qs]
+        "명칭": name,
+        "주소": address or "",
+        "개요": desc or "",
+        "요약": desc or "",
+        "tags": split_tag_names(tag_names),
+    } for name, address, desc, tag_names in places]
+
+
+def search_top_k_from_faiss(qvec, k=20, timeout_ms=None):
+    index, metadata = _load_faiss_and_meta()
+    if index is None or metadata is None:
+        raise RuntimeError("FAISS 리소스가 없습니다.")
+    import numpy as np
+    emb_np = np.ascontiguousarray([qvec], dtype=np.float32)
+    D, I = index.search(emb_np, k=k)
+    return metadata.rows(I[0].tolist())
+
+
+# 검색 라우터: DB(지연 예산 + 서킷 브레이커) → FAISS
+_router = None
+
+def get_router():
+    global _router
+    if _router is None:
+        with _lock:
+            if _router is None:
+                from apps.places.retrieval import Backend, CircuitBreaker, RetrievalRouter
+                _router = RetrievalRouter([
+                    Backend(
+                        "db", search_top_k_from_db,
+                        budget_ms=int(os.getenv("RETRIEVAL_DB_BUDGET_MS", "1500")),
+                        # 예산(소프트)을 넘긴 쿼리도 결과는 쓰고 브레이커에만 반영. 이 시간(하드)을 넘기면 중단 (0이면 무제한)
+                        timeout_ms=int(os.getenv("RETRIEVAL_DB_TIMEOUT_MS", "10000")) or None,
+                        breaker=CircuitBreaker(
+                            "db",
+                            threshold=int(os.getenv("RETRIEVAL_BREAKER_THRESHOLD", "3")),
+                            cooldown=float(os.getenv("RETRIEVAL_BREAKER_COOLDOWN", "30")),
+                        ),
+                    ),
+                    Backend("faiss", search_top_k_from_faiss,
+                            budget_ms=int(os.getenv("RETRIEVAL_FAISS_BUDGET_MS", "200"))),
+                ])
+    return _router
 
 
-# 환경 변수 로드
-load_dotenv()
-
-# LLM 설정
-llm = ChatClovaX(
-    model="HCX-005",
-    temperature=0,
-)
-
 # 정보 추출 프롬프트
-extraction_prompt = PromptTemplate.from_template(
-    """
+EXTRACTION_TEMPLATE = """
     다음 사용자의 문장에서 여행 관련 정보를 JSON으로 추출해줘.
     문장: "{input}"
 
@@ -89,12 +142,9 @@ extraction_prompt = PromptTemplate.from_template(
     "보충 질문": "..."
     }}
     """
-)
 
 # 추천 프롬프트
-# 추천 프롬프트
-recommendation_prompt = PromptTemplate.from_template(
-    """
+RECOMMENDATION_TEMPLATE = """
     아래 '여행지 리스트' 중에서만 고르고, 사용자 조건에 맞는 여행지 **정확히 6곳**을 추천하라.
     리스트에 없는 장소명은 절대 쓰지 마라.
 
@@ -139,14 +189,30 @@ recommendation_prompt = PromptTemplate.from_template(
     # 여행지 리스트
     {trip_spot_list}
     """
-)
 
 
+def get_llm():
+    """ClovaX 클라이언트 (프로세스별 1개, 공용 레지스트리)"""
+    from apps.places import llm_clients
+    return llm_clients.chat_model("HCX-005", 0)
+
 
+def _get_prompts():
+    """PromptTemplate (상태 없음 → fork 후에도 공유)"""
+    from apps.places import llm_clients
+    return llm_clients.prompt(EXTRACTION_TEMPLATE), llm_clients.prompt(RECOMMENDATION_TEMPLATE)
 
 
-extraction_chain = extraction_prompt | llm
-recommendation_chain = recommendation_prompt | llm
+def get_chains():
+    """(extraction_chain, recommendation_chain) — 현재 프로세스의 LLM에 묶어서 생성"""
+    global _chains
+    llm = get_llm()
+    if _chains is None or _chains[0] is not llm:
+        with _lock:
+            if _chains is None or _chains[0] is not llm:
+                extraction_prompt, recommendation_prompt = _get_prompts()
+                _chains = (llm, extraction_prompt | llm, recommendation_prompt | llm)
+    return _chains[1], _chains[2]
 
 class GraphState(TypedDict, total=False):
     user_input: str
@@ -158,9 +224,16 @@ class GraphState(TypedDict, total=False):
     recommendations: List[str]
     추천_장소명: List[str]
     장소_태그맵: dict
+    need_followup: bool
+    후보: List[dict]
+    검색_백엔드: str
+    검색_오류: str
+    쿼리_임베딩: List[float]
+    캐시_적중: bool
 
 def get_clova_embedding(text: str, api_key: str) -> List[float]:
-    url = "https://clovastudio.stream.ntruss.com/v1/api-tools/embedding/v2"
+    from apps.places.llm_endpoints import clova_embedding_url
+    url = clova_embedding_url()
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
@@ -171,6 +244,7 @@ def get_clova_embedding(text: str, api_key: str) -> List[float]:
     return response.json()["result"]["embedding"]
 
 def extract_info(state: GraphState) -> GraphState:
+    extraction_chain, _ = get_chains()
     raw = extraction_chain.invoke({"input": state["user_input"]})
     response_text = getattr(raw, "content", str(raw))
     try:
@@ -187,8 +261,8 @@ def extract_info(state: GraphState) -> GraphState:
         parsed.get("감정", "없음") == "없음" or
         parsed.get("활동", "없음") == "없음"
     )
+    # retrieve 와 병렬 실행되므로 자기 키만 갱신 (같은 키를 두 노드가 쓰면 충돌)
     return {
-        **state,
         "지역": parsed.get("지역", ""),
         "감정": parsed.get("감정", ""),
         "활동": parsed.get("활동", ""),
@@ -196,40 +270,41 @@ def extract_info(state: GraphState) -> GraphState:
         "need_followup": need_followup
     }
 
-def recommend_places(state: GraphState) -> GraphState:
-    # 1) 쿼리 임베딩
-    embedding = get_clova_embedding(state["user_input"], os.getenv("CLOVASTUDIO_API_KEY"))
-    qvec = list(map(float, embedding))  # list[float]
-
-    # 2) DB에서 top-k 시도
+def retrieve_candidates(state: GraphState) -> GraphState:
+    """임베딩 + top-k 검색: user_input 에만 의존하므로 extract_info 와 동시에 실행"""
     try:
-        rows = search_top_k_from_db(qvec, k=10)
+        # 1) 쿼리 임베딩
+        embedding = get_clova_embedding(state["user_input"], os.getenv("CLOVASTUDIO_API_KEY"))
+        qvec = list(map(float, embedding))  # list[float]
+
+        # 2) top-k 검색 (DB 우선, 느리거나 실패가 반복되면 FAISS로 바로)
+        rows, backend = get_router().search(qvec, k=10)
     except Exception as e:
-        print(f"[warn] DB retrieval failed, fallback to FAISS: {e}")
-        rows = None
-
-    if rows is None:
-        index, metadata = _load_faiss_and_meta()
-        if index is None or metadata is None:
-            raise RuntimeError("DB 검색 실패했고 FAISS 리소스도 없습니다.")
-        emb_np = np.ascontiguousarray([qvec], dtype=np.float32)
-        D, I = index.search(emb_np, k=10)
-        top_k = metadata.iloc[I[0]]
-        rows = [{
-            "명칭": str(row["명칭"]),
-            "주소": str(row["주소"]),
-            "개요": str(row["개요"]),
-            "tags": [str(row.get(c, "")).strip() for c in ["tag1","tag2","tag3","tag4","tag5"] if str(row.get(c, "")).strip()],
-        } for _, row in top_k.iterrows()]
-
-    # 4) LLM 입력 리스트 구성
-    trip_spot_list = "\n".join(
-        f"- {r['명칭']} ({r['주소']}): {r['개요']} [태그: {', '.join(r['tags'])}]"
-        for r in rows
-    )
+        # 보충 질문만 필요한 경우엔 검색 실패가 응답을 막지 않도록 오류는 recommend 에서 올림
+        return {"후보": [], "검색_백엔드": "", "검색_오류": str(e), "쿼리_임베딩": []}
+    finally:
+        # 병렬 브랜치는 invoke 마다 만들어지는 langgraph 스레드에서 돌고, 요청 종료 시그널로 정리되지 않음.
+        # close_old_connections 는 CONN_MAX_AGE 안이면 닫지 않으므로 이 스레드의 커넥션은 직접 닫는다
+        # (요청 스레드에서 직접 호출된 경우는 요청 커넥션을 재사용하도록 그대로 둠)
+        from django.db import connection
+        if threading.current_thread() is not threading.main_thread() and not connection.in_atomic_block:
+            connection.close()
+    return {"후보": rows, "검색_백엔드": backend, "검색_오류": "", "쿼리_임베딩": qvec}
+
+def recommend_places(state: GraphState) -> GraphState:
+    if state.get("검색_오류"):
+        raise RuntimeError(f"후보 검색 실패: {state['검색_오류']}")
+    rows = state.get("후보") or []
+
+    # 4) LLM 입력 리스트 구성 (설명은 토큰 예산 안으로 잘라서)
+    from apps.places.prompt_budget import build_trip_spot_list
+    trip_spot_list, prompt_stats = build_trip_spot_list(rows)
+    print(f"[prompt] trip_spot_list {prompt_stats['tokens']} tokens "
+          f"(원본 {prompt_stats['original_tokens']}, {prompt_stats['truncated']}/{prompt_stats['rows']}행 축약)")
 
     combined_tags = ", ".join(sorted({t for r in rows for t in r["tags"] if t}))
 
+    _, recommendation_chain = get_chains()
     rec = recommendation_chain.invoke({
         "trip_spot_list": trip_spot_list,
         "location": state["지역"],
@@ -262,36 +337,94 @@ def recommend_places(state: GraphState) -> GraphState:
     # 5) 태그 맵 (DB/FAISS 공통)
     place_info_map = {r["명칭"]: r["tags"] for r in rows}
 
-    return {
-        **state,
+    result = {
         "recommendations": raw_lines,
         "태그": combined_tags,
         "추천_장소명": recommended_places,
         "장소_태그맵": place_info_map
     }
+    if state.get("쿼리_임베딩"):
+        from apps.places import semantic_cache
+        semantic_cache.store(state["user_input"], state.get("지역", ""), state["쿼리_임베딩"], result)
+    return result
 
 
-# StateGraph에서 조건 분기 추가
-builder = StateGraph(GraphState)
-builder.add_node("extract_info", RunnableLambda(extract_info))
-builder.add_node("recommend", RunnableLambda(recommend_places))
-
-# 분기: 보충 질문이 필요하면 recommend로 가지 않음
+# 분기: 보충 질문이 필요하거나 의미 캐시에 적중하면 recommend로 가지 않음
 def should_recommend(state: GraphState):
-    return not state.get("need_followup", False)
-
-builder.set_entry_point("extract_info")
-builder.add_conditional_edges(
-    "extract_info",
-    should_recommend,
-    {
-        True: "recommend",
-        False: "extract_info"  # 보충 질문만 반환하고 종료
-    }
-)
-builder.set_finish_point("recommend")
-builder.set_finish_point("extract_info")
-app = builder.compile()
+    return not state.get("need_followup", False) and not state.get("캐시_적중", False)
+
+
+def join_branches(state: GraphState) -> GraphState:
+    """
+    extract_info / retrieve 두 갈래가 모두 끝난 뒤 분기하기 위한 합류 지점.
+    비슷한 질문(임베딩 유사도 + 같은 지역)의 추천이 캐시에 있으면 그 결과를 그대로 쓴다.
+    """
+    if state.get("need_followup") or not state.get("쿼리_임베딩"):
+        return {}
+    from apps.places import semantic_cache
+    cached = semantic_cache.lookup(state["user_input"], state.get("지역", ""), state["쿼리_임베딩"])
+    if cached is None:
+        return {}
+    return {**cached, "캐시_적중": True}
+
+
+def get_app():
+    """컴파일된 StateGraph (프로세스당 1회, --preload 시 마스터에서 만들어 워커가 copy-on-write 공유)"""
+    global _app
+    if _app is None:
+        with _lock:
+            if _app is None:
+                from langchain_core.runnables import RunnableLambda
+                from langgraph.graph import END, START, StateGraph
+
+                # 슬롯 추출(LLM)과 임베딩+검색은 서로 독립 → 병렬 브랜치로 실행하고 join 에서 합류
+                # (보충 질문이 필요한 요청은 검색 결과를 버리지만, 추천 요청마다 왕복 1회가 줄어듦)
+                builder = StateGraph(GraphState)
+                builder.add_node("extract_info", RunnableLambda(extract_info))
+                builder.add_node("retrieve", RunnableLambda(retrieve_candidates))
+                builder.add_node("join", RunnableLambda(join_branches))
+                builder.add_node("recommend", RunnableLambda(recommend_places))
+
+                builder.add_edge(START, "extract_info")
+                builder.add_edge(START, "retrieve")
+                builder.add_edge(["extract_info", "retrieve"], "join")
+                builder.add_conditional_edges(
+                    "join",
+                    should_recommend,
+                    {
+                        True: "recommend",
+                        False: END  # 보충 질문만 반환하고 종료
+                    }
+                )
+                builder.add_edge("recommend", END)
+                _app = builder.compile()
+    return _app
+
+
+def preload(faiss=None):
+    """
+    gunicorn --preload 용 훅: 무거운 모듈 임포트 + 그래프 컴파일을 마스터에서 미리 수행.
+    LLM 클라이언트는 만들지 않는다(워커마다 get_llm()이 새로 생성).
+    """
+    import langchain_naver  # noqa: F401  (모듈 메모리만 공유)
+    _get_prompts()
+    get_app()
+    if faiss is None:
+        faiss = os.getenv("RECOMMEND_PRELOAD_FAISS", "false").lower() in ("1", "true", "yes")
+    if faiss:
+        _load_faiss_and_meta()
+
+
+def __getattr__(name):
+    # 기존 코드 호환: recommend.app / recommend.llm 접근 시 지연 생성
+    if name == "app":
+        return get_app()
+    if name == "llm":
+        return get_llm()
+    if name in ("extraction_chain", "recommendation_chain"):
+        return get_chains()[0 if name == "extraction_chain" else 1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
     print("=== TripTailor 여행지 추천 시스템 ===")
@@ -310,7 +443,7 @@ if __name__ == "__main__":
 
             state = {"user_input": user_input}
             print("\n처리 중입니다...\n")
-            result = app.invoke(state)
+            result = get_app().invoke(state)
 
             if result.get("보충_질문"):
                 print("🤔 보충 질문:", result["보충_질문"])
@@ -318,7 +451,7 @@ if __name__ == "__main__":
                 full_input = result["user_input"] + " " + followup
                 state = {"user_input": full_input}
                 print("\n보완된 정보를 기반으로 다시 추천합니다...\n")
-                result = app.invoke(state)
+                result = get_app().invoke(state)
 
             print("📋 추출된 정보:")
             for key in ["지역", "감정", "활동"]:
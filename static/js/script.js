@@ -13,6 +13,41 @@
 
     // ---------- After DOM Ready ----------
     document.addEventListener('DOMContentLoaded', function () {
+        // ---------- 목록만 Ajax 교체 (목록 + 커서 페이지네이션) ----------
+        async function fetchAndSwapList(nextParams) {
+            const url = new URL(window.location.href);
+
+            // 기존 쿼리 초기화 후 새 파라미터 채우기
+            for (const k of Array.from(url.searchParams.keys())) url.searchParams.delete(k);
+            nextParams.forEach((v, k) => url.searchParams.set(k, v));
+
+            const listEl = document.querySelector('.place-list');
+            if (listEl) listEl.insertAdjacentHTML('beforebegin', '<div id="list-loading" style="padding:1rem">불러오는 중...</div>');
+
+            try {
+                const res = await fetch(url.toString(), { credentials: 'same-origin' });
+                const html = await res.text();
+                const doc = new DOMParser().parseFromString(html, 'text/html');
+                // #results 안에 목록과 페이지네이션이 함께 있으면 통째로 교체 (커서 링크 갱신)
+                const fetchedResults = doc.getElementById('results');
+                const currentResults = document.getElementById('results');
+                if (fetchedResults && currentResults) {
+                    currentResults.innerHTML = fetchedResults.innerHTML;
+                } else {
+                    const fetchedList = doc.querySelector('.place-list');
+                    const currentList = document.querySelector('.place-list');
+                    if (fetchedList && currentList) currentList.outerHTML = fetchedList.outerHTML;
+                }
+
+                history.pushState(null, '', url.toString());
+                if (window.google && typeof window.initMap === 'function') window.initMap();
+            } finally {
+                document.getElementById('list-loading')?.remove();
+            }
+        }
+
+        // (페이지네이션 링크는 tabbar.js 가 가로챔)
+
         // ===== TAGS: “더보기/접기 & Ajax 필터” (교체된 부분) =====
         (function initTagChipsAjax() {
             const rail = document.querySelector('.tag-rail');
@@ -49,32 +84,6 @@
             })();
 
 
-            // 목록만 Ajax 교체
-            async function fetchAndSwapList(nextParams) {
-                const url = new URL(window.location.href);
-
-                // 기존 쿼리 초기화 후 새 파라미터 채우기
-                for (const k of Array.from(url.searchParams.keys())) url.searchParams.delete(k);
-                nextParams.forEach((v, k) => url.searchParams.set(k, v));
-
-                const listEl = document.querySelector('.place-list');
-                if (listEl) listEl.insertAdjacentHTML('beforebegin', '<div id="list-loading" style="padding:1rem">불러오는 중...</div>');
-
-                try {
-                    const res = await fetch(url.toString(), { credentials: 'same-origin' });
-                    const html = await res.text();
-                    const doc = new DOMParser().parseFromString(html, 'text/html');
-                    const fetchedList = doc.querySelector('.place-list');
-                    const currentList = document.querySelector('.place-list');
-                    if (fetchedList && currentList) currentList.outerHTML = fetchedList.outerHTML;
-
-                    history.pushState(null, '', url.toString());
-                } finally {
-                    document.getElementById('list-loading')?.remove();
-                }
-            }
-
-
             // 칩 클릭 → URL 파라미터 갱신 → Ajax로 목록만 갱신
             track.addEventListener('click', async (e) => {
                 const chip = e.target.closest('.chip');
@@ -88,6 +97,9 @@
                 const next = new URLSearchParams(window.location.search);
                 if (selected.length) next.set('tags', selected.join(','));
                 else next.delete('tags');
+                // 필터가 바뀌면 첫 페이지부터 (이전 커서는 다른 목록 기준)
+                next.delete('cursor');
+                next.delete('page');
 
                 await fetchAndSwapList(next);
             });
@@ -12,8 +12,9 @@
   const currentParams  = () => new URLSearchParams(window.location.search);
 
   const buildUrl = (params) => {
-    // 필터 변경 시 page 초기화
+    // 필터 변경 시 page/cursor 초기화 (이전 필터의 커서 기준점으로 새 필터를 찾지 않도록)
     params.delete("page");
+    params.delete("cursor");
     const url = new URL(window.location.href);
     url.search = params.toString();
     return url.toString();